@@ -2,17 +2,35 @@ from flask import Flask, render_template
 import os
 from config import Config
 from models import DatabaseManager
-from controllers import auth_bp, interview_bp
+from controllers import auth_bp, interview_bp, metrics_bp
+from services.question_pool import QuestionPool
+from services.question_bank import QuestionBank
+from services.job_queue import JobQueue
+from services.result_retention import ResultRetention
 
 app = Flask(__name__)
 app.secret_key = Config.SECRET_KEY
 
-# Initialize database
-DatabaseManager.init_db()
+# Bring the database schema up to date
+if Config.DB_MIGRATE_ON_STARTUP:
+    DatabaseManager.init_db()
+
+# Load and index the static and fallback question sets
+QuestionBank.load()
+
+# Start filling the AI question pools in the background
+QuestionPool.start()
+
+# Start the submission job workers
+JobQueue.start()
+
+# Trim old results in the background instead of on every submit
+ResultRetention.start()
 
 # Register blueprints
 app.register_blueprint(auth_bp)
 app.register_blueprint(interview_bp)
+app.register_blueprint(metrics_bp)
 
 # Page routes
 @app.route('/')
@@ -0,0 +1,63 @@
+"""Shared reporting and baseline helpers for the benchmark suites"""
+import os
+import json
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def baseline_path(suite, name):
+    return os.path.join(BASELINE_DIR, f'{suite}-{name}.json')
+
+
+def save_baseline(suite, name, results, meta):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = baseline_path(suite, name)
+    with open(path, 'w') as f:
+        json.dump({'meta': meta, 'results': results}, f, indent=2, sort_keys=True)
+    return path
+
+
+def load_baseline(suite, name):
+    path = baseline_path(suite, name)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def compare(results, baseline, checks, tolerance):
+    """
+    Compare results against a baseline. checks maps a metric name to
+    'lower' or 'higher' (which direction is better). Returns a list of
+    human-readable regressions beyond the tolerance fraction
+    """
+    regressions = []
+    for case, metrics in results.items():
+        previous = baseline.get(case)
+        if previous is None:
+            continue
+        for metric, better in checks.items():
+            old, new = previous.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            if better == 'lower' and new > old * (1 + tolerance) and new - old > 1e-9:
+                regressions.append(f'{case}: {metric} {old:.4g} -> {new:.4g}')
+            elif better == 'higher' and new < old * (1 - tolerance):
+                regressions.append(f'{case}: {metric} {old:.4g} -> {new:.4g}')
+    return regressions
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(row[i])) for row in rows)) for i, h in enumerate(headers)]
+    print('  '.join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print('  '.join('-' * w for w in widths))
+    for row in rows:
+        print('  '.join(str(v).ljust(w) for v, w in zip(row, widths)))
@@ -0,0 +1,280 @@
+"""
+End-to-end load and latency benchmark for the interview flow.
+
+Drives the real Flask app over HTTP at a configurable concurrency:
+/api/questions, /api/submit-answers, /api/submit-voice-interview,
+/api/get-result/<id> and /api/profile/history. The LLM is the local mock
+from tools/mock_groq.py, started in-process; the database is whatever the
+DB_* variables point at, so use a disposable local Postgres:
+
+    docker run --rm -d -p 5433:5432 -e POSTGRES_PASSWORD=bench -e POSTGRES_DB=interviewace_bench postgres:16
+    DB_PORT=5433 DB_PASSWORD=bench DB_NAME=interviewace_bench python -m benchmarks.e2e --concurrency 16
+
+Reports p50/p95/p99 latency, throughput and error rate per endpoint.
+--save-baseline stores the run under benchmarks/baselines/; later runs
+are compared against it and exit with status 1 on a regression.
+"""
+import os
+import sys
+import time
+import uuid
+import random
+import logging
+import argparse
+import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import make_server
+
+from benchmarks.common import percentile, save_baseline, load_baseline, compare, print_table
+
+SUITE = 'e2e'
+ENDPOINTS = ['questions', 'submit-answers', 'submit-voice-interview', 'get-result', 'profile-history']
+CHECKS = {'p50_ms': 'lower', 'p95_ms': 'lower', 'throughput_rps': 'higher', 'error_rate': 'lower'}
+
+SAMPLE_ANSWERS = [
+    'I would start by measuring where the time goes, then add caching in front of the slowest reads '
+    'and make sure invalidation happens on every write path.',
+    'Use an index on the columns in the WHERE clause and check the query plan to confirm it is used.',
+    'Split the work into independent tasks and run them on a bounded thread pool so one slow call '
+    'does not hold up the others.',
+    'Write unit tests around the edge cases first, then an integration test that exercises the whole request.',
+    'I am not sure.',
+    'Add structured logging and metrics for latency and error rate, and alert on the p95.'
+]
+
+
+class Server:
+    """A WSGI app served on a background thread on an ephemeral port"""
+
+    def __init__(self, app, host='127.0.0.1', port=0):
+        self._server = make_server(host, port, app, threaded=True)
+        self.url = f'http://{host}:{self._server.server_port}'
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+
+
+def start_mock(args):
+    from tools.mock_groq import create_app, parse_args as mock_args
+    options = mock_args([
+        '--latency', args.llm_latency,
+        '--rate-429', str(args.llm_429_rate),
+        '--rate-5xx', str(args.llm_5xx_rate),
+        '--malformed-rate', str(args.llm_malformed_rate),
+        '--seed', str(args.seed)
+    ])
+    return Server(create_app(options)).start()
+
+
+def start_app(mock_url):
+    """Point the app at the mock, then import it (Config reads the environment at import)"""
+    os.environ['GROQ_API_URL'] = f'{mock_url}/openai/v1/chat/completions'
+    os.environ['GROQ_API_KEY'] = 'benchmark'
+    # Let the mock's injected failures, not the client-side budget, shape the run
+    os.environ.setdefault('GROQ_REQUESTS_PER_MINUTE', '1000000')
+    os.environ.setdefault('GROQ_TOKENS_PER_MINUTE', '1000000000')
+    # Background pool refills would compete with the measured requests
+    os.environ.setdefault('QUESTION_POOL_ENABLED', 'False')
+
+    from app import app
+    return Server(app).start()
+
+
+class Runner:
+    """Runs one endpoint's requests on a thread pool and records latencies"""
+
+    def __init__(self, base_url, concurrency):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self._local = threading.local()
+
+    def session(self):
+        import requests
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def call(self, method, path, body=None):
+        """One request; returns (latency seconds, ok, parsed JSON or None)"""
+        start = time.perf_counter()
+        try:
+            response = self.session().request(method, self.base_url + path, json=body, timeout=120)
+            latency = time.perf_counter() - start
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+            ok = response.status_code < 400 and not (isinstance(data, dict) and data.get('success') is False)
+            return latency, ok, data
+        except Exception:
+            return time.perf_counter() - start, False, None
+
+    def run(self, requests_):
+        """requests_ is a list of (method, path, body). Returns (stats, responses)"""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            outcomes = list(pool.map(lambda r: self.call(*r), requests_))
+        elapsed = time.perf_counter() - start
+
+        latencies = sorted(latency * 1000 for latency, _, _ in outcomes)
+        errors = sum(1 for _, ok, _ in outcomes if not ok)
+        stats = {
+            'requests': len(outcomes),
+            'errors': errors,
+            'error_rate': round(errors / len(outcomes), 4) if outcomes else 0.0,
+            'mean_ms': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2),
+            'throughput_rps': round(len(outcomes) / elapsed, 2) if elapsed else 0.0
+        }
+        return stats, [data for _, ok, data in outcomes if ok]
+
+
+def written_answers(questions, rng):
+    answers = []
+    for question in questions:
+        if question.get('type') == 'multiple-choice':
+            selected = rng.randrange(len(question.get('options', [])) or 4)
+            answers.append({'type': 'multiple-choice', 'selected': selected,
+                            'correct': selected == question.get('correctAnswer')})
+        else:
+            answers.append({'type': 'short-answer', 'text': rng.choice(SAMPLE_ANSWERS)})
+    return answers
+
+
+def voice_answers(questions, rng):
+    return [{'type': 'voice', 'text': rng.choice(SAMPLE_ANSWERS), 'audio': None} for _ in questions]
+
+
+def run_suite(runner, args):
+    rng = random.Random(args.seed)
+    query = f'role={args.role.replace(" ", "+")}&difficulty={args.difficulty}'
+    results = {}
+
+    # Setup, not measured: one guest per concurrent client
+    users = [f'guest_bench_{uuid.uuid4().hex[:12]}' for _ in range(args.concurrency)]
+    for user_id in users:
+        runner.call('POST', '/api/create-guest', {'user_id': user_id})
+
+    def measure(name, requests_):
+        if name not in args.endpoints:
+            return []
+        if args.warmup:
+            runner.run(requests_[:args.warmup])
+        stats, responses = runner.run(requests_)
+        results[name] = stats
+        return responses
+
+    responses = measure('questions', [('GET', f'/api/questions?{query}', None)] * args.requests)
+    questions = next((r['questions'] for r in responses if r and r.get('questions')), None)
+    if questions is None:
+        _, _, data = runner.call('GET', f'/api/questions?{query}')
+        questions = (data or {}).get('questions') or []
+
+    def submission(kind, answers_for):
+        return [('POST', f'/api/{kind}', {
+            'user_id': users[i % len(users)],
+            'role': args.role,
+            'difficulty': args.difficulty,
+            'questions': questions,
+            'answers': answers_for(questions, rng),
+            'use_ai': True
+        }) for i in range(args.requests)]
+
+    submitted = measure('submit-answers', submission('submit-answers', written_answers))
+    submitted += measure('submit-voice-interview', submission('submit-voice-interview', voice_answers))
+
+    result_ids = [r['id'] for r in submitted if r and r.get('id')]
+    if not result_ids and 'get-result' in args.endpoints:
+        _, _, data = runner.call('POST', '/api/submit-answers', submission('submit-answers', written_answers)[0][2])
+        result_ids = [data['id']] if data and data.get('id') else []
+    if result_ids:
+        measure('get-result', [('GET', f'/api/get-result/{result_ids[i % len(result_ids)]}', None)
+                               for i in range(args.requests)])
+
+    measure('profile-history', [('GET', f'/api/profile/history?user_id={users[i % len(users)]}', None)
+                                for i in range(args.requests)])
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='End-to-end load and latency benchmark for the interview flow')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent clients')
+    parser.add_argument('--requests', type=int, default=40, help='Measured requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=4, help='Unmeasured requests per endpoint before measuring')
+    parser.add_argument('--endpoints', nargs='+', choices=ENDPOINTS, default=ENDPOINTS)
+    parser.add_argument('--role', default='Software Engineer')
+    parser.add_argument('--difficulty', default='Intermediate')
+    parser.add_argument('--llm-latency', default='lognormal:-1.2,0.5',
+                        help='Mock LLM latency distribution (see tools/mock_groq.py)')
+    parser.add_argument('--llm-429-rate', type=float, default=0.0)
+    parser.add_argument('--llm-5xx-rate', type=float, default=0.0)
+    parser.add_argument('--llm-malformed-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--baseline', default='default', help='Baseline name to compare against or save as')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed fractional change before a metric counts as a regression')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    mock = start_mock(args)
+    server = start_app(mock.url)
+    print(f'App at {server.url}, mock LLM at {mock.url}')
+
+    try:
+        results = run_suite(Runner(server.url, args.concurrency), args)
+    finally:
+        server.stop()
+        mock.stop()
+
+    print()
+    print_table(
+        ['endpoint', 'requests', 'errors', 'p50 ms', 'p95 ms', 'p99 ms', 'req/s'],
+        [[name, s['requests'], s['errors'], s['p50_ms'], s['p95_ms'], s['p99_ms'], s['throughput_rps']]
+         for name, s in results.items()]
+    )
+
+    meta = {
+        'concurrency': args.concurrency,
+        'requests': args.requests,
+        'llm_latency': args.llm_latency,
+        'llm_429_rate': args.llm_429_rate,
+        'llm_5xx_rate': args.llm_5xx_rate,
+        'python': platform.python_version(),
+        'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+    if args.save_baseline:
+        print(f'\nBaseline saved to {save_baseline(SUITE, args.baseline, results, meta)}')
+        return 0
+
+    baseline = load_baseline(SUITE, args.baseline)
+    if baseline is None:
+        print(f"\nNo '{args.baseline}' baseline yet; run with --save-baseline to record one")
+        return 0
+    if baseline['meta'].get('concurrency') != args.concurrency:
+        print(f"\nWarning: baseline was recorded at concurrency {baseline['meta'].get('concurrency')}")
+
+    regressions = compare(results, baseline['results'], CHECKS, args.tolerance)
+    if regressions:
+        print(f'\nRegressions against the {args.baseline} baseline:')
+        for line in regressions:
+            print(f'  {line}')
+        return 1
+    print(f'\nNo regressions against the {args.baseline} baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
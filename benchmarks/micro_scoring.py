@@ -0,0 +1,208 @@
+"""
+Micro-benchmarks for the pure-Python scoring path.
+
+When Groq is down or use_ai is false, InterviewService.calculate_score,
+AIService._is_valid_answer, AIService._fallback_evaluation and the JSON
+extraction are the whole of scoring. This times them over synthetic answer
+corpora (short, long, gibberish, unicode) and reports ops/sec plus
+allocations per call:
+
+    python -m benchmarks.micro_scoring
+    python -m benchmarks.micro_scoring --save-baseline
+    python -m benchmarks.micro_scoring --cases _fallback_evaluation
+
+Baselines are stored and compared like the end-to-end suite's.
+"""
+import sys
+import json
+import time
+import random
+import timeit
+import argparse
+import platform
+import tracemalloc
+
+from benchmarks.common import save_baseline, load_baseline, compare, print_table
+from services.ai_service import AIService
+from services.interview_service import InterviewService
+from services.json_stream import parse_json_array_items
+
+SUITE = 'micro_scoring'
+CHECKS = {'ops_per_sec': 'higher', 'bytes_per_call': 'lower'}
+
+VOCABULARY = [
+    'cache', 'index', 'query', 'latency', 'throughput', 'thread', 'lock', 'queue', 'request',
+    'response', 'database', 'transaction', 'replica', 'partition', 'service', 'deploy', 'monitor',
+    'metric', 'test', 'refactor', 'interface', 'pattern', 'memory', 'allocation', 'algorithm',
+    'the', 'a', 'and', 'to', 'of', 'in', 'we', 'it', 'is', 'for', 'with', 'on', 'by'
+]
+UNICODE_VOCABULARY = [
+    'caché', 'índice', 'consulta', 'latência', 'スレッド', 'キャッシュ', 'データベース', '请求',
+    '响应', 'транзакция', 'очередь', 'Speicher', 'Überwachung', 'ñandú', '🙂', 'and', 'the', 'of'
+]
+
+
+def sentence(rng, words, vocabulary):
+    text = ' '.join(rng.choice(vocabulary) for _ in range(words))
+    return text[0].upper() + text[1:] + rng.choice(['.', '.', '!', '?'])
+
+
+def paragraph(rng, words, vocabulary):
+    parts, remaining = [], words
+    while remaining > 0:
+        length = min(remaining, rng.randint(8, 16))
+        parts.append(sentence(rng, length, vocabulary))
+        remaining -= length
+    return ' '.join(parts)
+
+
+def gibberish(rng, words):
+    alphabet = 'asdfghjklqwertyuiopzxcvbnm'
+    return ' '.join(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))) for _ in range(words))
+
+
+def build_corpora(seed, size):
+    """Answer texts by corpus name, `size` of each"""
+    rng = random.Random(seed)
+    return {
+        'short': [paragraph(rng, rng.randint(3, 12), VOCABULARY) for _ in range(size)],
+        'long': [paragraph(rng, rng.randint(60, 250), VOCABULARY) for _ in range(size)],
+        'gibberish': [gibberish(rng, rng.randint(10, 80)) for _ in range(size)],
+        'unicode': [paragraph(rng, rng.randint(15, 80), UNICODE_VOCABULARY) for _ in range(size)]
+    }
+
+
+def submissions(corpus, rng, questions=10):
+    """Answer lists shaped like a written-interview submission (3 multiple-choice, 7 short-answer)"""
+    result = []
+    for start in range(0, len(corpus), questions - 3):
+        answers = [{'type': 'multiple-choice', 'correct': rng.random() < 0.5} for _ in range(3)]
+        answers += [{'type': 'short-answer', 'text': text} for text in corpus[start:start + questions - 3]]
+        result.append(answers)
+    return result
+
+
+def completions(rng, count):
+    """Completions as the model returns them: bare, fenced, and fenced with prose around"""
+    result = []
+    for i in range(count):
+        if i % 2:
+            body = json.dumps({'score': rng.randint(0, 20), 'feedback': paragraph(rng, 30, VOCABULARY)})
+        else:
+            body = json.dumps([{'answer': n + 1, 'score': rng.randint(0, 20), 'feedback': paragraph(rng, 20, VOCABULARY)}
+                               for n in range(7)])
+        style = i % 3
+        if style == 0:
+            result.append(body)
+        elif style == 1:
+            result.append(f'```json\n{body}\n```')
+        else:
+            result.append(f'Here is the evaluation:\n```\n{body}\n```\nLet me know if you need more.')
+    return result
+
+
+def build_cases(corpora, seed):
+    rng = random.Random(seed)
+    cases = []
+    for name, corpus in corpora.items():
+        cases.append(('_is_valid_answer', name, AIService._is_valid_answer, corpus))
+        cases.append(('_fallback_evaluation', name, AIService._fallback_evaluation, corpus))
+        cases.append(('calculate_score', name, InterviewService.calculate_score, submissions(corpus, rng)))
+
+    texts = completions(rng, 60)
+    cases.append(('_extract_json', 'completions', AIService._extract_json, texts))
+    arrays = [text for text in texts if '[' in text.split('{', 1)[0]]
+    cases.append(('parse_json_array_items', 'completions', parse_json_array_items, arrays))
+    return cases
+
+
+def measure(func, inputs, min_seconds):
+    """Best-of-3 ops/sec over the inputs, then the traced allocation peak of each call"""
+    def one_pass():
+        for value in inputs:
+            func(value)
+
+    timer = timeit.Timer(one_pass)
+    passes, elapsed = 1, timer.timeit(1)
+    while elapsed < min_seconds / 3:
+        passes *= 2
+        elapsed = timer.timeit(passes)
+    best = min([elapsed] + timer.repeat(repeat=2, number=passes))
+    ops_per_sec = passes * len(inputs) / best
+
+    # Peak transient memory of each call, above what was live before it
+    tracemalloc.start()
+    peaks = []
+    for value in inputs:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func(value)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    tracemalloc.stop()
+
+    return {
+        'ops_per_sec': round(ops_per_sec, 1),
+        'us_per_call': round(1e6 / ops_per_sec, 3),
+        'bytes_per_call': round(sum(peaks) / len(peaks), 1),
+        'max_bytes_per_call': max(peaks)
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Micro-benchmarks for the pure-Python scoring path')
+    parser.add_argument('--corpus-size', type=int, default=500, help='Answers per synthetic corpus')
+    parser.add_argument('--min-seconds', type=float, default=0.5, help='Minimum timing per case')
+    parser.add_argument('--cases', nargs='+', help='Only run these functions (e.g. _fallback_evaluation)')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--baseline', default='default', help='Baseline name to compare against or save as')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='Allowed fractional change before a metric counts as a regression')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = build_cases(build_corpora(args.seed, args.corpus_size), args.seed)
+    if args.cases:
+        cases = [case for case in cases if case[0] in args.cases]
+
+    results = {}
+    for func_name, corpus, func, inputs in cases:
+        results[f'{func_name}[{corpus}]'] = measure(func, inputs, args.min_seconds)
+
+    print_table(
+        ['case', 'ops/sec', 'us/call', 'alloc B/call', 'max alloc B'],
+        [[name, f"{r['ops_per_sec']:,.0f}", r['us_per_call'], r['bytes_per_call'], r['max_bytes_per_call']]
+         for name, r in results.items()]
+    )
+
+    meta = {
+        'corpus_size': args.corpus_size,
+        'seed': args.seed,
+        'python': platform.python_version(),
+        'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+    if args.save_baseline:
+        print(f'\nBaseline saved to {save_baseline(SUITE, args.baseline, results, meta)}')
+        return 0
+
+    baseline = load_baseline(SUITE, args.baseline)
+    if baseline is None:
+        print(f"\nNo '{args.baseline}' baseline yet; run with --save-baseline to record one")
+        return 0
+
+    regressions = compare(results, baseline['results'], CHECKS, args.tolerance)
+    if regressions:
+        print(f'\nRegressions against the {args.baseline} baseline:')
+        for line in regressions:
+            print(f'  {line}')
+        return 1
+    print(f'\nNo regressions against the {args.baseline} baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,3 +9,97 @@ class Config:
     HOST = os.getenv('FLASK_HOST', 'localhost')
     PORT = int(os.getenv('FLASK_PORT', 5000))
     DATABASE_PATH = 'interviewace.db'
+
+    # PostgreSQL connection pool
+    DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 2))
+    DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 20))
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv('DB_POOL_ACQUIRE_TIMEOUT_SECONDS', 5))
+    DB_POOL_MAX_AGE_SECONDS = int(os.getenv('DB_POOL_MAX_AGE_SECONDS', 1800))
+    DB_POOL_VALIDATE_IDLE_SECONDS = float(os.getenv('DB_POOL_VALIDATE_IDLE_SECONDS', 30))
+
+    # Apply pending schema migrations when the app starts
+    DB_MIGRATE_ON_STARTUP = os.getenv('DB_MIGRATE_ON_STARTUP', 'True').lower() == 'true'
+
+    # Answer evaluation
+    AI_EVAL_MAX_WORKERS = int(os.getenv('AI_EVAL_MAX_WORKERS', 16))
+    AI_EVAL_CONCURRENCY_PER_REQUEST = int(os.getenv('AI_EVAL_CONCURRENCY_PER_REQUEST', 8))
+    AI_EVAL_MODE = os.getenv('AI_EVAL_MODE', 'concurrent')  # 'concurrent' or 'batch'
+
+    # Groq HTTP client
+    GROQ_API_URL = os.getenv('GROQ_API_URL', 'https://api.groq.com/openai/v1/chat/completions')
+    GROQ_MODEL = os.getenv('GROQ_MODEL', 'llama-3.1-70b-versatile')
+    GROQ_POOL_CONNECTIONS = int(os.getenv('GROQ_POOL_CONNECTIONS', 2))
+    GROQ_POOL_SIZE = int(os.getenv('GROQ_POOL_SIZE', 16))
+    GROQ_CONNECT_TIMEOUT = float(os.getenv('GROQ_CONNECT_TIMEOUT', 5))
+
+    # Pre-generated AI question sets
+    QUESTION_POOL_ENABLED = os.getenv('QUESTION_POOL_ENABLED', 'True').lower() == 'true'
+    QUESTION_POOL_DEPTH = int(os.getenv('QUESTION_POOL_DEPTH', 2))
+    QUESTION_POOL_REFILL_WORKERS = int(os.getenv('QUESTION_POOL_REFILL_WORKERS', 2))
+    QUESTION_POOL_MAX_AGE_SECONDS = int(os.getenv('QUESTION_POOL_MAX_AGE_SECONDS', 3600))
+    QUESTION_POOL_REFILLS_PER_MINUTE = int(os.getenv('QUESTION_POOL_REFILLS_PER_MINUTE', 4))
+    QUESTION_POOL_REFRESH_BEFORE_SECONDS = int(os.getenv('QUESTION_POOL_REFRESH_BEFORE_SECONDS', 300))
+
+    # Per-user seen-question sets kept in memory
+    QUESTION_SEEN_CACHE_MAX_ENTRIES = int(os.getenv('QUESTION_SEEN_CACHE_MAX_ENTRIES', 10000))
+
+    # LLM result cache
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'True').lower() == 'true'
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 2048))
+    LLM_CACHE_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', 86400))
+    LLM_CACHE_PERSISTENT = os.getenv('LLM_CACHE_PERSISTENT', 'False').lower() == 'true'
+
+    # Local scoring tier: written answers it scores with at least this confidence skip the AI.
+    # Off by default: the shipped questions carry no keywords or reference answers to score against
+    LOCAL_SCORER_ENABLED = os.getenv('LOCAL_SCORER_ENABLED', 'False').lower() == 'true'
+    LOCAL_SCORER_MIN_CONFIDENCE = float(os.getenv('LOCAL_SCORER_MIN_CONFIDENCE', 0.6))
+
+    # Answers evaluated while the interview is in progress
+    INTERVIEW_SESSION_TTL_SECONDS = int(os.getenv('INTERVIEW_SESSION_TTL_SECONDS', 7200))
+    INTERVIEW_SESSION_MAX = int(os.getenv('INTERVIEW_SESSION_MAX', 5000))
+    INTERVIEW_SESSIONS_PER_CLIENT = int(os.getenv('INTERVIEW_SESSIONS_PER_CLIENT', 3))
+
+    # Interview results kept per user, trimmed by a background job
+    RESULT_RETENTION_PER_USER = int(os.getenv('RESULT_RETENTION_PER_USER', 0))  # 0 keeps everything
+    RESULT_COMPACTION_INTERVAL_SECONDS = int(os.getenv('RESULT_COMPACTION_INTERVAL_SECONDS', 600))
+    RESULT_COMPACTION_BATCH_SIZE = int(os.getenv('RESULT_COMPACTION_BATCH_SIZE', 500))
+
+    # Saved results served by /api/get-result (per worker process)
+    RESULT_CACHE_ENABLED = os.getenv('RESULT_CACHE_ENABLED', 'True').lower() == 'true'
+    RESULT_CACHE_MAX_ENTRIES = int(os.getenv('RESULT_CACHE_MAX_ENTRIES', 1000))
+    RESULT_CACHE_MAX_BYTES = int(os.getenv('RESULT_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+    RESULT_CACHE_TTL_SECONDS = int(os.getenv('RESULT_CACHE_TTL_SECONDS', 3600))
+    RESULT_HTTP_MAX_AGE_SECONDS = int(os.getenv('RESULT_HTTP_MAX_AGE_SECONDS', 86400))
+
+    # Asynchronous submission jobs
+    JOB_WORKERS = int(os.getenv('JOB_WORKERS', 4))
+    JOB_QUEUE_MAX_DEPTH = int(os.getenv('JOB_QUEUE_MAX_DEPTH', 500))
+    JOB_TIMEOUT_SECONDS = int(os.getenv('JOB_TIMEOUT_SECONDS', 120))
+    JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', 3))
+    JOB_POLL_SECONDS = float(os.getenv('JOB_POLL_SECONDS', 2))
+
+    # LLM routing across OpenAI-compatible backends
+    # JSON list of backends; empty means the single Groq backend above
+    LLM_BACKENDS = os.getenv('LLM_BACKENDS', '')
+    LLM_ROUTER_EWMA_ALPHA = float(os.getenv('LLM_ROUTER_EWMA_ALPHA', 0.2))
+    LLM_ROUTER_MAX_ERROR_RATE = float(os.getenv('LLM_ROUTER_MAX_ERROR_RATE', 0.5))
+    LLM_ROUTER_COOLDOWN_SECONDS = int(os.getenv('LLM_ROUTER_COOLDOWN_SECONDS', 30))
+    LLM_HEDGE_EVALUATIONS = os.getenv('LLM_HEDGE_EVALUATIONS', 'False').lower() == 'true'
+    LLM_HEDGE_MIN_DELAY_SECONDS = float(os.getenv('LLM_HEDGE_MIN_DELAY_SECONDS', 0.3))
+    LLM_HEDGE_DEFAULT_DELAY_SECONDS = float(os.getenv('LLM_HEDGE_DEFAULT_DELAY_SECONDS', 2))
+
+    # Groq circuit breaker
+    GROQ_BREAKER_WINDOW_SECONDS = int(os.getenv('GROQ_BREAKER_WINDOW_SECONDS', 60))
+    GROQ_BREAKER_MIN_CALLS = int(os.getenv('GROQ_BREAKER_MIN_CALLS', 5))
+    GROQ_BREAKER_ERROR_RATE = float(os.getenv('GROQ_BREAKER_ERROR_RATE', 0.5))
+    GROQ_BREAKER_SLOW_CALL_SECONDS = float(os.getenv('GROQ_BREAKER_SLOW_CALL_SECONDS', 10))
+    GROQ_BREAKER_SLOW_CALL_RATE = float(os.getenv('GROQ_BREAKER_SLOW_CALL_RATE', 0.8))
+    GROQ_BREAKER_OPEN_SECONDS = int(os.getenv('GROQ_BREAKER_OPEN_SECONDS', 30))
+
+    # Groq rate limiting
+    GROQ_REQUESTS_PER_MINUTE = int(os.getenv('GROQ_REQUESTS_PER_MINUTE', 30))
+    GROQ_TOKENS_PER_MINUTE = int(os.getenv('GROQ_TOKENS_PER_MINUTE', 30000))
+    GROQ_RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv('GROQ_RATE_LIMIT_MAX_WAIT_SECONDS', 10))
+    GROQ_MAX_RETRIES = int(os.getenv('GROQ_MAX_RETRIES', 2))
+    GROQ_RETRY_BASE_DELAY_SECONDS = float(os.getenv('GROQ_RETRY_BASE_DELAY_SECONDS', 1))
+    GROQ_RETRY_MAX_DELAY_SECONDS = float(os.getenv('GROQ_RETRY_MAX_DELAY_SECONDS', 10))
@@ -1,4 +1,5 @@
 from .auth_controller import auth_bp
 from .interview_controller import interview_bp
+from .metrics_controller import metrics_bp
 
-__all__ = ['auth_bp', 'interview_bp']
+__all__ = ['auth_bp', 'interview_bp', 'metrics_bp']
@@ -1,11 +1,29 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response
+import time
 import json
+import queue
+import threading
+import traceback
 from services.user_service import UserService
 from services.interview_service import InterviewService
 from services.ai_service import AIService
+from services.evaluation_service import EvaluationService
+from services.question_pool import QuestionPool
+from services.question_bank import QuestionBank
+from services.question_sampler import QuestionSampler
+from services.job_queue import JobQueue
+from services.result_cache import ResultCache
+from config import Config
 
 interview_bp = Blueprint('interview', __name__, url_prefix='/api')
 
+# Comment lines sent while a streamed submission is busy keep idle proxies from closing it
+SSE_KEEPALIVE_SECONDS = 15
+
+# Interview history rows per page
+HISTORY_PAGE_SIZE = 10
+HISTORY_MAX_PAGE_SIZE = 50
+
 @interview_bp.route('/create-guest', methods=['POST'])
 def create_guest():
     try:
@@ -27,22 +45,58 @@ def get_questions():
     role = request.args.get('role', 'Software Engineer')
     difficulty = request.args.get('difficulty', 'Beginner')
     use_ai = request.args.get('use_ai', 'true').lower() == 'true'
+    user_id = request.args.get('user_id')
     
     try:
         if use_ai:
-            # Generate questions using AI
-            questions = AIService.generate_interview_questions(role, difficulty)
+            # Serve a pre-generated set if one is ready, otherwise generate now
+            questions = QuestionPool.pop(role, difficulty)
+            if questions is None:
+                questions = AIService.generate_interview_questions(role, difficulty, user_id=user_id)
             return jsonify({'success': True, 'questions': questions, 'source': 'ai'})
         else:
-            # Use static questions from JSON
-            with open('data/questions.json', 'r') as f:
-                data = json.load(f)
-            questions = data.get(role, {}).get(difficulty, [])
-            return jsonify({'success': True, 'questions': questions[:10], 'source': 'static'})
+            # Use the static question bank, skipping questions this user has already had
+            if user_id:
+                questions = QuestionSampler.sample(user_id, role, difficulty)
+            else:
+                questions = QuestionBank.as_dicts(QuestionBank.questions(role, difficulty)[:10])
+            return jsonify({'success': True, 'questions': questions, 'source': 'static'})
     except Exception as e:
         print(f"Get questions error: {e}")
         return jsonify({'success': False, 'error': 'Failed to load questions'}), 500
 
+@interview_bp.route('/questions/stream')
+def stream_questions():
+    """
+    Server-Sent Events variant of /api/questions?use_ai=true. Emits a
+    'question' event as each AI question is generated, then 'done'
+    """
+    role = request.args.get('role', 'Software Engineer')
+    difficulty = request.args.get('difficulty', 'Beginner')
+    user_id = request.args.get('user_id')
+    
+    def generate():
+        yield ': accepted\n\n'
+        try:
+            questions = QuestionPool.pop(role, difficulty)
+            if questions is None:
+                questions = AIService.stream_interview_questions(role, difficulty, user_id)
+            
+            count = 0
+            for question in questions:
+                yield _sse('question', {'index': count, 'question': question})
+                count += 1
+            yield _sse('done', {'success': True, 'count': count, 'source': 'ai'})
+            
+        except Exception as e:
+            print(f"Stream questions error: {e}")
+            yield _sse('error', {'success': False, 'error': 'Failed to load questions'})
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @interview_bp.route('/submit-answers', methods=['POST'])
 def submit_answers():
     try:
@@ -53,81 +107,18 @@ def submit_answers():
         questions = data.get('questions', [])
         user_id = data.get('user_id')
         use_ai = data.get('use_ai', True)
+        session_id = data.get('session_id')
         
         if not user_id:
             return jsonify({'success': False, 'message': 'User ID required'}), 400
         
-        # Calculate score with AI evaluation
-        total_score = 0
-        evaluated_answers = []
-        
-        for i, answer in enumerate(answers):
-            question = questions[i]
-            
-            if answer.get('type') == 'multiple-choice':
-                # MCQ scoring
-                if answer.get('correct', False):
-                    score = 20
-                    feedback = "Correct answer"
-                else:
-                    score = 0
-                    feedback = "Incorrect answer"
-            else:
-                # AI evaluation for written answers
-                if use_ai and answer.get('text', '').strip():
-                    evaluation = AIService.evaluate_answer(
-                        question.get('question', ''),
-                        answer.get('text', ''),
-                        'short-answer'
-                    )
-                    score = evaluation.get('score', 10)
-                    feedback = evaluation.get('feedback', 'Answer evaluated')
-                else:
-                    # Fallback scoring with validation
-                    evaluation = AIService._fallback_evaluation(answer.get('text', ''))
-                    score = evaluation.get('score', 0)
-                    feedback = evaluation.get('feedback', 'Answer evaluated')
-            
-            total_score += score
-            evaluated_answers.append({
-                **answer,
-                'score': score,
-                'feedback': feedback
-            })
-        
-        # Normalize score to 100
-        final_score = min(100, int((total_score / 200) * 100))
-        
-        # Generate comprehensive report with AI
-        if use_ai:
-            report = AIService.generate_comprehensive_report(answers, questions, role, difficulty)
-        else:
-            report = AIService._fallback_report()
-        
-        # Get company recommendations
-        companies = InterviewService.get_companies(final_score, role)
-        
-        # Prepare detailed feedback
-        detailed_feedback = {
-            'summary': report.get('summary', ''),
-            'strengths': report.get('strengths', []),
-            'improvements': report.get('improvements', []),
-            'recommendations': report.get('recommendations', [])
-        }
-        
-        # Save result
-        result = InterviewService.save_result(
-            user_id, 
-            final_score, 
-            json.dumps(detailed_feedback), 
-            companies, 
-            evaluated_answers, 
-            questions
+        # Report generation runs alongside the answer evaluations; answers
+        # already evaluated during the interview are reused
+        result = EvaluationService.process_submission(
+            user_id, answers, questions, role, difficulty, 'short-answer', use_ai, session_id
         )
         
         if result:
-            result['detailed_feedback'] = detailed_feedback
-            result['evaluated_answers'] = evaluated_answers
             return jsonify({'success': True, **result})
         else:
             return jsonify({'success': False, 'message': 'Failed to save result'}), 500
@@ -138,16 +129,217 @@ def submit_answers():
         traceback.print_exc()
         return jsonify({'success': False, 'message': 'Failed to submit answers'}), 500
 
+@interview_bp.route('/evaluate-answer', methods=['POST'])
+def evaluate_answer():
+    """
+    Start scoring one written answer as soon as it is committed, so the
+    final submit for the same session_id only has to collect the results.
+    Sessions are capped per user and per client address
+    """
+    try:
+        data = request.get_json()
+        session_id = data.get('session_id')
+        user_id = data.get('user_id')
+        index = data.get('index')
+        question = data.get('question') or {}
+        answer = data.get('answer') or {}
+        use_ai = data.get('use_ai', True)
+        
+        if not user_id:
+            return jsonify({'success': False, 'message': 'User ID required'}), 400
+        if not session_id or not isinstance(index, int) or isinstance(index, bool):
+            return jsonify({'success': False, 'message': 'Session ID and answer index required'}), 400
+        
+        started = EvaluationService.start_answer(
+            session_id, user_id, request.remote_addr, index, question, answer, 'short-answer', use_ai
+        )
+        return jsonify({'success': True, 'started': started}), 202
+        
+    except Exception as e:
+        print(f"Evaluate answer error: {e}")
+        return jsonify({'success': False, 'message': 'Failed to evaluate answer'}), 500
+
+@interview_bp.route('/submit-answers/stream', methods=['POST'])
+def submit_answers_stream():
+    return _stream_submission('short-answer')
+
+@interview_bp.route('/submit-voice-interview/stream', methods=['POST'])
+def submit_voice_interview_stream():
+    return _stream_submission('voice')
+
+def _stream_submission(mode):
+    """
+    Server-Sent Events variant of the submit endpoints. Emits an 'answer'
+    event as each answer is scored, then 'report', then 'result' with the
+    saved result id ('error' if anything fails)
+    """
+    # Nothing here is inside a try, so a bad body must not raise
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'message': 'Invalid request body'}), 400
+    
+    answers = data.get('answers', [])
+    role = data.get('role', 'Software Engineer')
+    difficulty = data.get('difficulty', 'Beginner')
+    questions = data.get('questions', [])
+    user_id = data.get('user_id')
+    use_ai = data.get('use_ai', True) if mode == 'short-answer' else True
+    session_id = data.get('session_id')
+    
+    if not user_id:
+        return jsonify({'success': False, 'message': 'User ID required'}), 400
+    
+    # The pipeline runs on its own thread so the response can send keep-alives while it waits
+    events = queue.Queue()
+    
+    def run():
+        try:
+            submission = EvaluationService.iter_submission(
+                user_id, answers, questions, role, difficulty, mode, use_ai, session_id
+            )
+            for event in submission:
+                events.put(event)
+        except Exception as e:
+            print(f"Stream submission error: {e}")
+            traceback.print_exc()
+            events.put(('error', None))
+        finally:
+            events.put(None)
+    
+    threading.Thread(target=run, daemon=True).start()
+    
+    def generate():
+        yield ': accepted\n\n'
+        while True:
+            try:
+                item = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield ': keep-alive\n\n'
+                continue
+            
+            if item is None:
+                return
+            
+            event, payload = item
+            if event == 'result' and payload:
+                yield _sse('result', {'success': True, 'id': payload['id'], 'score': payload['score']})
+            elif event in ('result', 'error'):
+                yield _sse('error', {'success': False, 'message': 'Failed to submit interview'})
+            else:
+                yield _sse(event, payload)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@interview_bp.route('/submit-answers/async', methods=['POST'])
+def submit_answers_async():
+    return _enqueue_submission('short-answer')
+
+@interview_bp.route('/submit-voice-interview/async', methods=['POST'])
+def submit_voice_interview_async():
+    return _enqueue_submission('voice')
+
+def _enqueue_submission(mode):
+    """Queue a submission for the worker pool and return its job id right away"""
+    try:
+        data = request.get_json()
+        user_id = data.get('user_id')
+        
+        if not user_id:
+            return jsonify({'success': False, 'message': 'User ID required'}), 400
+        
+        payload = {
+            'answers': data.get('answers', []),
+            'questions': data.get('questions', []),
+            'role': data.get('role', 'Software Engineer'),
+            'difficulty': data.get('difficulty', 'Beginner'),
+            'use_ai': data.get('use_ai', True) if mode == 'short-answer' else True,
+            'session_id': data.get('session_id')
+        }
+        
+        job_id = JobQueue.enqueue(user_id, mode, payload)
+        if not job_id:
+            return jsonify({'success': False, 'message': 'Too many submissions in progress, please retry shortly'}), 503
+        
+        return jsonify({'success': True, 'job_id': job_id, 'status': 'queued'}), 202
+        
+    except Exception as e:
+        print(f"Enqueue submission error: {e}")
+        return jsonify({'success': False, 'message': 'Failed to submit interview'}), 500
+
+@interview_bp.route('/jobs/<job_id>')
+def get_job(job_id):
+    try:
+        job = JobQueue.get_job(job_id)
+        
+        if job:
+            return jsonify({'success': True, 'job': job})
+        else:
+            return jsonify({'success': False, 'message': 'Job not found'}), 404
+        
+    except Exception as e:
+        print(f"Get job error: {e}")
+        return jsonify({'success': False, 'message': 'Failed to get job'}), 500
+
+@interview_bp.route('/jobs/<job_id>/events')
+def job_events(job_id):
+    """Server-Sent Events feed of a job's status until it is done or failed"""
+    def generate():
+        yield ': accepted\n\n'
+        status = None
+        waited = 0
+        while True:
+            job = JobQueue.get_job(job_id)
+            if job is None:
+                yield _sse('error', {'success': False, 'message': 'Job not found'})
+                return
+            
+            if job['status'] != status:
+                status = job['status']
+                yield _sse('status', job)
+                waited = 0
+            
+            if status == 'done':
+                yield _sse('result', {'success': True, 'id': job['result_id']})
+                return
+            if status == 'failed':
+                yield _sse('error', {'success': False, 'message': job['error'] or 'Failed to submit interview'})
+                return
+            
+            time.sleep(1)
+            waited += 1
+            if waited >= SSE_KEEPALIVE_SECONDS:
+                yield ': keep-alive\n\n'
+                waited = 0
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @interview_bp.route('/get-result/<result_id>')
 def get_result(result_id):
     try:
-        result = InterviewService.get_result_by_id(result_id)
+        cached = ResultCache.get(result_id)
         
-        if result:
-            return jsonify(result)
-        else:
+        if not cached:
             return jsonify({'error': 'Result not found'}), 404
         
+        # Saved results never change: a strong ETag lets refreshes get a 304,
+        # and browsers may reuse the body without asking for a long time
+        etag, body = cached
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.private = True
+        response.cache_control.max_age = Config.RESULT_HTTP_MAX_AGE_SECONDS
+        response.cache_control.immutable = True
+        return response.make_conditional(request)
+        
     except Exception as e:
         print(f"Get result error: {e}")
         return jsonify({'error': 'Failed to get result'}), 500
@@ -165,63 +357,12 @@ def submit_voice_interview():
         if not user_id:
             return jsonify({'success': False, 'message': 'User ID required'}), 400
         
-        # Evaluate voice answers using AI
-        total_score = 0
-        evaluated_answers = []
-        
-        for i, answer in enumerate(answers):
-            question = questions[i]
-            
-            if answer.get('text', '').strip():
-                # AI evaluation for voice answers
-                evaluation = AIService.evaluate_answer(
-                    question.get('question', ''),
-                    answer.get('text', ''),
-                    'voice'
-                )
-                score = evaluation.get('score', 10)
-                feedback = evaluation.get('feedback', 'Answer evaluated')
-            else:
-                score = 0
-                feedback = 'No answer provided'
-            
-            total_score += score
-            evaluated_answers.append({
-                **answer,
-                'score': score,
-                'feedback': feedback
-            })
-        
-        # Normalize score to 100
-        final_score = min(100, int((total_score / 200) * 100))
-        
-        # Generate comprehensive report
-        report = AIService.generate_comprehensive_report(answers, questions, role, difficulty)
-        
-        # Get company recommendations
-        companies = InterviewService.get_companies(final_score, role)
-        
-        # Prepare detailed feedback
-        detailed_feedback = {
-            'summary': report.get('summary', ''),
-            'strengths': report.get('strengths', []),
-            'improvements': report.get('improvements', []),
-            'recommendations': report.get('recommendations', [])
-        }
-        
-        # Save result
-        result = InterviewService.save_result(
-            user_id, 
-            final_score, 
-            json.dumps(detailed_feedback), 
-            companies, 
-            evaluated_answers, 
-            questions
+        # Report generation runs alongside the answer evaluations
+        result = EvaluationService.process_submission(
+            user_id, answers, questions, role, difficulty, 'voice'
         )
         
         if result:
-            result['detailed_feedback'] = detailed_feedback
-            result['evaluated_answers'] = evaluated_answers
             return jsonify({'success': True, **result})
         else:
             return jsonify({'success': False, 'message': 'Failed to save result'}), 500
@@ -240,14 +381,41 @@ def get_history():
         if not user_id:
             return jsonify({'success': False, 'message': 'User ID required'}), 400
         
-        results = InterviewService.get_user_results(user_id, 5)
+        limit = min(max(request.args.get('limit', HISTORY_PAGE_SIZE, type=int), 1), HISTORY_MAX_PAGE_SIZE)
+        cursor = request.args.get('cursor')
+        try:
+            results, next_cursor = InterviewService.get_user_results(user_id, limit, cursor)
+        except ValueError:
+            return jsonify({'success': False, 'message': 'Invalid cursor'}), 400
         
-        return jsonify({
-            'success': True,
-            'history': results,
-            'total_interviews': len(results)
-        })
+        page = {'success': True, 'history': results, 'next_cursor': next_cursor}
+        
+        # Totals only change the first page's header; later pages just append rows
+        if not cursor:
+            summary = InterviewService.get_user_summary(user_id)
+            page['summary'] = summary
+            page['total_interviews'] = summary['interviews'] if summary else len(results)
+        
+        return jsonify(page)
         
     except Exception as e:
         print(f"Get history error: {e}")
         return jsonify({'success': False, 'message': 'Failed to get history'}), 500
+
+@interview_bp.route('/profile/summary')
+def get_summary():
+    try:
+        user_id = request.args.get('user_id')
+        
+        if not user_id:
+            return jsonify({'success': False, 'message': 'User ID required'}), 400
+        
+        summary = InterviewService.get_user_summary(user_id)
+        if summary is None:
+            return jsonify({'success': False, 'message': 'Failed to get summary'}), 500
+        
+        return jsonify({'success': True, 'summary': summary})
+        
+    except Exception as e:
+        print(f"Get summary error: {e}")
+        return jsonify({'success': False, 'message': 'Failed to get summary'}), 500
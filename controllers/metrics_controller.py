@@ -0,0 +1,37 @@
+from flask import Blueprint, jsonify
+from models.database import DatabaseManager
+from services.llm_cache import LLMCache
+from services.question_pool import QuestionPool
+from services.question_bank import QuestionBank
+from services.question_sampler import QuestionSampler
+from services.interview_sessions import InterviewSessions
+from services.local_scorer import LocalScorer
+from services.groq_client import GroqClient
+from services.llm_router import LLMRouter
+from services.result_retention import ResultRetention
+from services.result_cache import ResultCache
+
+metrics_bp = Blueprint('metrics', __name__, url_prefix='/api')
+
+@metrics_bp.route('/metrics')
+def get_metrics():
+    try:
+        return jsonify({
+            'success': True,
+            'llm_cache': LLMCache.stats(),
+            'question_pool': QuestionPool.stats(),
+            'question_bank': QuestionBank.stats(),
+            'question_sampler': QuestionSampler.stats(),
+            'interview_sessions': InterviewSessions.stats(),
+            'local_scorer': LocalScorer.stats(),
+            'groq_circuits': GroqClient.breaker_stats(),
+            'groq_rate_limit': GroqClient.rate_limit_stats(),
+            'llm_router': LLMRouter.stats(),
+            'db_pool': DatabaseManager.pool_stats(),
+            'result_retention': ResultRetention.stats(),
+            'result_cache': ResultCache.stats()
+        })
+        
+    except Exception as e:
+        print(f"Get metrics error: {e}")
+        return jsonify({'success': False, 'message': 'Failed to get metrics'}), 500
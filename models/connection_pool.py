@@ -0,0 +1,181 @@
+import time
+import threading
+from collections import deque
+import psycopg2
+import psycopg2.extensions
+
+class PoolTimeout(Exception):
+    """Raised when no connection became free within the acquire timeout"""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections. Opens `min_size` up front
+    and never more than `max_size`; callers wait up to `acquire_timeout`
+    for one to come free. A connection is checked before it is handed out
+    (and pinged if it sat idle for a while), and retired once it is older
+    than `max_age` seconds
+    """
+
+    def __init__(self, connect, min_size, max_size, acquire_timeout, max_age, validate_idle_seconds):
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max(1, max_size)
+        self.acquire_timeout = acquire_timeout
+        self.max_age = max_age
+        self.validate_idle_seconds = validate_idle_seconds
+
+        # Idle connections as (conn, created_at, released_at), most recently used last
+        self._idle = deque()
+        self._created = {}
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._counters = {
+            'acquired': 0, 'opened': 0, 'closed': 0, 'recycled': 0, 'invalid': 0,
+            'timeouts': 0, 'waits': 0, 'wait_seconds': 0.0, 'max_in_use': 0
+        }
+
+        self._fill()
+
+    def acquire(self):
+        deadline = time.time() + self.acquire_timeout
+        start = time.time()
+        waited = False
+
+        while True:
+            with self._condition:
+                candidate = None
+                while True:
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        if time.time() - candidate[1] >= self.max_age:
+                            self._counters['recycled'] += 1
+                            self._discard(candidate[0])
+                            candidate = None
+                            continue
+                        break
+                    if self._total() < self.max_size:
+                        break
+
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        self._counters['timeouts'] += 1
+                        raise PoolTimeout(f'No database connection free after {self.acquire_timeout}s')
+                    waited = True
+                    self._condition.wait(remaining)
+
+                # Reserve the slot so the check or connect below can run without the lock
+                self._in_use += 1
+
+            if candidate is None:
+                try:
+                    conn = self.connect()
+                except Exception:
+                    self._unreserve()
+                    raise
+                with self._condition:
+                    self._created[id(conn)] = time.time()
+                    self._counters['opened'] += 1
+                    return self._checked_out(conn, waited, start)
+
+            conn, _, released_at = candidate
+            if self._valid(conn, released_at):
+                with self._condition:
+                    return self._checked_out(conn, waited, start)
+
+            with self._condition:
+                self._counters['invalid'] += 1
+                self._discard(conn)
+            self._unreserve()
+
+    def release(self, conn):
+        """Return a connection, rolling back anything left uncommitted"""
+        healthy = not conn.closed
+        if healthy and conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except Exception:
+                healthy = False
+
+        with self._condition:
+            self._in_use -= 1
+            created_at = self._created.get(id(conn), 0)
+            if healthy and time.time() - created_at < self.max_age:
+                self._idle.append((conn, created_at, time.time()))
+            else:
+                self._counters['recycled' if healthy else 'invalid'] += 1
+                self._discard(conn)
+            self._condition.notify()
+
+    def close_all(self):
+        with self._condition:
+            while self._idle:
+                self._discard(self._idle.pop()[0])
+
+    def stats(self):
+        with self._condition:
+            acquired = self._counters['acquired']
+            return {
+                **self._counters,
+                'wait_seconds': round(self._counters['wait_seconds'], 3),
+                'avg_wait_ms': round(self._counters['wait_seconds'] * 1000 / acquired, 2) if acquired else 0.0,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'open': len(self._created),
+                'min_size': self.min_size,
+                'max_size': self.max_size
+            }
+
+    def _total(self):
+        return self._in_use + len(self._idle)
+
+    def _checked_out(self, conn, waited, start):
+        """Count a checkout whose slot is already reserved. Caller holds the lock"""
+        self._counters['acquired'] += 1
+        self._counters['max_in_use'] = max(self._counters['max_in_use'], self._in_use)
+        if waited:
+            self._counters['waits'] += 1
+            self._counters['wait_seconds'] += time.time() - start
+        return conn
+
+    def _unreserve(self):
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+
+    def _valid(self, conn, released_at):
+        if conn.closed:
+            return False
+        if time.time() - released_at < self.validate_idle_seconds:
+            return True
+        # The server or a proxy may have dropped it while it sat idle
+        try:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1')
+            cursor.close()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, conn):
+        """Close a connection and forget it. Caller holds the lock"""
+        self._created.pop(id(conn), None)
+        self._counters['closed'] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _fill(self):
+        """Open connections up to min_size; the database may not be up yet, which is fine"""
+        for _ in range(self.min_size):
+            try:
+                conn = self.connect()
+            except Exception as e:
+                print(f"Connection pool warm-up error: {e}")
+                return
+            with self._condition:
+                self._created[id(conn)] = time.time()
+                self._counters['opened'] += 1
+                self._idle.append((conn, self._created[id(conn)], time.time()))
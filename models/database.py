@@ -1,12 +1,21 @@
 import psycopg2
 import os
+import threading
+from contextlib import contextmanager
 from dotenv import load_dotenv
+from config import Config
+from models.connection_pool import ConnectionPool
+from models.migrations import Migrations
 
 load_dotenv()
 
 class DatabaseManager:
+    _pool = None
+    _lock = threading.Lock()
+
     @staticmethod
     def get_connection():
+        """A new, unpooled connection. Services use connection() instead"""
         return psycopg2.connect(
             host=os.getenv('DB_HOST', 'localhost'),
             port=os.getenv('DB_PORT', '5432'),
@@ -14,67 +23,60 @@ class DatabaseManager:
             user=os.getenv('DB_USER', 'postgres'),
             password=os.getenv('DB_PASSWORD', '3322')
         )
+
+    @staticmethod
+    def get_pool():
+        if DatabaseManager._pool is None:
+            with DatabaseManager._lock:
+                if DatabaseManager._pool is None:
+                    DatabaseManager._pool = ConnectionPool(
+                        DatabaseManager.get_connection,
+                        Config.DB_POOL_MIN_SIZE,
+                        Config.DB_POOL_MAX_SIZE,
+                        Config.DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+                        Config.DB_POOL_MAX_AGE_SECONDS,
+                        Config.DB_POOL_VALIDATE_IDLE_SECONDS
+                    )
+        return DatabaseManager._pool
+
+    @staticmethod
+    @contextmanager
+    def connection(autocommit=False):
+        """
+        Borrow a pooled connection for a with block. Commit explicitly;
+        anything left uncommitted when the block exits is rolled back
+        before the connection goes back to the pool. With autocommit, each
+        statement is its own transaction and costs a single round trip
+        """
+        pool = DatabaseManager.get_pool()
+        conn = pool.acquire()
+        try:
+            if autocommit:
+                conn.autocommit = True
+            yield conn
+        finally:
+            if autocommit and not conn.closed:
+                try:
+                    conn.autocommit = False
+                except Exception:
+                    conn.close()
+            pool.release(conn)
+
+    @staticmethod
+    def pool_stats():
+        return DatabaseManager.get_pool().stats()
     
     @staticmethod
     def init_db():
+        """Bring the schema up to date. A no-op apart from the version check once it is current"""
+        # Runs once per process, so it does not hold a pool slot
         conn = DatabaseManager.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id VARCHAR(255) PRIMARY KEY,
-                email VARCHAR(255) UNIQUE NOT NULL,
-                password_hash VARCHAR(255),
-                name VARCHAR(255),
-                avatar_url TEXT,
-                auth_provider VARCHAR(50) DEFAULT 'local',
-                oauth_id VARCHAR(255),
-                is_guest BOOLEAN DEFAULT FALSE,
-                is_verified BOOLEAN DEFAULT FALSE,
-                verification_token VARCHAR(255),
-                reset_otp VARCHAR(10),
-                otp_expiry TIMESTAMP,
-                phone VARCHAR(50),
-                user_role VARCHAR(255),  
-                experience VARCHAR(50),
-                location VARCHAR(255),
-                bio TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Add missing columns if they don't exist
-        columns_to_add = [
-            ('phone', 'VARCHAR(50)'),
-            ('user_role', 'VARCHAR(255)'),
-            ('experience', 'VARCHAR(50)'),
-            ('location', 'VARCHAR(255)'),
-            ('bio', 'TEXT')
-        ]
-        
-        for column_name, column_type in columns_to_add:
-            try:
-                cursor.execute(f'ALTER TABLE users ADD COLUMN IF NOT EXISTS {column_name} {column_type}')
-            except:
-                pass
+        try:
+            applied = Migrations.migrate(conn)
+        finally:
+            conn.close()
 
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS results (
-                id VARCHAR(255) PRIMARY KEY,
-                user_id VARCHAR(255) NOT NULL,
-                score INTEGER NOT NULL,
-                feedback TEXT,
-                companies TEXT,
-                answers TEXT,
-                questions TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
-            )
-        ''')
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        print("PostgreSQL database initialized")
-        print("Tables: users (with OAuth support), results")
+        if applied:
+            print(f"PostgreSQL database migrated to version {Migrations.latest_version()}")
+        else:
+            print(f"PostgreSQL schema up to date (version {Migrations.latest_version()})")
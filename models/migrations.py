@@ -0,0 +1,329 @@
+import time
+
+class Migrations:
+    """
+    Versioned schema changes. Each applied version is recorded in the
+    schema_migrations table, so a database that is already current costs
+    one catalog lookup and one MAX(version) query at startup, and takes no
+    locks on application tables. Workers starting together take turns on an
+    advisory lock, polled with pg_try_advisory_lock rather than waited on,
+    and the later ones find nothing left to do.
+
+    Append new migrations to MIGRATIONS with the next version number; never
+    edit one that has shipped. A migration either lists `statements`, run
+    together in one transaction, or `indexes` (name -> "table (columns)
+    [WHERE ...]"), built one at a time with CREATE INDEX CONCURRENTLY so
+    writes to the table are not blocked while they build. An index
+    migration may also list `drop_indexes` that the new ones make
+    redundant; those are dropped CONCURRENTLY once the builds succeed
+    """
+
+    MIGRATIONS = [
+        {
+            'version': 1,
+            'name': 'baseline schema',
+            'statements': [
+                '''
+                CREATE TABLE IF NOT EXISTS users (
+                    id VARCHAR(255) PRIMARY KEY,
+                    email VARCHAR(255) UNIQUE NOT NULL,
+                    password_hash VARCHAR(255),
+                    name VARCHAR(255),
+                    avatar_url TEXT,
+                    auth_provider VARCHAR(50) DEFAULT 'local',
+                    oauth_id VARCHAR(255),
+                    is_guest BOOLEAN DEFAULT FALSE,
+                    is_verified BOOLEAN DEFAULT FALSE,
+                    verification_token VARCHAR(255),
+                    reset_otp VARCHAR(10),
+                    otp_expiry TIMESTAMP,
+                    phone VARCHAR(50),
+                    user_role VARCHAR(255),
+                    experience VARCHAR(50),
+                    location VARCHAR(255),
+                    bio TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                ''',
+                # Databases created before the profile columns existed
+                'ALTER TABLE users ADD COLUMN IF NOT EXISTS phone VARCHAR(50)',
+                'ALTER TABLE users ADD COLUMN IF NOT EXISTS user_role VARCHAR(255)',
+                'ALTER TABLE users ADD COLUMN IF NOT EXISTS experience VARCHAR(50)',
+                'ALTER TABLE users ADD COLUMN IF NOT EXISTS location VARCHAR(255)',
+                'ALTER TABLE users ADD COLUMN IF NOT EXISTS bio TEXT',
+                '''
+                CREATE TABLE IF NOT EXISTS results (
+                    id VARCHAR(255) PRIMARY KEY,
+                    user_id VARCHAR(255) NOT NULL,
+                    score INTEGER NOT NULL,
+                    feedback TEXT,
+                    companies TEXT,
+                    answers TEXT,
+                    questions TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+                )
+                ''',
+                '''
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key VARCHAR(64) PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                ''',
+                '''
+                CREATE TABLE IF NOT EXISTS question_seen (
+                    user_id VARCHAR(255) NOT NULL,
+                    source VARCHAR(20) NOT NULL,
+                    role VARCHAR(100) NOT NULL,
+                    difficulty VARCHAR(50) NOT NULL,
+                    seen BYTEA NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user_id, source, role, difficulty),
+                    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+                )
+                ''',
+                '''
+                CREATE TABLE IF NOT EXISTS submission_jobs (
+                    id VARCHAR(255) PRIMARY KEY,
+                    user_id VARCHAR(255) NOT NULL,
+                    mode VARCHAR(20) NOT NULL,
+                    payload TEXT NOT NULL,
+                    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result_id VARCHAR(255),
+                    error TEXT,
+                    locked_until TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    started_at TIMESTAMP,
+                    finished_at TIMESTAMP
+                )
+                ''',
+                '''
+                CREATE INDEX IF NOT EXISTS idx_submission_jobs_pending
+                ON submission_jobs (created_at)
+                WHERE status IN ('queued', 'running')
+                '''
+            ]
+        },
+        {
+            'version': 2,
+            'name': 'hot-path indexes',
+            'indexes': {
+                # History: WHERE user_id = ? ORDER BY created_at DESC LIMIT n, and retention
+                'idx_results_user_created': 'results (user_id, created_at DESC)',
+                # Email verification looks users up by token; only pending rows carry one, so it stays small.
+                # OTP checks and logins filter by email, which its UNIQUE constraint already indexes
+                'idx_users_verification_token': 'users (verification_token) WHERE verification_token IS NOT NULL'
+            }
+        },
+        {
+            'version': 3,
+            'name': 'results as jsonb',
+            'statements': [
+                # Rows written before this hold JSON text; feedback may also be plain text from
+                # older versions, which becomes a JSON string. The array columns are always arrays
+                '''
+                CREATE FUNCTION pg_temp.results_jsonb(value TEXT, want_array BOOLEAN) RETURNS JSONB AS $$
+                DECLARE
+                    parsed JSONB;
+                BEGIN
+                    IF value IS NULL THEN
+                        RETURN CASE WHEN want_array THEN '[]'::jsonb END;
+                    END IF;
+                    BEGIN
+                        parsed := value::jsonb;
+                    EXCEPTION WHEN others THEN
+                        parsed := to_jsonb(value);
+                    END;
+                    IF want_array AND jsonb_typeof(parsed) <> 'array' THEN
+                        RETURN '[]'::jsonb;
+                    END IF;
+                    RETURN parsed;
+                END;
+                $$ LANGUAGE plpgsql
+                ''',
+                '''
+                ALTER TABLE results
+                    ALTER COLUMN feedback TYPE JSONB USING pg_temp.results_jsonb(feedback, FALSE),
+                    ALTER COLUMN companies TYPE JSONB USING pg_temp.results_jsonb(companies, TRUE),
+                    ALTER COLUMN answers TYPE JSONB USING pg_temp.results_jsonb(answers, TRUE),
+                    ALTER COLUMN questions TYPE JSONB USING pg_temp.results_jsonb(questions, TRUE)
+                '''
+            ]
+        },
+        {
+            'version': 4,
+            'name': 'result roles and per-user summaries',
+            'statements': [
+                'ALTER TABLE results ADD COLUMN IF NOT EXISTS role VARCHAR(100)',
+                'ALTER TABLE results ADD COLUMN IF NOT EXISTS difficulty VARCHAR(50)',
+                # One row per user, role and difficulty, updated by the statement that saves a result.
+                # Results saved before roles were recorded roll up under an empty role and difficulty
+                '''
+                CREATE TABLE IF NOT EXISTS user_result_summary (
+                    user_id VARCHAR(255) NOT NULL,
+                    role VARCHAR(100) NOT NULL DEFAULT '',
+                    difficulty VARCHAR(50) NOT NULL DEFAULT '',
+                    interviews INTEGER NOT NULL,
+                    total_score BIGINT NOT NULL,
+                    best_score INTEGER NOT NULL,
+                    first_score INTEGER NOT NULL,
+                    first_at TIMESTAMP NOT NULL,
+                    latest_score INTEGER NOT NULL,
+                    latest_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (user_id, role, difficulty),
+                    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+                )
+                ''',
+                '''
+                INSERT INTO user_result_summary (user_id, role, difficulty, interviews, total_score, best_score,
+                                                 first_score, first_at, latest_score, latest_at)
+                SELECT user_id, COALESCE(role, ''), COALESCE(difficulty, ''), COUNT(*), SUM(score), MAX(score),
+                       (array_agg(score ORDER BY created_at, id))[1],
+                       COALESCE(MIN(created_at), CURRENT_TIMESTAMP),
+                       (array_agg(score ORDER BY created_at DESC, id DESC))[1],
+                       COALESCE(MAX(created_at), CURRENT_TIMESTAMP)
+                FROM results
+                GROUP BY user_id, COALESCE(role, ''), COALESCE(difficulty, '')
+                ON CONFLICT (user_id, role, difficulty) DO NOTHING
+                '''
+            ]
+        },
+        {
+            'version': 5,
+            'name': 'history keyset index',
+            'indexes': {
+                # History pages: WHERE user_id = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+                'idx_results_user_keyset': 'results (user_id, created_at DESC, id DESC)'
+            },
+            # Its leading columns cover every query the old one served, which is now only write overhead
+            'drop_indexes': ['idx_results_user_created']
+        }
+    ]
+
+    # Key for pg_try_advisory_lock, shared by every process running migrations
+    LOCK_KEY = 72430021
+
+    # Seconds between attempts to take the lock while another process migrates
+    LOCK_POLL_SECONDS = 0.5
+
+    @staticmethod
+    def latest_version():
+        return Migrations.MIGRATIONS[-1]['version']
+
+    @staticmethod
+    def current_version(cursor):
+        cursor.execute("SELECT to_regclass('schema_migrations')")
+        if cursor.fetchone()[0] is None:
+            return 0
+        cursor.execute('SELECT COALESCE(MAX(version), 0) FROM schema_migrations')
+        return cursor.fetchone()[0]
+
+    @staticmethod
+    def migrate(conn):
+        """
+        Apply every migration newer than the recorded version. Returns the
+        versions applied, empty when the schema was already current.
+        Leaves the connection in autocommit mode
+        """
+        conn.autocommit = True
+        cursor = conn.cursor()
+        try:
+            if Migrations.current_version(cursor) >= Migrations.latest_version():
+                return []
+
+            if not Migrations._lock(cursor):
+                # Another worker brought the schema up to date while this one waited
+                return []
+            try:
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version INTEGER PRIMARY KEY,
+                        name VARCHAR(255) NOT NULL,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+
+                # Another worker may have applied them while this one waited for the lock
+                current = Migrations.current_version(cursor)
+                applied = []
+                for migration in Migrations.MIGRATIONS:
+                    if migration['version'] <= current:
+                        continue
+                    Migrations._apply(conn, cursor, migration)
+                    applied.append(migration['version'])
+                    print(f"Applied migration {migration['version']}: {migration['name']}")
+                return applied
+            finally:
+                cursor.execute('SELECT pg_advisory_unlock(%s)', (Migrations.LOCK_KEY,))
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _lock(cursor):
+        """
+        Take the migration lock, or return False once the schema is current.
+        Blocking in pg_advisory_lock would hold a snapshot for the whole wait,
+        and CREATE INDEX CONCURRENTLY in the session holding the lock waits
+        for every older snapshot to go away: the two would deadlock. So the
+        lock is polled, with no statement running between attempts
+        """
+        while True:
+            cursor.execute('SELECT pg_try_advisory_lock(%s)', (Migrations.LOCK_KEY,))
+            if cursor.fetchone()[0]:
+                return True
+            if Migrations.current_version(cursor) >= Migrations.latest_version():
+                return False
+            time.sleep(Migrations.LOCK_POLL_SECONDS)
+
+    @staticmethod
+    def _apply(conn, cursor, migration):
+        record = ('INSERT INTO schema_migrations (version, name) VALUES (%s, %s)',
+                  (migration['version'], migration['name']))
+
+        if 'indexes' in migration:
+            # CONCURRENTLY cannot run inside a transaction block, so these run in autocommit
+            for name, definition in migration['indexes'].items():
+                Migrations._drop_invalid_index(cursor, name)
+                cursor.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}')
+            for name in migration.get('drop_indexes', []):
+                cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+            cursor.execute(*record)
+            return
+
+        conn.autocommit = False
+        try:
+            for statement in migration['statements']:
+                cursor.execute(statement)
+            cursor.execute(*record)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.autocommit = True
+
+    @staticmethod
+    def _drop_invalid_index(cursor, name):
+        """A concurrent build that failed leaves an invalid index behind, which IF NOT EXISTS would keep"""
+        cursor.execute('''
+            SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = %s AND NOT i.indisvalid
+        ''', (name,))
+        if cursor.fetchone():
+            cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+if __name__ == '__main__':
+    from models.database import DatabaseManager
+
+    conn = DatabaseManager.get_connection()
+    try:
+        applied = Migrations.migrate(conn)
+        cursor = conn.cursor()
+        version = Migrations.current_version(cursor)
+        cursor.close()
+    finally:
+        conn.close()
+    print(f"Applied {len(applied)} migration(s); schema is at version {version}")
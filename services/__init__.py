@@ -2,5 +2,6 @@ from .user_service import UserService
 from .interview_service import InterviewService
 from .email_service import EmailService
 from .oauth_service import OAuthService
+from .evaluation_service import EvaluationService
 
-__all__ = ['UserService', 'InterviewService', 'EmailService', 'OAuthService']
+__all__ = ['UserService', 'InterviewService', 'EmailService', 'OAuthService', 'EvaluationService']
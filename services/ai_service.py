@@ -1,7 +1,13 @@
-import os
-import requests
 import json
 from dotenv import load_dotenv
+from config import Config
+from services.llm_router import LLMRouter
+from services.circuit_breaker import CircuitOpenError
+from services.rate_limiter import RateLimitExceeded
+from services.question_bank import QuestionBank
+from services.question_sampler import QuestionSampler
+from services.json_stream import JsonArrayItemParser, parse_json_array_items
+from services.llm_cache import LLMCache
 
 load_dotenv()
 
@@ -11,17 +17,111 @@ class AIService:
     Alternative: Can use Hugging Face, OpenAI, or other providers
     """
     
-    GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
-    GROQ_API_URL = 'https://api.groq.com/openai/v1/chat/completions'
-    MODEL = 'llama-3.1-70b-versatile'  # Fast and free model
+    MODEL = Config.GROQ_MODEL  # Fast and free model; LLM_BACKENDS can route to others
+    
+    # Bump when a prompt template changes so cached results are not reused
+    EVALUATION_PROMPT_VERSION = 1
+    REPORT_PROMPT_VERSION = 1
     
     @staticmethod
-    def generate_interview_questions(role, experience_level, resume_text=None):
+    def generate_interview_questions(role, experience_level, resume_text=None, user_id=None):
         """
         Generate 10 interview questions (3 MCQ + 7 Written) based on role and experience
         """
+        questions = AIService.request_interview_questions(role, experience_level)
+        if questions is None:
+            return AIService._get_fallback_questions(role, experience_level, user_id)
+        return questions
+    
+    @staticmethod
+    def request_interview_questions(role, experience_level):
+        """
+        Ask the AI for a fresh question set. Malformed items are dropped and
+        the set is topped up from the fallback questions. Returns None
+        instead of the fallback questions when the call fails outright
+        """
         
-        prompt = f"""You are a senior technical interviewer at a top tech company. Generate exactly 10 UNIQUE and DIVERSE interview questions for a {role} position at {experience_level} level.
+        try:
+            content, _ = AIService._chat(
+                'You are an expert technical interviewer. Always return valid JSON only.',
+                AIService._question_prompt(role, experience_level),
+                temperature=0.7, max_tokens=2000, timeout=30, call_type='generation'
+            )
+            
+            if content is not None:
+                questions = [q for q in parse_json_array_items(content) if AIService._is_valid_question(q)]
+                if not questions:
+                    return None
+                return AIService._top_up_questions(questions[:10], role, experience_level)
+            else:
+                return None
+                
+        except Exception as e:
+            print(f"AI question generation error: {e}")
+            return None
+    
+    @staticmethod
+    def stream_interview_questions(role, experience_level, user_id=None):
+        """
+        Generate a question set from a streamed completion, yielding each
+        question as soon as its JSON is complete. Malformed items are
+        skipped and the set is topped up from the fallback questions
+        """
+        questions = []
+        parser = JsonArrayItemParser()
+        
+        try:
+            deltas = LLMRouter.stream(
+                'generation',
+                AIService._chat_payload(
+                    'You are an expert technical interviewer. Always return valid JSON only.',
+                    AIService._question_prompt(role, experience_level),
+                    temperature=0.7, max_tokens=2000
+                ),
+                30
+            )
+            for delta in deltas:
+                for item in parser.feed(delta):
+                    if len(questions) < 10 and AIService._is_valid_question(item):
+                        questions.append(item)
+                        yield item
+                if len(questions) >= 10:
+                    deltas.close()
+                    break
+                    
+        except (CircuitOpenError, RateLimitExceeded):
+            pass
+        except Exception as e:
+            print(f"AI question streaming error: {e}")
+        
+        if not questions:
+            top_up = AIService._get_fallback_questions(role, experience_level, user_id)
+        else:
+            top_up = AIService._top_up_questions(questions, role, experience_level)[len(questions):]
+        for question in top_up:
+            yield question
+    
+    @staticmethod
+    def _is_valid_question(item):
+        if not isinstance(item, dict) or not isinstance(item.get('question'), str) or not item['question'].strip():
+            return False
+        if item.get('type') == 'short-answer':
+            return True
+        if item.get('type') == 'multiple-choice':
+            options = item.get('options')
+            answer = item.get('correctAnswer')
+            return (isinstance(options, list) and len(options) >= 2
+                    and isinstance(answer, int) and 0 <= answer < len(options))
+        return False
+    
+    @staticmethod
+    def _top_up_questions(questions, role, experience_level):
+        """Fill a short AI question set to 10 with the fallback questions for the same slots"""
+        return questions + AIService._get_fallback_questions(role, experience_level)[len(questions):10]
+    
+    @staticmethod
+    def _question_prompt(role, experience_level):
+        return f"""You are a senior technical interviewer at a top tech company. Generate exactly 10 UNIQUE and DIVERSE interview questions for a {role} position at {experience_level} level.
 
 CRITICAL REQUIREMENTS:
 - First 3 questions: Multiple choice with 4 options (technical/conceptual)
@@ -30,6 +130,7 @@ CRITICAL REQUIREMENTS:
 - Questions MUST be specific to {role} and appropriate for {experience_level} level
 - NO generic questions like "tell me about yourself" or "why should we hire you"
 - Include: algorithms, system design, coding problems, debugging scenarios, architecture decisions, real-world challenges
+- For each open-ended question, list 3-6 keywords a strong answer would mention
 
 For {experience_level} level:
 - Beginner: Focus on fundamentals, basic concepts, simple problem-solving
@@ -51,51 +152,12 @@ Return ONLY a valid JSON array:
   }},
   {{
     "question": "Detailed scenario-based question?",
-    "type": "short-answer"
+    "type": "short-answer",
+    "keywords": ["keyword 1", "keyword 2", "keyword 3"]
   }}
 ]
 
 Generate 10 DIVERSE questions now:"""
-
-        try:
-            response = requests.post(
-                AIService.GROQ_API_URL,
-                headers={
-                    'Authorization': f'Bearer {AIService.GROQ_API_KEY}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': AIService.MODEL,
-                    'messages': [
-                        {'role': 'system', 'content': 'You are an expert technical interviewer. Always return valid JSON only.'},
-                        {'role': 'user', 'content': prompt}
-                    ],
-                    'temperature': 0.7,
-                    'max_tokens': 2000
-                },
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                
-                # Extract JSON from response
-                content = content.strip()
-                if '```json' in content:
-                    content = content.split('```json')[1].split('```')[0].strip()
-                elif '```' in content:
-                    content = content.split('```')[1].split('```')[0].strip()
-                
-                questions = json.loads(content)
-                return questions[:10]  # Ensure only 10 questions
-            else:
-                print(f"Groq API error: {response.status_code} - {response.text}")
-                return AIService._get_fallback_questions(role, experience_level)
-                
-        except Exception as e:
-            print(f"AI question generation error: {e}")
-            return AIService._get_fallback_questions(role, experience_level)
     
     @staticmethod
     def evaluate_answer(question, answer, question_type):
@@ -115,6 +177,10 @@ Generate 10 DIVERSE questions now:"""
                 "feedback": "Invalid answer: Please provide a meaningful, well-structured response."
             }
         
+        cached = LLMCache.get_any(AIService._evaluation_cache_keys(question, answer))
+        if cached is not None:
+            return cached
+        
         prompt = f"""Evaluate this interview answer STRICTLY on a scale of 0-20 points.
 
 Question: {question}
@@ -134,36 +200,14 @@ Return ONLY a valid JSON object:
 }}"""
 
         try:
-            response = requests.post(
-                AIService.GROQ_API_URL,
-                headers={
-                    'Authorization': f'Bearer {AIService.GROQ_API_KEY}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': AIService.MODEL,
-                    'messages': [
-                        {'role': 'system', 'content': 'You are an expert interviewer. Return valid JSON only.'},
-                        {'role': 'user', 'content': prompt}
-                    ],
-                    'temperature': 0.5,
-                    'max_tokens': 200
-                },
-                timeout=15
+            content, model = AIService._chat(
+                'You are an expert interviewer. Return valid JSON only.',
+                prompt, temperature=0.5, max_tokens=200, timeout=15, hedge=True
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                
-                # Extract JSON
-                content = content.strip()
-                if '```json' in content:
-                    content = content.split('```json')[1].split('```')[0].strip()
-                elif '```' in content:
-                    content = content.split('```')[1].split('```')[0].strip()
-                
-                evaluation = json.loads(content)
+            if content is not None:
+                evaluation = AIService._extract_json(content)
+                LLMCache.put(AIService._evaluation_cache_key(model, question, answer), evaluation)
                 return evaluation
             else:
                 return AIService._fallback_evaluation(answer)
@@ -172,6 +216,103 @@ Return ONLY a valid JSON object:
             print(f"AI evaluation error: {e}")
             return AIService._fallback_evaluation(answer)
     
+    @staticmethod
+    def evaluate_answers_batch(items):
+        """
+        Evaluate several (question, answer) pairs in a single AI request.
+        Returns a list aligned with items holding each evaluation, or None
+        where the response had no usable entry for that answer
+        """
+        
+        results = [None] * len(items)
+        to_score = []
+        
+        for i, (question, answer) in enumerate(items):
+            if not AIService._is_valid_answer(answer):
+                results[i] = {
+                    "score": 0,
+                    "feedback": "Invalid answer: Please provide a meaningful, well-structured response."
+                }
+                continue
+            
+            cached = LLMCache.get_any(AIService._evaluation_cache_keys(question, answer))
+            if cached is not None:
+                results[i] = cached
+            else:
+                to_score.append(i)
+        
+        if not to_score:
+            return results
+        
+        numbered = []
+        for n, i in enumerate(to_score, start=1):
+            question, answer = items[i]
+            numbered.append(f"Answer {n}\nQuestion: {question}\nAnswer: {answer}")
+        
+        prompt = f"""Evaluate each of these {len(to_score)} interview answers STRICTLY on a scale of 0-20 points.
+
+{(chr(10) * 2).join(numbered)}
+
+Evaluation criteria for every answer:
+- Relevance and accuracy (0-8 points)
+- Depth and detail (0-6 points)
+- Clarity and structure (0-6 points)
+
+IMPORTANT: Give 0 points if an answer is gibberish or doesn't address its question.
+
+Return ONLY a valid JSON array with one object per answer, in order:
+[
+  {{"answer": 1, "score": 15, "feedback": "Brief feedback here"}}
+]"""
+
+        try:
+            content, model = AIService._chat(
+                'You are an expert interviewer. Return valid JSON only.',
+                prompt, temperature=0.5, max_tokens=150 * len(to_score) + 100, timeout=30
+            )
+            
+            if content is None:
+                return results
+            
+            evaluations = AIService._extract_json(content)
+            if not isinstance(evaluations, list):
+                return results
+            
+            for position, evaluation in enumerate(evaluations):
+                if not isinstance(evaluation, dict) or not isinstance(evaluation.get('score'), (int, float)):
+                    continue
+                n = evaluation.get('answer', position + 1)
+                if not isinstance(n, int) or not 1 <= n <= len(to_score):
+                    continue
+                
+                i = to_score[n - 1]
+                evaluation = {
+                    'score': max(0, min(20, evaluation['score'])),
+                    'feedback': evaluation.get('feedback', 'Answer evaluated')
+                }
+                results[i] = evaluation
+                LLMCache.put(AIService._evaluation_cache_key(model, *items[i]), evaluation)
+                
+        except Exception as e:
+            print(f"AI batch evaluation error: {e}")
+        
+        return results
+    
+    @staticmethod
+    def _evaluation_cache_key(model, question, answer):
+        return LLMCache.make_key(
+            'evaluation', model, AIService.EVALUATION_PROMPT_VERSION,
+            question, LLMCache.normalize(answer)
+        )
+    
+    @staticmethod
+    def _evaluation_cache_keys(question, answer):
+        """Keys for every model the router could answer an evaluation with"""
+        return [
+            AIService._evaluation_cache_key(model, question, answer)
+            for model in LLMRouter.models('evaluation')
+        ]
+    
     @staticmethod
     def generate_comprehensive_report(answers, questions, role, experience_level):
         """
@@ -183,10 +324,19 @@ Return ONLY a valid JSON object:
         for i, (q, a) in enumerate(zip(questions, answers)):
             answers_summary.append(f"Q{i+1}: {q['question']}\nA: {a.get('text', a.get('selected', 'No answer'))}")
         
+        interview_answers = chr(10).join(answers_summary[:5])
+        cache_parts = (role, experience_level, LLMCache.normalize(interview_answers))
+        cached = LLMCache.get_any([
+            LLMCache.make_key('report', model, AIService.REPORT_PROMPT_VERSION, *cache_parts)
+            for model in LLMRouter.models('report')
+        ])
+        if cached is not None:
+            return cached
+        
         prompt = f"""Analyze this {role} interview at {experience_level} level and provide a comprehensive report.
 
 Interview Answers:
-{chr(10).join(answers_summary[:5])}  
+{interview_answers}  
 
 Generate a detailed report with:
 1. Overall performance summary (2-3 sentences)
@@ -203,36 +353,14 @@ Return ONLY valid JSON:
 }}"""
 
         try:
-            response = requests.post(
-                AIService.GROQ_API_URL,
-                headers={
-                    'Authorization': f'Bearer {AIService.GROQ_API_KEY}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': AIService.MODEL,
-                    'messages': [
-                        {'role': 'system', 'content': 'You are an expert career advisor. Return valid JSON only.'},
-                        {'role': 'user', 'content': prompt}
-                    ],
-                    'temperature': 0.7,
-                    'max_tokens': 800
-                },
-                timeout=20
+            content, model = AIService._chat(
+                'You are an expert career advisor. Return valid JSON only.',
+                prompt, temperature=0.7, max_tokens=800, timeout=20, call_type='report'
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                
-                # Extract JSON
-                content = content.strip()
-                if '```json' in content:
-                    content = content.split('```json')[1].split('```')[0].strip()
-                elif '```' in content:
-                    content = content.split('```')[1].split('```')[0].strip()
-                
-                report = json.loads(content)
+            if content is not None:
+                report = AIService._extract_json(content)
+                LLMCache.put(LLMCache.make_key('report', model, AIService.REPORT_PROMPT_VERSION, *cache_parts), report)
                 return report
             else:
                 return AIService._fallback_report()
@@ -242,127 +370,52 @@ Return ONLY valid JSON:
             return AIService._fallback_report()
     
     @staticmethod
-    def _get_fallback_questions(role, experience_level):
-        """Fallback questions if AI fails - role and level specific"""
-        
-        questions_by_role = {
-            'Software Engineer': {
-                'Beginner': [
-                    {"question": "What is the time complexity of binary search?", "type": "multiple-choice", "options": ["O(n)", "O(log n)", "O(n²)", "O(1)"], "correctAnswer": 1},
-                    {"question": "Which data structure uses LIFO principle?", "type": "multiple-choice", "options": ["Queue", "Stack", "Array", "Tree"], "correctAnswer": 1},
-                    {"question": "What does REST stand for?", "type": "multiple-choice", "options": ["Representational State Transfer", "Remote State Transfer", "Real State Transfer", "None"], "correctAnswer": 0},
-                    {"question": "Explain the difference between GET and POST HTTP methods with examples.", "type": "short-answer"},
-                    {"question": "Write a function to reverse a string and explain your approach.", "type": "short-answer"},
-                    {"question": "What is the difference between SQL and NoSQL databases? When would you use each?", "type": "short-answer"},
-                    {"question": "Explain how you would debug a program that crashes intermittently.", "type": "short-answer"},
-                    {"question": "Describe the MVC architecture pattern and its benefits.", "type": "short-answer"},
-                    {"question": "How would you optimize a slow database query?", "type": "short-answer"},
-                    {"question": "Explain the concept of API rate limiting and why it's important.", "type": "short-answer"}
-                ],
-                'Intermediate': [
-                    {"question": "Which design pattern ensures only one instance exists?", "type": "multiple-choice", "options": ["Factory", "Observer", "Singleton", "Strategy"], "correctAnswer": 2},
-                    {"question": "What is the space complexity of merge sort?", "type": "multiple-choice", "options": ["O(1)", "O(log n)", "O(n)", "O(n²)"], "correctAnswer": 2},
-                    {"question": "Which is NOT a SOLID principle?", "type": "multiple-choice", "options": ["Single Responsibility", "Open/Closed", "Code Reusability", "Dependency Inversion"], "correctAnswer": 2},
-                    {"question": "Design a URL shortener service like bit.ly. Explain your database schema, API endpoints, and how you'd handle collisions.", "type": "short-answer"},
-                    {"question": "You have a microservices architecture with 10 services. How would you implement distributed tracing and logging?", "type": "short-answer"},
-                    {"question": "Explain the difference between optimistic and pessimistic locking with real-world use cases.", "type": "short-answer"},
-                    {"question": "Your API response time increased from 100ms to 2s. Walk through your debugging process.", "type": "short-answer"},
-                    {"question": "How would you implement a real-time notification system for 1 million users?", "type": "short-answer"},
-                    {"question": "Explain caching strategies (Redis, CDN, browser cache) and when to use each.", "type": "short-answer"},
-                    {"question": "Design a rate limiter that can handle 1000 requests per second per user.", "type": "short-answer"}
-                ],
-                'Advanced': [
-                    {"question": "What is the time complexity of Tarjan's algorithm?", "type": "multiple-choice", "options": ["O(V + E)", "O(V²)", "O(V log V)", "O(E log V)"], "correctAnswer": 0},
-                    {"question": "Which consensus algorithm is used in blockchain?", "type": "multiple-choice", "options": ["Raft", "Paxos", "Proof of Work", "All of above"], "correctAnswer": 3},
-                    {"question": "What does CAP theorem stand for?", "type": "multiple-choice", "options": ["Consistency, Availability, Partition", "Cache, API, Performance", "Code, Architecture, Pattern", "None"], "correctAnswer": 0},
-                    {"question": "Design Instagram's architecture to handle 500M daily active users. Include database sharding, CDN, caching, and load balancing strategies.", "type": "short-answer"},
-                    {"question": "Explain the CAP theorem with real-world examples. How would you design a system that prioritizes consistency vs availability?", "type": "short-answer"},
-                    {"question": "You're leading a team migrating a monolith to microservices. What's your strategy, timeline, and risk mitigation plan?", "type": "short-answer"},
-                    {"question": "Design a distributed lock service like Chubby/ZooKeeper. Explain consensus, failure handling, and performance.", "type": "short-answer"},
-                    {"question": "How would you implement zero-downtime deployment for a critical payment service?", "type": "short-answer"},
-                    {"question": "Explain event sourcing and CQRS patterns. When would you use them and what are the trade-offs?", "type": "short-answer"},
-                    {"question": "Design a global CDN system. Explain edge locations, cache invalidation, and routing strategies.", "type": "short-answer"}
-                ]
-            },
-            'AI Scientist': {
-                'Beginner': [
-                    {"question": "What does CNN stand for?", "type": "multiple-choice", "options": ["Convolutional Neural Network", "Cascading Neural Network", "Circular Neural Network", "None"], "correctAnswer": 0},
-                    {"question": "Which activation function is commonly used?", "type": "multiple-choice", "options": ["Sigmoid", "ReLU", "Tanh", "All of above"], "correctAnswer": 1},
-                    {"question": "What is overfitting?", "type": "multiple-choice", "options": ["Model too simple", "Model too complex", "Perfect model", "None"], "correctAnswer": 1},
-                    {"question": "Explain the difference between supervised and unsupervised learning with 2 examples each.", "type": "short-answer"},
-                    {"question": "What is overfitting and how would you prevent it? Provide 3 specific techniques.", "type": "short-answer"},
-                    {"question": "Explain backpropagation algorithm in neural networks step by step.", "type": "short-answer"},
-                    {"question": "Compare decision trees and random forests. When would you use each?", "type": "short-answer"},
-                    {"question": "How would you handle imbalanced datasets in classification problems?", "type": "short-answer"},
-                    {"question": "Explain the bias-variance tradeoff with a practical example.", "type": "short-answer"},
-                    {"question": "What evaluation metrics would you use for a medical diagnosis model and why?", "type": "short-answer"}
-                ],
-                'Intermediate': [
-                    {"question": "Which optimizer adapts learning rates?", "type": "multiple-choice", "options": ["SGD", "Adam", "Momentum", "None"], "correctAnswer": 1},
-                    {"question": "What is the main advantage of LSTM?", "type": "multiple-choice", "options": ["Faster training", "Less parameters", "Long-term memory", "Simpler"], "correctAnswer": 2},
-                    {"question": "Which prevents overfitting?", "type": "multiple-choice", "options": ["Dropout", "Batch norm", "Data augmentation", "All of above"], "correctAnswer": 3},
-                    {"question": "Design a recommendation system for Netflix. Explain your approach, features, model architecture, and evaluation metrics.", "type": "short-answer"},
-                    {"question": "Explain the vanishing gradient problem in RNNs. How do LSTMs and GRUs solve this?", "type": "short-answer"},
-                    {"question": "You're building a fraud detection model. Walk through your entire ML pipeline from data collection to deployment.", "type": "short-answer"},
-                    {"question": "Compare transfer learning and fine-tuning. When would you use each approach?", "type": "short-answer"},
-                    {"question": "How would you deploy a deep learning model to production with 99.9% uptime?", "type": "short-answer"},
-                    {"question": "Explain attention mechanism in transformers and why it's revolutionary.", "type": "short-answer"},
-                    {"question": "Your model has 95% accuracy but fails in production. What could be wrong and how would you fix it?", "type": "short-answer"}
-                ],
-                'Advanced': [
-                    {"question": "What technique is used in Transformers?", "type": "multiple-choice", "options": ["Learned embeddings", "Sinusoidal encoding", "Random init", "One-hot"], "correctAnswer": 1},
-                    {"question": "What is ResNet's main innovation?", "type": "multiple-choice", "options": ["Dropout", "Skip connections", "Attention", "Batch norm"], "correctAnswer": 1},
-                    {"question": "Which loss is used for GANs?", "type": "multiple-choice", "options": ["Cross-entropy", "MSE", "Wasserstein", "Hinge"], "correctAnswer": 2},
-                    {"question": "Design a large language model training pipeline. Explain distributed training, gradient accumulation, mixed precision, and optimization strategies.", "type": "short-answer"},
-                    {"question": "Explain the architecture of GPT and BERT. What are the key differences and when would you use each?", "type": "short-answer"},
-                    {"question": "You're training a model with 175B parameters. Explain your infrastructure, parallelization strategy, and cost optimization.", "type": "short-answer"},
-                    {"question": "Design a real-time object detection system for autonomous vehicles. Include model architecture, latency requirements, and edge deployment.", "type": "short-answer"},
-                    {"question": "Explain neural architecture search (NAS) and its applications. What are the computational challenges?", "type": "short-answer"},
-                    {"question": "How would you implement continual learning to prevent catastrophic forgetting?", "type": "short-answer"},
-                    {"question": "Design an AI system for medical diagnosis. Address data privacy, model interpretability, and regulatory compliance.", "type": "short-answer"}
-                ]
-            },
-            'Data Scientist': {
-                'Beginner': [
-                    {"question": "Which measure is most affected by outliers?", "type": "multiple-choice", "options": ["Mean", "Median", "Mode", "Range"], "correctAnswer": 0},
-                    {"question": "What does ETL stand for?", "type": "multiple-choice", "options": ["Extract, Transform, Load", "Evaluate, Test, Learn", "Execute, Track, Log", "None"], "correctAnswer": 0},
-                    {"question": "Which chart shows correlation?", "type": "multiple-choice", "options": ["Bar chart", "Pie chart", "Scatter plot", "Line chart"], "correctAnswer": 2},
-                    {"question": "Explain the difference between correlation and causation with a real-world example.", "type": "short-answer"},
-                    {"question": "You have a dataset with missing values. Explain 3 different approaches to handle them.", "type": "short-answer"},
-                    {"question": "What is A/B testing? Design an A/B test for a website's checkout button color.", "type": "short-answer"},
-                    {"question": "Explain Type I and Type II errors with examples from business context.", "type": "short-answer"},
-                    {"question": "How would you detect and handle outliers in a sales dataset?", "type": "short-answer"},
-                    {"question": "Explain the difference between supervised and unsupervised learning for business problems.", "type": "short-answer"},
-                    {"question": "What metrics would you use to evaluate a customer churn prediction model?", "type": "short-answer"}
-                ],
-                'Intermediate': [
-                    {"question": "Which test compares means of two groups?", "type": "multiple-choice", "options": ["Chi-square", "T-test", "ANOVA", "Correlation"], "correctAnswer": 1},
-                    {"question": "What is linear regression's main assumption?", "type": "multiple-choice", "options": ["Non-linear", "Linear relationship", "Categorical only", "No relationship"], "correctAnswer": 1},
-                    {"question": "Which metric evaluates regression?", "type": "multiple-choice", "options": ["Accuracy", "Precision", "R-squared", "F1-score"], "correctAnswer": 2},
-                    {"question": "Design a customer lifetime value (CLV) prediction model. Explain features, model selection, and business impact.", "type": "short-answer"},
-                    {"question": "You're analyzing user behavior data. Walk through your exploratory data analysis process and key insights you'd look for.", "type": "short-answer"},
-                    {"question": "Build a dashboard for executives. What metrics would you include and how would you visualize them?", "type": "short-answer"},
-                    {"question": "Explain feature engineering for time series data. Provide 5 specific features you'd create.", "type": "short-answer"},
-                    {"question": "Your model shows 90% accuracy but business says it's not working. What could be wrong?", "type": "short-answer"},
-                    {"question": "Design an experiment to test if a new feature increases user engagement. Include sample size calculation.", "type": "short-answer"},
-                    {"question": "How would you build a real-time anomaly detection system for fraud?", "type": "short-answer"}
-                ],
-                'Advanced': [
-                    {"question": "Which method estimates treatment effects?", "type": "multiple-choice", "options": ["Propensity score", "Instrumental variables", "Difference-in-differences", "All of above"], "correctAnswer": 3},
-                    {"question": "What is the curse of dimensionality?", "type": "multiple-choice", "options": ["Computational complexity", "High dimensions problem", "Storage issue", "Visualization"], "correctAnswer": 1},
-                    {"question": "Which technique detects anomalies?", "type": "multiple-choice", "options": ["Isolation Forest", "One-class SVM", "LOF", "All of above"], "correctAnswer": 3},
-                    {"question": "Design a data platform for a company with 100TB daily data. Include architecture, storage, processing, and governance.", "type": "short-answer"},
-                    {"question": "Explain causal inference methods. How would you measure the impact of a marketing campaign?", "type": "short-answer"},
-                    {"question": "Build a recommendation engine for e-commerce. Explain collaborative filtering, content-based, and hybrid approaches.", "type": "short-answer"},
-                    {"question": "Design a real-time data pipeline processing 1M events/second. Include technologies, scaling, and monitoring.", "type": "short-answer"},
-                    {"question": "You're leading a data science team of 10. How would you structure projects, ensure quality, and measure impact?", "type": "short-answer"},
-                    {"question": "Explain time series forecasting for demand prediction. Include seasonality, trends, and model selection.", "type": "short-answer"},
-                    {"question": "Design an ML ops pipeline with automated retraining, monitoring, and rollback capabilities.", "type": "short-answer"}
-                ]
-            }
+    def _chat(system_prompt, prompt, temperature, max_tokens, timeout, call_type='evaluation', hedge=False):
+        """
+        Send one chat completion through the LLM router, which picks the
+        fastest healthy backend for the call type. Returns (message
+        content, model that produced it), or (None, None) when no backend
+        returned one (errors, open circuits, rate-limit queues too long)
+        """
+        content, backend = LLMRouter.chat(
+            call_type,
+            AIService._chat_payload(system_prompt, prompt, temperature, max_tokens),
+            timeout,
+            hedge=hedge
+        )
+        return content, backend.model if backend else None
+    
+    @staticmethod
+    def _chat_payload(system_prompt, prompt, temperature, max_tokens):
+        return {
+            'model': AIService.MODEL,
+            'messages': [
+                {'role': 'system', 'content': system_prompt},
+                {'role': 'user', 'content': prompt}
+            ],
+            'temperature': temperature,
+            'max_tokens': max_tokens
         }
+    
+    @staticmethod
+    def _extract_json(content):
+        """Parse the JSON payload out of a completion, with or without a code fence"""
+        content = content.strip()
+        if '```json' in content:
+            content = content.split('```json')[1].split('```')[0].strip()
+        elif '```' in content:
+            content = content.split('```')[1].split('```')[0].strip()
         
-        return questions_by_role.get(role, {}).get(experience_level, questions_by_role['Software Engineer']['Beginner'])
+        return json.loads(content)
+    
+    @staticmethod
+    def _get_fallback_questions(role, experience_level, user_id=None):
+        """Fallback questions if AI fails - role and level specific, avoiding ones the user has seen"""
+        if user_id:
+            questions = QuestionSampler.sample(user_id, role, experience_level, source='fallback')
+            if questions:
+                return questions
+        return QuestionBank.fallback(role, experience_level)
     
     @staticmethod
     def _is_valid_answer(answer):
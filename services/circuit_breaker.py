@@ -0,0 +1,142 @@
+import time
+import threading
+from collections import deque
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Tracks recent call outcomes and latencies for one dependency. Opens when
+    the error rate or slow-call rate over the window crosses its threshold;
+    while open, callers fail fast. A background thread probes the
+    dependency and, once it answers, moves the circuit to half-open, where
+    a single real call is let through: its outcome closes the circuit or
+    opens it again
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, probe, window_seconds, min_calls, error_rate,
+                 slow_call_seconds, slow_call_rate, open_seconds):
+        self.name = name
+        self.probe = probe
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+
+        self._state = CircuitBreaker.CLOSED
+        self._calls = deque()
+        self._opened_at = None
+        self._trial_at = None
+        self._times_opened = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        Whether a call may go through. A closed circuit lets all traffic
+        through, a half-open one a single trial call at a time; a trial not
+        recorded within open_seconds is taken as lost and another is let through
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.CLOSED:
+                return True
+            now = time.time()
+            if self._state == CircuitBreaker.HALF_OPEN and (
+                    self._trial_at is None or now - self._trial_at >= self.open_seconds):
+                self._trial_at = now
+                return True
+            self._rejected += 1
+            return False
+
+    def is_closed(self):
+        """Whether the circuit is currently letting traffic through, without counting a rejection"""
+        with self._lock:
+            return self._state == CircuitBreaker.CLOSED
+
+    def record(self, success, latency):
+        with self._lock:
+            now = time.time()
+            if self._state == CircuitBreaker.HALF_OPEN and self._trial_at is not None:
+                # The trial call decides; a slow success counts as a failure
+                if success and latency < self.slow_call_seconds:
+                    self._close()
+                else:
+                    self._open(now)
+                return
+            if self._state != CircuitBreaker.CLOSED:
+                return
+
+            self._calls.append((now, success, latency >= self.slow_call_seconds))
+            self._trim(now)
+
+            calls = len(self._calls)
+            if calls < self.min_calls:
+                return
+
+            errors = sum(1 for _, ok, _ in self._calls if not ok)
+            slow = sum(1 for _, _, is_slow in self._calls if is_slow)
+            if errors / calls >= self.error_rate or slow / calls >= self.slow_call_rate:
+                self._open(now)
+
+    def stats(self):
+        with self._lock:
+            self._trim(time.time())
+            calls = len(self._calls)
+            errors = sum(1 for _, ok, _ in self._calls if not ok)
+            slow = sum(1 for _, _, is_slow in self._calls if is_slow)
+            return {
+                'name': self.name,
+                'state': self._state,
+                'window_calls': calls,
+                'window_error_rate': round(errors / calls, 4) if calls else 0.0,
+                'window_slow_rate': round(slow / calls, 4) if calls else 0.0,
+                'times_opened': self._times_opened,
+                'rejected_calls': self._rejected,
+                'open_for_seconds': round(time.time() - self._opened_at, 1) if self._opened_at else 0
+            }
+
+    def _trim(self, now):
+        cutoff = now - self.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+
+    def _open(self, now):
+        """Open the circuit and start probing. Caller holds the lock"""
+        self._state = CircuitBreaker.OPEN
+        self._opened_at = now
+        self._trial_at = None
+        self._times_opened += 1
+        print(f"Circuit '{self.name}' opened")
+        threading.Thread(target=self._probe_until_healthy, name=f'{self.name}-probe', daemon=True).start()
+
+    def _close(self):
+        """Caller holds the lock"""
+        self._state = CircuitBreaker.CLOSED
+        self._calls.clear()
+        self._opened_at = None
+        self._trial_at = None
+        print(f"Circuit '{self.name}' closed")
+
+    def _probe_until_healthy(self):
+        """Wait until the probe passes, then go half-open for a trial call"""
+        while True:
+            time.sleep(self.open_seconds)
+            try:
+                healthy = self.probe()
+            except Exception as e:
+                print(f"Circuit '{self.name}' probe error: {e}")
+                healthy = False
+
+            if healthy:
+                with self._lock:
+                    self._state = CircuitBreaker.HALF_OPEN
+                    print(f"Circuit '{self.name}' half-open")
+                return
@@ -0,0 +1,299 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from config import Config
+from services.ai_service import AIService
+from services.interview_service import InterviewService
+from services.interview_sessions import InterviewSessions
+from services.local_scorer import LocalScorer
+
+class EvaluationService:
+    """
+    Runs the submission pipeline: scores answers with the AI evaluations
+    running concurrently on a shared, bounded thread pool, generates the
+    report alongside them and saves the result. Answers can also be
+    evaluated one at a time during the interview and picked up at submit
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=Config.AI_EVAL_MAX_WORKERS, thread_name_prefix='ai-eval')
+
+    @staticmethod
+    def score_answer(question, answer, mode, use_ai=True):
+        """
+        Score one answer. mode is 'short-answer' for the written interview
+        or 'voice' for the voice interview. Returns score (0-20) and feedback
+        """
+        text = answer.get('text', '')
+
+        if mode == 'voice':
+            if not text.strip():
+                return {'score': 0, 'feedback': 'No answer provided'}
+            evaluation = AIService.evaluate_answer(question.get('question', ''), text, 'voice')
+            return EvaluationService._ai_result(evaluation)
+
+        if answer.get('type') == 'multiple-choice':
+            if answer.get('correct', False):
+                return {'score': 20, 'feedback': 'Correct answer'}
+            return {'score': 0, 'feedback': 'Incorrect answer'}
+
+        if use_ai and text.strip():
+            evaluation = AIService.evaluate_answer(question.get('question', ''), text, 'short-answer')
+            return EvaluationService._ai_result(evaluation)
+
+        # Fallback scoring with validation
+        evaluation = AIService._fallback_evaluation(text)
+        return {
+            'score': evaluation.get('score', 0),
+            'feedback': evaluation.get('feedback', 'Answer evaluated')
+        }
+
+    @staticmethod
+    def _ai_result(evaluation):
+        return {
+            'score': evaluation.get('score', 10),
+            'feedback': evaluation.get('feedback', 'Answer evaluated')
+        }
+
+    @staticmethod
+    def _needs_ai(answer, mode, use_ai):
+        """Whether scoring this answer makes an AI call worth running off-thread"""
+        if not answer.get('text', '').strip():
+            return False
+        if mode == 'voice':
+            return True
+        return use_ai and answer.get('type') != 'multiple-choice'
+
+    @staticmethod
+    def _local_tier(question, answer, mode, use_ai):
+        """
+        The local scorer's evaluation of a written answer bound for the AI,
+        or None if it is not confident enough and the AI should score it
+        """
+        if mode != 'short-answer' or not Config.LOCAL_SCORER_ENABLED:
+            return None
+        if not EvaluationService._needs_ai(answer, mode, use_ai):
+            return None
+        return LocalScorer.decide(question, answer.get('text', ''))
+
+    @staticmethod
+    def _fingerprint(question, answer, mode, use_ai):
+        """What an evaluation was computed from, to tell whether it still applies"""
+        return (mode, bool(use_ai), question.get('question', ''), answer.get('text', '').strip())
+
+    @staticmethod
+    def start_answer(session_id, user_id, client, index, question, answer, mode='short-answer', use_ai=True):
+        """
+        Start evaluating one answer in the background and keep it against
+        the interview session for the final submit. The session slot is
+        claimed first, so nothing is evaluated when InterviewSessions turns
+        it down. Returns False when the answer is scored locally at submit
+        anyway or the session was not accepted
+        """
+        if not EvaluationService._needs_ai(answer, mode, use_ai):
+            return False
+
+        future = Future()
+        fingerprint = EvaluationService._fingerprint(question, answer, mode, use_ai)
+        if not InterviewSessions.put(session_id, user_id, client, index, fingerprint, future):
+            return False
+
+        local = EvaluationService._local_tier(question, answer, mode, use_ai)
+        if local is not None:
+            future.set_result(local)
+        else:
+            EvaluationService._executor.submit(
+                EvaluationService._resolve, future, question, answer, mode, use_ai
+            )
+        return True
+
+    @staticmethod
+    def _resolve(future, question, answer, mode, use_ai):
+        try:
+            future.set_result(EvaluationService.score_answer(question, answer, mode, use_ai))
+        except Exception as e:
+            future.set_exception(e)
+
+    @staticmethod
+    def _take_started(session_id, user_id, answers, questions, mode, use_ai):
+        """Evaluations started during the interview that still match the submitted answers"""
+        if not session_id:
+            return {}
+        fingerprints = {
+            i: EvaluationService._fingerprint(questions[i], answer, mode, use_ai)
+            for i, answer in enumerate(answers)
+            if EvaluationService._needs_ai(answer, mode, use_ai)
+        }
+        return InterviewSessions.take(session_id, user_id, fingerprints)
+
+    @staticmethod
+    def iter_evaluations(answers, questions, mode='short-answer', use_ai=True, concurrency=None, started=None):
+        """
+        Yield (index, evaluation) pairs as each answer finishes scoring.
+        Local scoring is yielded first, including written answers the local
+        scorer is confident about. started maps indexes to evaluations
+        already running from the interview session; those are awaited
+        rather than repeated. In batch mode the other AI answers are scored
+        in one request first; whatever it misses, or every AI answer in
+        concurrent mode, is scored per answer with at most `concurrency`
+        calls from this submission in flight at once
+        """
+        limit = max(1, concurrency or Config.AI_EVAL_CONCURRENCY_PER_REQUEST)
+        started = started or {}
+        pending = []
+
+        for i, answer in enumerate(answers):
+            question = questions[i]
+            if i in started:
+                continue
+            local = EvaluationService._local_tier(question, answer, mode, use_ai)
+            if local is not None:
+                yield i, local
+            elif EvaluationService._needs_ai(answer, mode, use_ai):
+                pending.append((i, question, answer))
+            else:
+                yield i, EvaluationService.score_answer(question, answer, mode, use_ai)
+
+        running = {}
+        for i, future in started.items():
+            if future.done():
+                yield i, future.result()
+            else:
+                running[future] = i
+
+        if Config.AI_EVAL_MODE == 'batch' and len(pending) > 1:
+            evaluations = AIService.evaluate_answers_batch([
+                (question.get('question', ''), answer.get('text', ''))
+                for _, question, answer in pending
+            ])
+            remaining = []
+            for item, evaluation in zip(pending, evaluations):
+                if evaluation is None:
+                    remaining.append(item)
+                else:
+                    yield item[0], EvaluationService._ai_result(evaluation)
+            pending = remaining
+
+        pending.reverse()
+        # Session evaluations were submitted earlier, so only this submission's own calls count toward the limit
+        in_flight = dict(running)
+        submitted = set()
+        while pending or in_flight:
+            while pending and len(submitted) < limit:
+                i, question, answer = pending.pop()
+                future = EvaluationService._executor.submit(
+                    EvaluationService.score_answer, question, answer, mode, use_ai
+                )
+                in_flight[future] = i
+                submitted.add(future)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                submitted.discard(future)
+                yield in_flight.pop(future), future.result()
+
+    @staticmethod
+    def evaluate_answers(answers, questions, mode='short-answer', use_ai=True, concurrency=None):
+        """
+        Score all answers concurrently and return (evaluated_answers, total_score)
+        with the evaluated answers in question order
+        """
+        evaluations = [None] * len(answers)
+        for i, evaluation in EvaluationService.iter_evaluations(answers, questions, mode, use_ai, concurrency):
+            evaluations[i] = evaluation
+
+        return EvaluationService._merge_evaluations(answers, evaluations)
+
+    @staticmethod
+    def _merge_evaluations(answers, evaluations):
+        total_score = 0
+        evaluated_answers = []
+        for answer, evaluation in zip(answers, evaluations):
+            total_score += evaluation['score']
+            evaluated_answers.append({
+                **answer,
+                'score': evaluation['score'],
+                'feedback': evaluation['feedback']
+            })
+
+        return evaluated_answers, total_score
+
+    @staticmethod
+    def start_report(answers, questions, role, difficulty, use_ai=True):
+        """
+        Start generating the report on the shared pool. It only needs the raw
+        answers, so it can run while the answers are still being scored
+        """
+        if use_ai:
+            return EvaluationService._executor.submit(
+                AIService.generate_comprehensive_report, answers, questions, role, difficulty
+            )
+
+        future = Future()
+        future.set_result(AIService._fallback_report())
+        return future
+
+    @staticmethod
+    def iter_submission(user_id, answers, questions, role, difficulty, mode='short-answer', use_ai=True,
+                        session_id=None, result_id=None):
+        """
+        Score, report on and save one submission, yielding (event, data) as
+        each stage finishes: an 'answer' per evaluated answer in completion
+        order, then the 'report', then the 'result' (None if saving failed).
+        Answers already evaluated under session_id are not evaluated again.
+        A fixed result_id makes a repeated run save nothing new
+        """
+        report_future = EvaluationService.start_report(answers, questions, role, difficulty, use_ai)
+        started = EvaluationService._take_started(session_id, user_id, answers, questions, mode, use_ai)
+
+        evaluations = [None] * len(answers)
+        for i, evaluation in EvaluationService.iter_evaluations(answers, questions, mode, use_ai, started=started):
+            evaluations[i] = evaluation
+            yield 'answer', {'index': i, **evaluation}
+
+        evaluated_answers, total_score = EvaluationService._merge_evaluations(answers, evaluations)
+
+        # Normalize score to 100
+        final_score = min(100, int((total_score / 200) * 100))
+
+        # Get company recommendations
+        companies = InterviewService.get_companies(final_score, role)
+
+        report = report_future.result()
+        detailed_feedback = {
+            'summary': report.get('summary', ''),
+            'strengths': report.get('strengths', []),
+            'improvements': report.get('improvements', []),
+            'recommendations': report.get('recommendations', [])
+        }
+        yield 'report', detailed_feedback
+
+        result = InterviewService.save_result(
+            user_id,
+            final_score,
+            detailed_feedback,
+            companies,
+            evaluated_answers,
+            questions,
+            role,
+            difficulty,
+            result_id
+        )
+
+        if result:
+            result['detailed_feedback'] = detailed_feedback
+            result['evaluated_answers'] = evaluated_answers
+        yield 'result', result
+
+    @staticmethod
+    def process_submission(user_id, answers, questions, role, difficulty, mode='short-answer', use_ai=True,
+                           session_id=None):
+        """
+        Score, report on and save one submission. Returns the saved result
+        with detailed_feedback and evaluated_answers, or None if saving failed
+        """
+        result = None
+        submission = EvaluationService.iter_submission(
+            user_id, answers, questions, role, difficulty, mode, use_ai, session_id
+        )
+        for event, data in submission:
+            if event == 'result':
+                result = data
+        return result
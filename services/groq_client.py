@@ -0,0 +1,190 @@
+import time
+import json
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from config import Config
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.rate_limiter import RateLimiter
+
+class GroqClient:
+    """
+    Shared HTTP client for the Groq API. One pooled keep-alive session per
+    worker process, so calls reuse TCP+TLS connections instead of opening a
+    new one per request. Each backend gets a circuit breaker so a degraded
+    API fails fast instead of waiting out every timeout, and all calls share
+    a rate limiter that keeps the process inside the API's request and
+    token budgets
+    """
+
+    _session = None
+    _breakers = {}
+    _lock = threading.Lock()
+    limiter = RateLimiter(
+        Config.GROQ_REQUESTS_PER_MINUTE,
+        Config.GROQ_TOKENS_PER_MINUTE,
+        Config.GROQ_RATE_LIMIT_MAX_WAIT_SECONDS
+    )
+    _retries = {'rate_limited': 0, 'retried': 0}
+
+    @staticmethod
+    def get_session():
+        if GroqClient._session is None:
+            with GroqClient._lock:
+                if GroqClient._session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=Config.GROQ_POOL_CONNECTIONS,
+                        pool_maxsize=Config.GROQ_POOL_SIZE
+                    )
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    GroqClient._session = session
+        return GroqClient._session
+
+    @staticmethod
+    def get_breaker(url, api_key, name=None):
+        """
+        The breaker for a backend, keyed by its name (the URL when unnamed).
+        Backends sharing a URL still fail and recover separately, and each
+        is probed with its own key
+        """
+        name = name or url
+        with GroqClient._lock:
+            breaker = GroqClient._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    name,
+                    lambda: GroqClient._probe(url, api_key),
+                    window_seconds=Config.GROQ_BREAKER_WINDOW_SECONDS,
+                    min_calls=Config.GROQ_BREAKER_MIN_CALLS,
+                    error_rate=Config.GROQ_BREAKER_ERROR_RATE,
+                    slow_call_seconds=Config.GROQ_BREAKER_SLOW_CALL_SECONDS,
+                    slow_call_rate=Config.GROQ_BREAKER_SLOW_CALL_RATE,
+                    open_seconds=Config.GROQ_BREAKER_OPEN_SECONDS
+                )
+                GroqClient._breakers[name] = breaker
+            return breaker
+
+    @staticmethod
+    def breaker_stats():
+        with GroqClient._lock:
+            breakers = list(GroqClient._breakers.values())
+        return [breaker.stats() for breaker in breakers]
+
+    @staticmethod
+    def post_chat(url, api_key, payload, read_timeout, stream=False, limiter=None, backend=None):
+        """
+        POST a chat-completions payload, returning the raw response.
+        Waits for rate-limit budget first (the shared Groq budget unless a
+        backend brings its own limiter) and retries 429s after their
+        Retry-After. Raises CircuitOpenError without calling out while the
+        circuit is open, and RateLimitExceeded if the budget wait is too long.
+        `backend` names the backend whose circuit guards the call
+        """
+        breaker = GroqClient.get_breaker(url, api_key, backend)
+        limiter = limiter or GroqClient.limiter
+        tokens = GroqClient.estimate_tokens(payload)
+
+        for attempt in range(Config.GROQ_MAX_RETRIES + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f'Circuit open for {breaker.name}')
+
+            limiter.acquire(tokens)
+
+            start = time.time()
+            try:
+                response = GroqClient.get_session().post(
+                    url,
+                    headers=GroqClient._headers(api_key),
+                    json=payload,
+                    timeout=(Config.GROQ_CONNECT_TIMEOUT, read_timeout),
+                    stream=stream
+                )
+            except requests.RequestException:
+                breaker.record(False, time.time() - start)
+                raise
+
+            breaker.record(response.status_code < 500, time.time() - start)
+            if response.status_code != 429:
+                return response
+
+            with GroqClient._lock:
+                GroqClient._retries['rate_limited'] += 1
+
+            delay = GroqClient._retry_delay(response, attempt)
+            if attempt == Config.GROQ_MAX_RETRIES or delay > Config.GROQ_RETRY_MAX_DELAY_SECONDS:
+                return response
+
+            with GroqClient._lock:
+                GroqClient._retries['retried'] += 1
+            # A streamed response holds its pooled connection until closed
+            response.close()
+            limiter.pause(delay)
+
+        return response
+
+    @staticmethod
+    def stream_chat(url, api_key, payload, read_timeout, limiter=None, backend=None):
+        """
+        Stream a chat completion, yielding content deltas as they arrive.
+        Raises requests.HTTPError on a non-200 response
+        """
+        response = GroqClient.post_chat(
+            url, api_key, {**payload, 'stream': True}, read_timeout, stream=True, limiter=limiter, backend=backend
+        )
+        with response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[5:].strip()
+                if data == '[DONE]':
+                    return
+                delta = json.loads(data)['choices'][0].get('delta', {}).get('content')
+                if delta:
+                    yield delta
+
+    @staticmethod
+    def estimate_tokens(payload):
+        """Prompt tokens (about 4 characters each) plus the completion budget"""
+        prompt_chars = sum(len(message.get('content', '')) for message in payload.get('messages', []))
+        return prompt_chars // 4 + payload.get('max_tokens', 0)
+
+    @staticmethod
+    def rate_limit_stats():
+        with GroqClient._lock:
+            retries = dict(GroqClient._retries)
+        return {**GroqClient.limiter.stats(), **retries}
+
+    @staticmethod
+    def _retry_delay(response, attempt):
+        """Seconds to wait before retrying a 429: Retry-After if given, else exponential, plus jitter"""
+        try:
+            delay = float(response.headers.get('Retry-After', ''))
+        except ValueError:
+            delay = Config.GROQ_RETRY_BASE_DELAY_SECONDS * (2 ** attempt)
+        return delay + random.uniform(0, delay * 0.25 + 0.1)
+
+    @staticmethod
+    def _headers(api_key):
+        return {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+
+    @staticmethod
+    def _probe(url, api_key):
+        """
+        Cheap reachability check against the API's model list. Passing it
+        only lets a trial completion through; that call decides whether
+        the circuit closes
+        """
+        models_url = url.rsplit('/chat/completions', 1)[0] + '/models'
+        response = GroqClient.get_session().get(
+            models_url,
+            headers=GroqClient._headers(api_key),
+            timeout=(Config.GROQ_CONNECT_TIMEOUT, Config.GROQ_CONNECT_TIMEOUT)
+        )
+        return response.status_code == 200
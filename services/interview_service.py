@@ -1,117 +1,249 @@
 import uuid
-import json
+import base64
+from datetime import datetime
+from psycopg2.extras import Json
 from models.database import DatabaseManager
 
 class InterviewService:
+    # Fields of the stored questions and answers the results page reads
+    RESULT_QUESTION_FIELDS = ('question', 'type', 'options', 'correctAnswer')
+    RESULT_ANSWER_FIELDS = ('type', 'text', 'selectedOption', 'correct', 'score', 'feedback')
+
+    # Widths of results.role and results.difficulty (migration 4)
+    ROLE_MAX_LENGTH = 100
+    DIFFICULTY_MAX_LENGTH = 50
+
     @staticmethod
-    def save_result(user_id, score, feedback, companies, answers, questions):
+    def save_result(user_id, score, feedback, companies, answers, questions, role=None, difficulty=None,
+                    result_id=None):
+        """
+        Save a result and fold it into the user's summary. A caller that may
+        retry the same submission passes a fixed result_id: saving it again
+        changes nothing, and the summary is not counted twice
+        """
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            result_id = str(uuid.uuid4())
-            
-            cursor.execute('''
-                INSERT INTO results (id, user_id, score, feedback, companies, answers, questions)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ''', (
-                result_id, user_id, score, feedback,
-                json.dumps(companies), json.dumps(answers), json.dumps(questions)
-            ))
-            
-            conn.commit()
-            
-            cursor.execute('''
-                DELETE FROM results 
-                WHERE user_id = %s AND id NOT IN (
-                    SELECT id FROM results 
-                    WHERE user_id = %s 
-                    ORDER BY created_at DESC 
-                    LIMIT 5
-                )
-            ''', (user_id, user_id))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
+            result_id = result_id or str(uuid.uuid4())
+            # Both come from the client; an oversized value must not fail the whole save
+            role = InterviewService._label(role, InterviewService.ROLE_MAX_LENGTH)
+            difficulty = InterviewService._label(difficulty, InterviewService.DIFFICULTY_MAX_LENGTH)
+
+            # One statement in autocommit: a single round trip that also folds the score
+            # into the user's summary row. Older results are trimmed by the retention
+            # job (services/result_retention.py), not here
+            with DatabaseManager.connection(autocommit=True) as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    WITH saved AS (
+                        INSERT INTO results (id, user_id, score, feedback, companies, answers, questions, role, difficulty)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        ON CONFLICT (id) DO NOTHING
+                        RETURNING user_id, role, difficulty, score, created_at
+                    )
+                    INSERT INTO user_result_summary AS summary (user_id, role, difficulty, interviews, total_score,
+                                                                best_score, first_score, first_at, latest_score, latest_at)
+                    SELECT user_id, COALESCE(role, ''), COALESCE(difficulty, ''), 1, score,
+                           score, score, created_at, score, created_at
+                    FROM saved
+                    ON CONFLICT (user_id, role, difficulty) DO UPDATE SET
+                        interviews = summary.interviews + 1,
+                        total_score = summary.total_score + EXCLUDED.total_score,
+                        best_score = GREATEST(summary.best_score, EXCLUDED.best_score),
+                        latest_score = CASE WHEN EXCLUDED.latest_at >= summary.latest_at
+                                            THEN EXCLUDED.latest_score ELSE summary.latest_score END,
+                        latest_at = GREATEST(summary.latest_at, EXCLUDED.latest_at)
+                ''', (
+                    result_id, user_id, score,
+                    Json(feedback), Json(companies), Json(answers), Json(questions),
+                    role, difficulty
+                ))
+
             return {
                 'id': result_id,
                 'score': score,
-                'feedback': feedback,
+                'feedback': InterviewService._summary(feedback),
                 'companies': companies,
                 'answers': answers,
                 'questions': questions
             }
-            
+
         except Exception as e:
             print(f"Save result error: {e}")
             return None
 
     @staticmethod
-    def get_user_results(user_id, limit=5):
+    def get_user_results(user_id, limit=10, cursor=None):
+        """
+        One page of a user's history, newest first, as (results, next_cursor).
+        Pages are keyed on (created_at, id) of the last row, so each one is
+        an index range scan however deep the history goes; next_cursor is
+        None on the last page. Rows carry the feedback summary and the top
+        three companies only, cut down in SQL so the per-answer payloads
+        are never read or sent. Raises ValueError for a malformed cursor
+        """
+        after = InterviewService._decode_cursor(cursor) if cursor else None
+        keyset = 'AND (created_at, id) < (%s, %s)' if after else ''
+
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, score, feedback, companies, created_at
-                FROM results 
-                WHERE user_id = %s
-                ORDER BY created_at DESC
-                LIMIT %s
-            ''', (user_id, limit))
-            
+            with DatabaseManager.connection() as conn, conn.cursor() as db_cursor:
+                db_cursor.execute(f'''
+                    SELECT id, score, role, difficulty,
+                           COALESCE(feedback->>'summary', feedback #>> '{{}}'),
+                           jsonb_path_query_array(companies, '$[0 to 2]'),
+                           created_at
+                    FROM results 
+                    WHERE user_id = %s {keyset}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                ''', (user_id, *(after or ()), limit + 1))
+                rows = db_cursor.fetchall()
+
             results = []
-            for row in cursor.fetchall():
+            for row in rows[:limit]:
                 results.append({
                     'id': row[0],
                     'score': row[1],
-                    'feedback': row[2],
-                    'companies': json.loads(row[3])[:3],
-                    'created_at': str(row[4])
+                    'role': row[2],
+                    'difficulty': row[3],
+                    'feedback': row[4],
+                    'companies': row[5],
+                    'created_at': str(row[6])
                 })
-            
-            cursor.close()
-            conn.close()
-            return results
-            
+
+            next_cursor = None
+            if len(rows) > limit:
+                last = rows[limit - 1]
+                next_cursor = InterviewService._encode_cursor(last[6], last[0])
+            return results, next_cursor
+
         except Exception as e:
             print(f"Get results error: {e}")
-            return []
+            return [], None
+
+    @staticmethod
+    def get_user_summary(user_id):
+        """
+        Interview count and average, best, first and latest score, overall
+        and per role and difficulty, read from the user's summary rows
+        rather than aggregated over results. Covers every interview taken,
+        including ones the retention policy has since deleted. None on error
+        """
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT role, difficulty, interviews, total_score, best_score,
+                           first_score, first_at, latest_score, latest_at
+                    FROM user_result_summary
+                    WHERE user_id = %s
+                    ORDER BY latest_at DESC
+                ''', (user_id,))
+                rows = cursor.fetchall()
+
+            by_level = []
+            for row in rows:
+                by_level.append({
+                    'role': row[0] or None,
+                    'difficulty': row[1] or None,
+                    'interviews': row[2],
+                    'average_score': round(row[3] / row[2], 1),
+                    'best_score': row[4],
+                    'latest_score': row[7],
+                    'latest_at': str(row[8])
+                })
+
+            if not rows:
+                return {'interviews': 0, 'average_score': 0, 'best_score': 0, 'first_score': None,
+                        'latest_score': None, 'latest_at': None, 'by_level': []}
+
+            interviews = sum(row[2] for row in rows)
+            first = min(rows, key=lambda row: row[6])
+            return {
+                'interviews': interviews,
+                'average_score': round(sum(row[3] for row in rows) / interviews, 1),
+                'best_score': max(row[4] for row in rows),
+                'first_score': first[5],
+                'latest_score': rows[0][7],
+                'latest_at': str(rows[0][8]),
+                'by_level': by_level
+            }
+
+        except Exception as e:
+            print(f"Get summary error: {e}")
+            return None
 
     @staticmethod
     def get_result_by_id(result_id):
+        """
+        One result for the results page, with its questions and answers
+        projected in SQL to the fields the page reads
+        """
+        answers = InterviewService._project_sql('answers', InterviewService.RESULT_ANSWER_FIELDS)
+        questions = InterviewService._project_sql('questions', InterviewService.RESULT_QUESTION_FIELDS)
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, score, feedback, companies, answers, questions, created_at
-                FROM results 
-                WHERE id = %s
-            ''', (result_id,))
-            
-            row = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute(f'''
+                    SELECT id, score,
+                           COALESCE(feedback->>'summary', feedback #>> '{{}}'),
+                           CASE WHEN jsonb_typeof(feedback) = 'object' THEN feedback END,
+                           companies,
+                           ({answers}),
+                           ({questions}),
+                           created_at
+                    FROM results 
+                    WHERE id = %s
+                ''', (result_id,))
+                row = cursor.fetchone()
+
             if row:
                 return {
                     'id': row[0],
                     'score': row[1],
                     'feedback': row[2],
-                    'companies': json.loads(row[3]),
-                    'answers': json.loads(row[4]),
-                    'questions': json.loads(row[5]),
-                    'created_at': str(row[6])
+                    'detailed_feedback': row[3],
+                    'companies': row[4],
+                    'answers': row[5],
+                    'questions': row[6],
+                    'created_at': str(row[7])
                 }
             return None
-            
+
         except Exception as e:
             print(f"Get result by ID error: {e}")
             return None
 
+    @staticmethod
+    def _project_sql(column, fields):
+        """SQL for a JSONB array of objects cut down to the given keys, in order; absent keys are left out"""
+        pairs = ', '.join(f"'{field}', item->'{field}'" for field in fields)
+        return f'''
+            SELECT COALESCE(jsonb_agg(jsonb_strip_nulls(jsonb_build_object({pairs})) ORDER BY position), '[]')
+            FROM jsonb_array_elements({column}) WITH ORDINALITY AS elements(item, position)
+        '''
+
+    @staticmethod
+    def _encode_cursor(created_at, result_id):
+        return base64.urlsafe_b64encode(f'{created_at.isoformat()}|{result_id}'.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        """(created_at, id) from a history cursor. Raises ValueError if it is not one"""
+        try:
+            created_at, result_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|', 1)
+            return datetime.fromisoformat(created_at), result_id
+        except (ValueError, UnicodeError) as e:
+            raise ValueError(f'Invalid history cursor: {cursor}') from e
+
+    @staticmethod
+    def _label(value, max_length):
+        """A role or difficulty trimmed to fit its column, or None if it is not a non-empty string"""
+        if not isinstance(value, str) or not value.strip():
+            return None
+        return value.strip()[:max_length]
+
+    @staticmethod
+    def _summary(feedback):
+        if isinstance(feedback, dict):
+            return feedback.get('summary', '')
+        return feedback
+
     @staticmethod
     def calculate_score(answers):
         if not answers:
@@ -0,0 +1,120 @@
+import time
+import threading
+from collections import OrderedDict, Counter
+from config import Config
+
+class InterviewSessions:
+    """
+    Answer evaluations started while an interview is still in progress,
+    keyed by the interview's session id and question index. Each entry
+    keeps the question and answer it was started for, so the final submit
+    only reuses it if the answer was not edited afterwards. A session
+    belongs to the user who opened it, and each user and each client
+    address may only hold a few open sessions at once
+    """
+
+    # Questions in one interview; answer indexes past it are rejected
+    MAX_ANSWERS = 10
+
+    _sessions = OrderedDict()
+    _open = Counter()
+    _lock = threading.Lock()
+    _counters = {'started': 0, 'reused': 0, 'stale': 0, 'expired': 0, 'rejected': 0}
+
+    @staticmethod
+    def put(session_id, user_id, client, index, fingerprint, future):
+        """
+        Store the evaluation future for one answer, replacing any earlier
+        one. Returns False, storing nothing, when the index is out of range,
+        the session belongs to another user, or opening it would take the
+        user or client past INTERVIEW_SESSIONS_PER_CLIENT
+        """
+        with InterviewSessions._lock:
+            now = time.time()
+            InterviewSessions._discard_expired(now)
+
+            session = InterviewSessions._sessions.get(session_id)
+            if not 0 <= index < InterviewSessions.MAX_ANSWERS:
+                return InterviewSessions._reject()
+
+            if session is None:
+                owners = (('user', user_id), ('client', client))
+                if any(InterviewSessions._open[owner] >= Config.INTERVIEW_SESSIONS_PER_CLIENT for owner in owners):
+                    return InterviewSessions._reject()
+                session = {'user_id': user_id, 'owners': owners, 'updated_at': now, 'answers': {}}
+                InterviewSessions._sessions[session_id] = session
+                InterviewSessions._open.update(owners)
+            elif session['user_id'] != user_id:
+                return InterviewSessions._reject()
+
+            session['answers'][index] = (fingerprint, future)
+            session['updated_at'] = now
+            InterviewSessions._sessions.move_to_end(session_id)
+            InterviewSessions._counters['started'] += 1
+
+            while len(InterviewSessions._sessions) > Config.INTERVIEW_SESSION_MAX:
+                InterviewSessions._drop(next(iter(InterviewSessions._sessions)))
+                InterviewSessions._counters['expired'] += 1
+            return True
+
+    @staticmethod
+    def take(session_id, user_id, fingerprints):
+        """
+        Remove a session and return {index: future} for the answers whose
+        fingerprint still matches. fingerprints maps index to the
+        fingerprint of the answer as submitted
+        """
+        if not session_id:
+            return {}
+
+        with InterviewSessions._lock:
+            InterviewSessions._discard_expired(time.time())
+            session = InterviewSessions._sessions.get(session_id)
+            if session is None or session['user_id'] != user_id:
+                return {}
+            InterviewSessions._drop(session_id)
+
+            matched = {}
+            for index, (fingerprint, future) in session['answers'].items():
+                if fingerprints.get(index) == fingerprint:
+                    matched[index] = future
+                else:
+                    InterviewSessions._counters['stale'] += 1
+            InterviewSessions._counters['reused'] += len(matched)
+            return matched
+
+    @staticmethod
+    def stats():
+        with InterviewSessions._lock:
+            return {
+                **InterviewSessions._counters,
+                'sessions': len(InterviewSessions._sessions),
+                'answers': sum(len(s['answers']) for s in InterviewSessions._sessions.values())
+            }
+
+    @staticmethod
+    def _reject():
+        """Caller holds the lock"""
+        InterviewSessions._counters['rejected'] += 1
+        return False
+
+    @staticmethod
+    def _drop(session_id):
+        """Remove a session and release its owners' slots. Caller holds the lock"""
+        session = InterviewSessions._sessions.pop(session_id)
+        InterviewSessions._open.subtract(session['owners'])
+        for owner in session['owners']:
+            if InterviewSessions._open[owner] <= 0:
+                del InterviewSessions._open[owner]
+
+    @staticmethod
+    def _discard_expired(now):
+        """Drop sessions idle past the TTL. Caller holds the lock"""
+        cutoff = now - Config.INTERVIEW_SESSION_TTL_SECONDS
+        sessions = InterviewSessions._sessions
+        while sessions:
+            session_id, session = next(iter(sessions.items()))
+            if session['updated_at'] >= cutoff:
+                break
+            InterviewSessions._drop(session_id)
+            InterviewSessions._counters['expired'] += 1
@@ -0,0 +1,183 @@
+import time
+import uuid
+import json
+import threading
+from config import Config
+from models.database import DatabaseManager
+from services.evaluation_service import EvaluationService
+
+class JobQueue:
+    """
+    Durable queue for interview submissions. Jobs live in the submission_jobs
+    table and are claimed by a pool of worker threads with a lease, so a
+    job held by a crashed or restarted worker is picked up again once its
+    lease runs out. A job's result id is derived from its id, so a job
+    re-run after its result was saved does not save a second one
+    """
+
+    # Namespace for the uuid5 result id of each job
+    RESULT_ID_NAMESPACE = uuid.UUID('6f1d8a52-4c1e-4b8e-9a57-0d6c2e3b9f14')
+
+    _workers = []
+    _wakeup = threading.Event()
+
+    @staticmethod
+    def enqueue(user_id, mode, payload):
+        """
+        Queue a submission. Returns the job id, or None when the queue is
+        full or the job could not be stored
+        """
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT COUNT(*) FROM submission_jobs WHERE status IN ('queued', 'running')
+                ''')
+                if cursor.fetchone()[0] >= Config.JOB_QUEUE_MAX_DEPTH:
+                    return None
+
+                job_id = str(uuid.uuid4())
+                cursor.execute('''
+                    INSERT INTO submission_jobs (id, user_id, mode, payload)
+                    VALUES (%s, %s, %s, %s)
+                ''', (job_id, user_id, mode, json.dumps(payload)))
+
+                conn.commit()
+
+            JobQueue._wakeup.set()
+            return job_id
+
+        except Exception as e:
+            print(f"Enqueue job error: {e}")
+            return None
+
+    @staticmethod
+    def get_job(job_id):
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT id, status, result_id, error, attempts, created_at, finished_at
+                    FROM submission_jobs
+                    WHERE id = %s
+                ''', (job_id,))
+                row = cursor.fetchone()
+
+            if row:
+                return {
+                    'id': row[0],
+                    'status': row[1],
+                    'result_id': row[2],
+                    'error': row[3],
+                    'attempts': row[4],
+                    'created_at': str(row[5]),
+                    'finished_at': str(row[6]) if row[6] else None
+                }
+            return None
+
+        except Exception as e:
+            print(f"Get job error: {e}")
+            return None
+
+    @staticmethod
+    def start():
+        """Start the worker threads for this process"""
+        if JobQueue._workers:
+            return
+
+        for n in range(Config.JOB_WORKERS):
+            worker = threading.Thread(target=JobQueue._work, name=f'job-worker-{n}', daemon=True)
+            worker.start()
+            JobQueue._workers.append(worker)
+
+    @staticmethod
+    def _work():
+        while True:
+            job = JobQueue._claim()
+            if job is None:
+                JobQueue._wakeup.wait(Config.JOB_POLL_SECONDS)
+                JobQueue._wakeup.clear()
+                continue
+
+            job_id, user_id, mode, payload, attempts = job
+            if attempts > Config.JOB_MAX_ATTEMPTS:
+                JobQueue._finish(job_id, 'failed', error='Gave up after repeated attempts')
+                continue
+
+            try:
+                JobQueue._run(job_id, user_id, mode, json.loads(payload))
+            except Exception as e:
+                print(f"Job {job_id} error: {e}")
+                JobQueue._finish(job_id, 'failed', error='Failed to process submission')
+
+    @staticmethod
+    def _run(job_id, user_id, mode, payload):
+        deadline = time.time() + Config.JOB_TIMEOUT_SECONDS
+        submission = EvaluationService.iter_submission(
+            user_id,
+            payload.get('answers', []),
+            payload.get('questions', []),
+            payload.get('role', 'Software Engineer'),
+            payload.get('difficulty', 'Beginner'),
+            mode,
+            payload.get('use_ai', True),
+            payload.get('session_id'),
+            str(uuid.uuid5(JobQueue.RESULT_ID_NAMESPACE, str(job_id)))
+        )
+
+        for event, data in submission:
+            if event == 'result':
+                if data:
+                    JobQueue._finish(job_id, 'done', result_id=data['id'])
+                else:
+                    JobQueue._finish(job_id, 'failed', error='Failed to save result')
+                return
+
+            # The report is the last stage before saving; stop there if the job overran
+            if time.time() > deadline:
+                submission.close()
+                JobQueue._finish(job_id, 'failed', error='Timed out')
+                return
+
+    @staticmethod
+    def _claim():
+        """Lease the oldest queued job, or one whose lease has expired"""
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE submission_jobs
+                    SET status = 'running',
+                        attempts = attempts + 1,
+                        started_at = CURRENT_TIMESTAMP,
+                        locked_until = CURRENT_TIMESTAMP + make_interval(secs => %s)
+                    WHERE id = (
+                        SELECT id FROM submission_jobs
+                        WHERE status = 'queued' OR (status = 'running' AND locked_until < CURRENT_TIMESTAMP)
+                        ORDER BY created_at
+                        FOR UPDATE SKIP LOCKED
+                        LIMIT 1
+                    )
+                    RETURNING id, user_id, mode, payload, attempts
+                ''', (Config.JOB_TIMEOUT_SECONDS * 2,))
+
+                job = cursor.fetchone()
+                conn.commit()
+            return job
+
+        except Exception as e:
+            print(f"Claim job error: {e}")
+            time.sleep(Config.JOB_POLL_SECONDS)
+            return None
+
+    @staticmethod
+    def _finish(job_id, status, result_id=None, error=None):
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE submission_jobs
+                    SET status = %s, result_id = %s, error = %s,
+                        finished_at = CURRENT_TIMESTAMP, locked_until = NULL
+                    WHERE id = %s
+                ''', (status, result_id, error, job_id))
+                conn.commit()
+
+        except Exception as e:
+            print(f"Finish job error: {e}")
@@ -0,0 +1,75 @@
+import json
+
+class JsonArrayItemParser:
+    """
+    Incrementally pulls the items out of a JSON array as text arrives, e.g.
+    from a streamed LLM completion. Anything before the first '[' (prose,
+    a ```json fence) is ignored, and each top-level item is parsed on its
+    own, so one malformed item does not cost the rest of the array
+    """
+
+    def __init__(self):
+        self.malformed = 0
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item = []
+
+    def feed(self, text):
+        """Consume more text and return the items completed by it"""
+        items = []
+        for char in text:
+            if self._finished:
+                break
+
+            if not self._started:
+                if char == '[':
+                    self._started = True
+                continue
+
+            if self._in_string:
+                self._item.append(char)
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if self._depth == 0:
+                # Between items: separators and whitespace, or the end of the array
+                if char == ']':
+                    self._finished = True
+                elif char in '{[':
+                    self._item = [char]
+                    self._depth = 1
+                continue
+
+            self._item.append(char)
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    items.extend(self._parse_item())
+
+        return items
+
+    def _parse_item(self):
+        text = ''.join(self._item)
+        self._item = []
+        try:
+            return [json.loads(text)]
+        except ValueError:
+            self.malformed += 1
+            return []
+
+
+def parse_json_array_items(text):
+    """Return every well-formed item of the JSON array in text"""
+    return JsonArrayItemParser().feed(text)
@@ -0,0 +1,157 @@
+import time
+import json
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from config import Config
+from models.database import DatabaseManager
+
+class LLMCache:
+    """
+    Content-addressed cache for LLM results. Keys hash the model, prompt
+    template version and the normalized inputs, so identical work is only
+    paid for once. In-process LRU with a TTL, optionally backed by the
+    llm_cache table so entries survive restarts and are shared by workers.
+    Expired rows are deleted by prune, run from the background maintenance
+    loop in ResultRetention
+    """
+
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+    _counters = {'hits': 0, 'misses': 0, 'persistent_hits': 0, 'evictions': 0, 'expired': 0, 'pruned': 0}
+
+    @staticmethod
+    def normalize(text):
+        """Normalize answer text so formatting-only differences share a key"""
+        return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+    @staticmethod
+    def make_key(kind, model, prompt_version, *parts):
+        payload = json.dumps([kind, model, prompt_version, *parts], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get(key):
+        """Return a copy of the cached value, or None on a miss"""
+        return LLMCache.get_any([key])
+
+    @staticmethod
+    def get_any(keys):
+        """
+        Return a copy of the value under the first of `keys` that has one,
+        or None on a miss. Used with one key per model that could have
+        produced the result
+        """
+        if not Config.LLM_CACHE_ENABLED or not keys:
+            return None
+
+        now = time.time()
+        with LLMCache._lock:
+            for key in keys:
+                entry = LLMCache._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] > now:
+                    LLMCache._entries.move_to_end(key)
+                    LLMCache._counters['hits'] += 1
+                    return json.loads(entry[1])
+                del LLMCache._entries[key]
+                LLMCache._counters['expired'] += 1
+
+        found = LLMCache._load_persistent(keys) if Config.LLM_CACHE_PERSISTENT else None
+
+        with LLMCache._lock:
+            if found is None:
+                LLMCache._counters['misses'] += 1
+                return None
+            LLMCache._counters['persistent_hits'] += 1
+
+        key, value = found
+        LLMCache._store(key, json.dumps(value))
+        return value
+
+    @staticmethod
+    def put(key, value):
+        if not Config.LLM_CACHE_ENABLED:
+            return
+
+        serialized = json.dumps(value)
+        LLMCache._store(key, serialized)
+        if Config.LLM_CACHE_PERSISTENT:
+            LLMCache._save_persistent(key, serialized)
+
+    @staticmethod
+    def prune():
+        """Delete llm_cache rows older than the TTL. Returns the number deleted, or None on error"""
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    DELETE FROM llm_cache
+                    WHERE created_at <= NOW() - make_interval(secs => %s)
+                ''', (Config.LLM_CACHE_TTL_SECONDS,))
+                deleted = cursor.rowcount
+                conn.commit()
+
+        except Exception as e:
+            print(f"LLM cache prune error: {e}")
+            return None
+
+        with LLMCache._lock:
+            LLMCache._counters['pruned'] += deleted
+        return deleted
+
+    @staticmethod
+    def stats():
+        with LLMCache._lock:
+            lookups = LLMCache._counters['hits'] + LLMCache._counters['persistent_hits'] + LLMCache._counters['misses']
+            hits = lookups - LLMCache._counters['misses']
+            return {
+                **LLMCache._counters,
+                'entries': len(LLMCache._entries),
+                'hit_rate': round(hits / lookups, 4) if lookups else 0.0
+            }
+
+    @staticmethod
+    def _store(key, serialized):
+        # Values are kept serialized so callers can never mutate a cached entry
+        with LLMCache._lock:
+            LLMCache._entries[key] = (time.time() + Config.LLM_CACHE_TTL_SECONDS, serialized)
+            LLMCache._entries.move_to_end(key)
+            while len(LLMCache._entries) > Config.LLM_CACHE_MAX_ENTRIES:
+                LLMCache._entries.popitem(last=False)
+                LLMCache._counters['evictions'] += 1
+
+    @staticmethod
+    def _load_persistent(keys):
+        """(key, value) for the first of `keys` stored and unexpired, or None"""
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT key, value FROM llm_cache
+                    WHERE key = ANY(%s) AND created_at > NOW() - make_interval(secs => %s)
+                ''', (list(keys), Config.LLM_CACHE_TTL_SECONDS))
+                rows = dict(cursor.fetchall())
+
+            for key in keys:
+                if key in rows:
+                    return key, json.loads(rows[key])
+            return None
+
+        except Exception as e:
+            print(f"LLM cache read error: {e}")
+            return None
+
+    @staticmethod
+    def _save_persistent(key, serialized):
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    INSERT INTO llm_cache (key, value)
+                    VALUES (%s, %s)
+                    ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, created_at = CURRENT_TIMESTAMP
+                ''', (key, serialized))
+                conn.commit()
+
+        except Exception as e:
+            print(f"LLM cache write error: {e}")
@@ -0,0 +1,298 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import requests
+from config import Config
+from services.groq_client import GroqClient
+from services.circuit_breaker import CircuitOpenError
+from services.rate_limiter import RateLimiter, RateLimitExceeded
+
+class LLMBackend:
+    """
+    One OpenAI-compatible endpoint and model, with latency and error EWMAs
+    per call type ('generation', 'evaluation', 'report') and a window of
+    recent latencies for percentiles
+    """
+
+    CALL_TYPES = ('generation', 'evaluation', 'report')
+
+    def __init__(self, name, url, api_key, model, call_types=CALL_TYPES, limiter=None):
+        self.name = name
+        self.url = url
+        self.api_key = api_key
+        self.model = model
+        self.call_types = tuple(call_types)
+        self.limiter = limiter
+
+        self._latency = {}
+        self._recent = {call_type: deque(maxlen=200) for call_type in LLMBackend.CALL_TYPES}
+        self._error_rate = 0.0
+        self._last_failure = 0.0
+        self._calls = 0
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    def record(self, call_type, success, latency):
+        alpha = Config.LLM_ROUTER_EWMA_ALPHA
+        with self._lock:
+            self._calls += 1
+            self._error_rate = alpha * (0 if success else 1) + (1 - alpha) * self._error_rate
+            if success:
+                previous = self._latency.get(call_type)
+                self._latency[call_type] = latency if previous is None else alpha * latency + (1 - alpha) * previous
+                self._recent[call_type].append(latency)
+            else:
+                self._failures += 1
+                self._last_failure = time.time()
+
+    def healthy(self):
+        """Closed circuit, and either a low error EWMA or a quiet cooldown since the last failure"""
+        if not GroqClient.get_breaker(self.url, self.api_key, self.name).is_closed():
+            return False
+        with self._lock:
+            if self._error_rate < Config.LLM_ROUTER_MAX_ERROR_RATE:
+                return True
+            return time.time() - self._last_failure >= Config.LLM_ROUTER_COOLDOWN_SECONDS
+
+    def latency(self, call_type):
+        """EWMA latency for a call type, or None before its first success"""
+        with self._lock:
+            return self._latency.get(call_type)
+
+    def percentile(self, call_type, pct, min_samples=20):
+        with self._lock:
+            samples = sorted(self._recent[call_type])
+        if len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+    def stats(self):
+        p95 = {}
+        for call_type in self.call_types:
+            value = self.percentile(call_type, 95)
+            if value is not None:
+                p95[call_type] = round(value, 3)
+
+        with self._lock:
+            latency = {call_type: round(value, 3) for call_type, value in self._latency.items()}
+            error_rate = self._error_rate
+            calls, failures = self._calls, self._failures
+        return {
+            'name': self.name,
+            'model': self.model,
+            'call_types': list(self.call_types),
+            'healthy': self.healthy(),
+            'calls': calls,
+            'failures': failures,
+            'error_rate_ewma': round(error_rate, 4),
+            'latency_ewma_seconds': latency,
+            'p95_seconds': p95
+        }
+
+
+class LLMRouter:
+    """
+    Sends each chat call to the fastest healthy backend that serves its
+    call type, failing over down the ranking when a backend returns
+    nothing. Evaluation calls can be hedged: if the first backend has not
+    answered by its p95 latency, the same request goes to the next one and
+    whichever answers first wins
+    """
+
+    _backends = None
+    _lock = threading.Lock()
+    _executor = ThreadPoolExecutor(max_workers=Config.AI_EVAL_MAX_WORKERS * 2, thread_name_prefix='llm-hedge')
+    _counters = {'hedged': 0, 'hedge_wins': 0, 'failovers': 0}
+
+    @staticmethod
+    def backends():
+        if LLMRouter._backends is None:
+            with LLMRouter._lock:
+                if LLMRouter._backends is None:
+                    LLMRouter._backends = LLMRouter._load_backends()
+        return LLMRouter._backends
+
+    @staticmethod
+    def _load_backends():
+        """
+        Backends from LLM_BACKENDS, a JSON list of objects with name, url,
+        model and api_key or api_key_env, plus optional call_types and
+        requests_per_minute/tokens_per_minute for a budget of its own.
+        Without it, the single Groq backend from the GROQ_* settings
+        """
+        default_key = os.getenv('GROQ_API_KEY', '')
+        if not Config.LLM_BACKENDS.strip():
+            return [LLMBackend('groq', Config.GROQ_API_URL, default_key, Config.GROQ_MODEL)]
+
+        backends = []
+        for entry in json.loads(Config.LLM_BACKENDS):
+            limiter = None
+            if entry.get('requests_per_minute') or entry.get('tokens_per_minute'):
+                limiter = RateLimiter(
+                    entry.get('requests_per_minute', 0),
+                    entry.get('tokens_per_minute', 0),
+                    Config.GROQ_RATE_LIMIT_MAX_WAIT_SECONDS
+                )
+            api_key = entry.get('api_key') or os.getenv(entry.get('api_key_env', 'GROQ_API_KEY'), '')
+            backends.append(LLMBackend(
+                entry.get('name', entry.get('model', entry['url'])),
+                entry['url'],
+                api_key,
+                entry.get('model', Config.GROQ_MODEL),
+                entry.get('call_types', LLMBackend.CALL_TYPES),
+                limiter
+            ))
+        return backends
+
+    @staticmethod
+    def rank(call_type):
+        """
+        Backends serving this call type, healthy ones first, fastest first.
+        Ones with no latency sample yet go to the front so they get measured
+        """
+        candidates = [backend for backend in LLMRouter.backends() if call_type in backend.call_types]
+
+        def key(backend):
+            latency = backend.latency(call_type)
+            return (not backend.healthy(), latency is not None, latency or 0.0)
+
+        return sorted(candidates, key=key)
+
+    @staticmethod
+    def chat(call_type, payload, timeout, hedge=False):
+        """
+        Send a chat payload. Returns (message content, the backend that
+        produced it), or (None, None) if no backend produced one
+        """
+        ranked = LLMRouter.rank(call_type)
+        if not ranked:
+            return None, None
+
+        # A hedge to the same backend only doubles its load
+        if hedge and Config.LLM_HEDGE_EVALUATIONS and len(ranked) > 1:
+            content, served, tried = LLMRouter._hedged(call_type, payload, timeout, ranked)
+        else:
+            content, served, tried = LLMRouter._call(ranked[0], call_type, payload, timeout), ranked[0], {ranked[0]}
+
+        for backend in ranked:
+            if content is not None:
+                break
+            if backend in tried:
+                continue
+            with LLMRouter._lock:
+                LLMRouter._counters['failovers'] += 1
+            content, served = LLMRouter._call(backend, call_type, payload, timeout), backend
+        return (content, served) if content is not None else (None, None)
+
+    @staticmethod
+    def models(call_type):
+        """Distinct models that can answer this call type, best-ranked first"""
+        models = []
+        for backend in LLMRouter.rank(call_type):
+            if backend.model not in models:
+                models.append(backend.model)
+        return models
+
+    @staticmethod
+    def stream(call_type, payload, timeout):
+        """Yield content deltas from the best backend for the call type"""
+        ranked = LLMRouter.rank(call_type)
+        if not ranked:
+            raise CircuitOpenError(f'No backend serves {call_type} calls')
+        backend = ranked[0]
+
+        start = time.time()
+        success = False
+        try:
+            yield from GroqClient.stream_chat(
+                backend.url, backend.api_key, {**payload, 'model': backend.model}, timeout, backend.limiter,
+                backend=backend.name
+            )
+            success = True
+        except GeneratorExit:
+            # The caller stopped reading because it had what it needed
+            success = True
+            raise
+        finally:
+            backend.record(call_type, success, time.time() - start)
+
+    @staticmethod
+    def stats():
+        with LLMRouter._lock:
+            counters = dict(LLMRouter._counters)
+        return {**counters, 'backends': [backend.stats() for backend in LLMRouter.backends()]}
+
+    @staticmethod
+    def _hedged(call_type, payload, timeout, ranked):
+        """
+        Start the call on the best backend; if it is still running after
+        that backend's p95 latency, start it on the next one too. First
+        content wins. Needs at least two ranked backends.
+        Returns (content or None, the backend that produced it, the backends tried)
+        """
+        primary = ranked[0]
+        secondary = ranked[1]
+
+        delay = primary.percentile(call_type, 95)
+        if delay is None:
+            delay = Config.LLM_HEDGE_DEFAULT_DELAY_SECONDS
+        delay = max(Config.LLM_HEDGE_MIN_DELAY_SECONDS, delay)
+
+        first = LLMRouter._executor.submit(LLMRouter._call, primary, call_type, payload, timeout)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result(), primary, {primary}
+
+        with LLMRouter._lock:
+            LLMRouter._counters['hedged'] += 1
+        second = LLMRouter._executor.submit(LLMRouter._call, secondary, call_type, payload, timeout)
+
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                content = future.result()
+                if content is not None:
+                    if future is second:
+                        with LLMRouter._lock:
+                            LLMRouter._counters['hedge_wins'] += 1
+                    # The slower request finishes in the background; its outcome still feeds the EWMAs
+                    return content, (secondary if future is second else primary), {primary, secondary}
+        return None, None, {primary, secondary}
+
+    @staticmethod
+    def _call(backend, call_type, payload, timeout):
+        """One request to one backend. Returns the content or None"""
+        start = time.time()
+        try:
+            response = GroqClient.post_chat(
+                backend.url, backend.api_key, {**payload, 'model': backend.model}, timeout,
+                limiter=backend.limiter, backend=backend.name
+            )
+        except CircuitOpenError:
+            return None
+        except RateLimitExceeded as e:
+            print(f"LLM rate limit ({backend.name}): {e}")
+            return None
+        except requests.RequestException as e:
+            backend.record(call_type, False, time.time() - start)
+            print(f"LLM request error ({backend.name}): {e}")
+            return None
+
+        if response.status_code != 200:
+            backend.record(call_type, False, time.time() - start)
+            print(f"LLM API error ({backend.name}): {response.status_code} - {response.text}")
+            return None
+
+        try:
+            content = response.json()['choices'][0]['message']['content']
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            backend.record(call_type, False, time.time() - start)
+            print(f"LLM response error ({backend.name}): {e}")
+            return None
+
+        backend.record(call_type, True, time.time() - start)
+        return content
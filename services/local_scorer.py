@@ -0,0 +1,148 @@
+import re
+import math
+import threading
+from collections import Counter
+from config import Config
+from services.ai_service import AIService
+from services.question_bank import QuestionBank
+
+class LocalScorer:
+    """
+    Cheap first scoring tier for written answers. Combines the answer
+    validity check, the structural features of the fallback evaluation and
+    TF-IDF similarity to the question's reference (its referenceAnswer and
+    keywords when it has them, otherwise the question itself) into a 0-20
+    score with a confidence. Only answers below the configured confidence
+    go on to the AI. Without keywords or a referenceAnswer, echoing the
+    question's own words would look relevant, so such questions only ever
+    yield a confident low score and anything above the midpoint goes to the AI
+    """
+
+    # Cosine similarity at which an answer counts as fully on-topic
+    FULL_RELEVANCE_SIMILARITY = 0.3
+
+    # How much a reference built from the question text alone is trusted
+    QUESTION_ONLY_EVIDENCE = 0.7
+
+    STOPWORDS = frozenset("""
+        a an and are as at be been but by can could do does for from had has have how i if in into is it
+        its me my of on or our so that the their them then there these they this to was we were what when
+        where which while who why will with would you your
+    """.split())
+
+    _idf = None
+    _default_idf = 1.0
+    _lock = threading.Lock()
+    _counters = {'assessed': 0, 'confident': 0, 'escalated': 0}
+
+    @staticmethod
+    def tokenize(text):
+        return [
+            token for token in re.findall(r'[^\W_]+', text.lower())
+            if len(token) > 1 and token not in LocalScorer.STOPWORDS
+        ]
+
+    @staticmethod
+    def assess(question, answer_text):
+        """Local score (0-20), feedback and confidence (0-1) for one written answer"""
+        if not AIService._is_valid_answer(answer_text):
+            # Empty, too short or gibberish: the AI would not score it any higher
+            return {'score': 0, 'feedback': 'Invalid answer: Please provide a meaningful response.', 'confidence': 1.0}
+
+        structural = AIService._fallback_evaluation(answer_text)
+        relevance, evidence = LocalScorer._relevance(question, answer_text)
+
+        quality = structural['score'] / 18
+        score = round(20 * quality * (0.5 + 0.5 * relevance))
+        confidence = evidence * min(1.0, abs(score - 10) / 10)
+        if evidence < 1.0 and score > 10:
+            confidence = 0.0
+
+        feedback = structural['feedback']
+        if relevance < 0.3:
+            feedback += '; it does not address the question closely'
+        return {'score': score, 'feedback': feedback, 'confidence': round(confidence, 3)}
+
+    @staticmethod
+    def decide(question, answer_text):
+        """
+        The local evaluation if it is confident enough to skip the AI,
+        otherwise None. Every call counts toward the escalation rate
+        """
+        result = LocalScorer.assess(question, answer_text)
+        confident = result['confidence'] >= Config.LOCAL_SCORER_MIN_CONFIDENCE
+
+        with LocalScorer._lock:
+            LocalScorer._counters['assessed'] += 1
+            LocalScorer._counters['confident' if confident else 'escalated'] += 1
+
+        if confident:
+            return {'score': result['score'], 'feedback': result['feedback']}
+        return None
+
+    @staticmethod
+    def stats():
+        with LocalScorer._lock:
+            assessed = LocalScorer._counters['assessed']
+            return {
+                **LocalScorer._counters,
+                'escalation_rate': round(LocalScorer._counters['escalated'] / assessed, 4) if assessed else 0.0,
+                'min_confidence': Config.LOCAL_SCORER_MIN_CONFIDENCE,
+                'enabled': Config.LOCAL_SCORER_ENABLED
+            }
+
+    @staticmethod
+    def _relevance(question, answer_text):
+        """(relevance 0-1, how far the reference can be trusted 0-1)"""
+        answer_tokens = LocalScorer.tokenize(answer_text)
+        keywords = [k for k in question.get('keywords') or [] if isinstance(k, str)]
+        reference = question.get('referenceAnswer') or ''
+
+        if reference or keywords:
+            evidence = 1.0
+            reference_text = ' '.join([reference] + keywords)
+        else:
+            evidence = LocalScorer.QUESTION_ONLY_EVIDENCE
+            reference_text = question.get('question', '')
+
+        similarity = LocalScorer._cosine(answer_tokens, LocalScorer.tokenize(reference_text))
+        relevance = min(1.0, similarity / LocalScorer.FULL_RELEVANCE_SIMILARITY)
+
+        if keywords:
+            answer_terms = set(answer_tokens)
+            covered = sum(1 for k in keywords if set(LocalScorer.tokenize(k)) <= answer_terms)
+            relevance = max(relevance, covered / len(keywords))
+
+        return relevance, evidence
+
+    @staticmethod
+    def _cosine(tokens_a, tokens_b):
+        if not tokens_a or not tokens_b:
+            return 0.0
+        idf = LocalScorer._get_idf()
+        a = {t: c * idf.get(t, LocalScorer._default_idf) for t, c in Counter(tokens_a).items()}
+        b = {t: c * idf.get(t, LocalScorer._default_idf) for t, c in Counter(tokens_b).items()}
+        dot = sum(weight * b[t] for t, weight in a.items() if t in b)
+        norm = math.sqrt(sum(w * w for w in a.values())) * math.sqrt(sum(w * w for w in b.values()))
+        return dot / norm if norm else 0.0
+
+    @staticmethod
+    def _get_idf():
+        """Inverse document frequencies over the question bank, built once"""
+        if LocalScorer._idf is None:
+            with LocalScorer._lock:
+                if LocalScorer._idf is None:
+                    LocalScorer._idf = LocalScorer._build_idf()
+        return LocalScorer._idf
+
+    @staticmethod
+    def _build_idf():
+        documents = [
+            set(LocalScorer.tokenize(' '.join([question.get('question', ''), question.get('referenceAnswer') or ''])))
+            for question in QuestionBank.all_questions()
+        ]
+        frequencies = Counter(term for document in documents for term in document)
+        count = len(documents)
+        # Terms never seen in the bank are the most specific
+        LocalScorer._default_idf = math.log((1 + count) / 1) + 1
+        return {term: math.log((1 + count) / (1 + df)) + 1 for term, df in frequencies.items()}
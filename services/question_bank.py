@@ -0,0 +1,196 @@
+import os
+import json
+import time
+import random
+import threading
+from types import MappingProxyType
+
+class QuestionBank:
+    """
+    The static question sets (data/questions.json) and the fallback sets
+    used when AI generation fails (data/fallback_questions.json), loaded
+    once and indexed by source, role, difficulty, type and topic. Lookups
+    are a dict access on an immutable snapshot; a file whose mtime changes
+    is picked up by swapping in a fresh snapshot, never by mutating the
+    one readers hold
+    """
+
+    SOURCES = {
+        'static': 'data/questions.json',
+        'fallback': 'data/fallback_questions.json'
+    }
+    DEFAULT_ROLE = 'Software Engineer'
+    DEFAULT_LEVEL = 'Beginner'
+
+    # Seconds between mtime checks, so hot lookups do not stat the files every time
+    RELOAD_CHECK_SECONDS = 2
+
+    # First matching topic wins; questions can also carry their own "topic"
+    TOPICS = [
+        ('data structures', ['stack', 'queue', 'linked list', 'hash', 'tree', 'heap', 'graph', 'array']),
+        ('algorithms', ['complexity', 'sort', 'search', 'recursion', 'dynamic programming', 'algorithm']),
+        ('databases', ['sql', 'database', 'index', 'transaction', 'query', 'acid', 'nosql']),
+        ('system design', ['design a', 'scal', 'distributed', 'microservice', 'cache', 'load balanc', 'architecture']),
+        ('web and apis', ['rest', 'api', 'http', 'web']),
+        ('deep learning', ['neural', 'transformer', 'attention', 'cnn', 'rnn', 'gradient', 'backprop', 'deep learning']),
+        ('machine learning', ['overfitting', 'regulariz', 'model', 'training', 'feature', 'classification',
+                              'regression', 'machine learning', 'supervised']),
+        ('statistics', ['p-value', 'hypothesis', 'distribution', 'variance', 'probability', 'statistic', 'bayes']),
+        ('data engineering', ['pipeline', 'etl', 'warehouse', 'spark', 'data quality']),
+        ('engineering practice', ['test', 'debug', 'version control', 'git', 'code review', 'deploy', 'oop',
+                                  'object-oriented', 'design pattern'])
+    ]
+
+    _snapshot = None
+    _mtimes = {}
+    _checked_at = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def load():
+        """Load and index every source. Called at startup; lookups also load on first use"""
+        with QuestionBank._lock:
+            QuestionBank._reload()
+
+    @staticmethod
+    def questions(role, difficulty, source='static', question_type=None, topic=None):
+        """
+        Immutable view (a tuple of read-only mappings) of the questions for
+        one role and difficulty, optionally narrowed to a type or topic
+        """
+        snapshot = QuestionBank._current()
+        if question_type is None and topic is None:
+            return snapshot['by_level'].get((source, role, difficulty), ())
+        if topic is None:
+            return snapshot['by_type'].get((source, role, difficulty, question_type), ())
+        if question_type is None:
+            return snapshot['by_topic'].get((source, role, difficulty, topic), ())
+        return tuple(q for q in snapshot['by_topic'].get((source, role, difficulty, topic), ())
+                     if q['type'] == question_type)
+
+    @staticmethod
+    def sample(role, difficulty, count, source='static', question_type=None, topic=None, rng=random):
+        """Up to `count` random questions as plain dicts, ready to serialize"""
+        view = QuestionBank.questions(role, difficulty, source, question_type, topic)
+        return QuestionBank.as_dicts(rng.sample(view, min(count, len(view))))
+
+    @staticmethod
+    def fallback(role, difficulty):
+        """The fallback set for a role and difficulty, or the default set if there is none"""
+        view = QuestionBank.questions(role, difficulty, 'fallback')
+        if not view:
+            view = QuestionBank.questions(QuestionBank.DEFAULT_ROLE, QuestionBank.DEFAULT_LEVEL, 'fallback')
+        return QuestionBank.as_dicts(view)
+
+    @staticmethod
+    def all_questions(source=None):
+        """Every question, optionally from one source only"""
+        snapshot = QuestionBank._current()
+        return tuple(q for (s, _, _), view in snapshot['by_level'].items() if source in (None, s) for q in view)
+
+    @staticmethod
+    def topics(role, difficulty, source='static'):
+        snapshot = QuestionBank._current()
+        return sorted(t for (s, r, d, t) in snapshot['by_topic'] if (s, r, d) == (source, role, difficulty))
+
+    @staticmethod
+    def as_dicts(questions):
+        """Mutable, JSON-serializable copies of frozen questions"""
+        return [
+            {key: list(value) if isinstance(value, tuple) else value for key, value in question.items()}
+            for question in questions
+        ]
+
+    @staticmethod
+    def stats():
+        snapshot = QuestionBank._current()
+        return {
+            'questions': sum(len(view) for view in snapshot['by_level'].values()),
+            'sets': len(snapshot['by_level']),
+            'loaded_at': snapshot['loaded_at']
+        }
+
+    @staticmethod
+    def topic_of(question):
+        if isinstance(question.get('topic'), str) and question['topic'].strip():
+            return question['topic'].strip().lower()
+        text = question.get('question', '').lower()
+        for topic, markers in QuestionBank.TOPICS:
+            if any(marker in text for marker in markers):
+                return topic
+        return 'general'
+
+    @staticmethod
+    def _current():
+        snapshot = QuestionBank._snapshot
+        now = time.time()
+        if snapshot is not None and now - QuestionBank._checked_at < QuestionBank.RELOAD_CHECK_SECONDS:
+            return snapshot
+
+        with QuestionBank._lock:
+            if QuestionBank._snapshot is None or QuestionBank._files_changed():
+                QuestionBank._reload()
+            QuestionBank._checked_at = now
+            return QuestionBank._snapshot
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _files_changed():
+        return any(QuestionBank._mtime(path) != QuestionBank._mtimes.get(source)
+                   for source, path in QuestionBank.SOURCES.items())
+
+    @staticmethod
+    def _reload():
+        """Build a new snapshot from the files. Caller holds the lock"""
+        by_level, by_type, by_topic = {}, {}, {}
+        mtimes = {}
+
+        for source, path in QuestionBank.SOURCES.items():
+            mtimes[source] = QuestionBank._mtime(path)
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Question bank load error ({path}): {e}")
+                # Keep serving what was loaded before rather than nothing
+                if QuestionBank._snapshot is not None:
+                    for key, view in QuestionBank._snapshot['by_level'].items():
+                        if key[0] == source:
+                            QuestionBank._index(by_level, by_type, by_topic, key, view)
+                continue
+
+            for role, levels in data.items():
+                for level, questions in levels.items():
+                    frozen = tuple(QuestionBank._freeze(q) for q in questions if isinstance(q, dict))
+                    QuestionBank._index(by_level, by_type, by_topic, (source, role, level), frozen)
+
+        QuestionBank._snapshot = {
+            'by_level': by_level,
+            'by_type': QuestionBank._tuples(by_type),
+            'by_topic': QuestionBank._tuples(by_topic),
+            'loaded_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+        QuestionBank._mtimes = mtimes
+
+    @staticmethod
+    def _index(by_level, by_type, by_topic, key, questions):
+        by_level[key] = questions
+        for question in questions:
+            by_type.setdefault(key + (question.get('type'),), []).append(question)
+            by_topic.setdefault(key + (question['topic'],), []).append(question)
+
+    @staticmethod
+    def _tuples(index):
+        return {key: tuple(questions) for key, questions in index.items()}
+
+    @staticmethod
+    def _freeze(question):
+        frozen = {key: tuple(value) if isinstance(value, list) else value for key, value in question.items()}
+        frozen['topic'] = QuestionBank.topic_of(question)
+        return MappingProxyType(frozen)
@@ -0,0 +1,132 @@
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from services.ai_service import AIService
+
+class QuestionPool:
+    """
+    Keeps ready AI-generated question sets for every role/difficulty so
+    /api/questions can hand one out without waiting on the LLM. Each set is
+    served once; taking one queues a background refill. Refills are started
+    at most QUESTION_POOL_REFILLS_PER_MINUTE, so warming every pool at
+    startup does not use up the Groq budget live interviews need, and sets
+    close to QUESTION_POOL_MAX_AGE_SECONDS are replaced in the background
+    before they expire rather than on the next request
+    """
+
+    ROLES = ['Software Engineer', 'AI Scientist', 'Data Scientist']
+    LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+
+    _sets = {}
+    _refilling = {}
+    _queue = deque()
+    _lock = threading.Lock()
+    _executor = None
+    _thread = None
+
+    @staticmethod
+    def start():
+        """Create the refill workers and queue a fill of every pool"""
+        if not Config.QUESTION_POOL_ENABLED or QuestionPool._executor is not None:
+            return
+
+        with QuestionPool._lock:
+            for role in QuestionPool.ROLES:
+                for level in QuestionPool.LEVELS:
+                    QuestionPool._sets[(role, level)] = deque()
+                    QuestionPool._refilling[(role, level)] = 0
+
+        QuestionPool._executor = ThreadPoolExecutor(
+            max_workers=Config.QUESTION_POOL_REFILL_WORKERS,
+            thread_name_prefix='question-pool'
+        )
+        # One round across every pool before any gets its second set
+        for depth in range(1, Config.QUESTION_POOL_DEPTH + 1):
+            for key in QuestionPool._sets:
+                QuestionPool._schedule_refill(key, depth)
+
+        QuestionPool._thread = threading.Thread(target=QuestionPool._work, name='question-pool-refill', daemon=True)
+        QuestionPool._thread.start()
+
+    @staticmethod
+    def pop(role, difficulty):
+        """Take a ready question set, or None if the pool has nothing fresh"""
+        key = (role, difficulty)
+        if QuestionPool._executor is None or key not in QuestionPool._sets:
+            return None
+
+        questions = None
+        with QuestionPool._lock:
+            QuestionPool._discard_expired(key)
+            if QuestionPool._sets[key]:
+                questions = QuestionPool._sets[key].popleft()[1]
+
+        QuestionPool._schedule_refill(key)
+        return questions
+
+    @staticmethod
+    def stats():
+        with QuestionPool._lock:
+            return {
+                f'{role}/{level}': {
+                    'ready': len(QuestionPool._sets[(role, level)]),
+                    'refilling': QuestionPool._refilling[(role, level)]
+                }
+                for role, level in QuestionPool._sets
+            }
+
+    @staticmethod
+    def _work():
+        """Start one queued refill per interval, and queue replacements for sets about to expire"""
+        interval = 60 / max(1, Config.QUESTION_POOL_REFILLS_PER_MINUTE)
+        while True:
+            try:
+                for key in list(QuestionPool._sets):
+                    QuestionPool._schedule_refill(key)
+                with QuestionPool._lock:
+                    key = QuestionPool._queue.popleft() if QuestionPool._queue else None
+                if key is not None:
+                    QuestionPool._executor.submit(QuestionPool._refill_one, key)
+            except Exception as e:
+                print(f"Question pool scheduler error: {e}")
+            time.sleep(interval)
+
+    @staticmethod
+    def _fresh(key):
+        """Sets that will not need replacing soon. Caller holds the lock"""
+        refresh_at = time.time() - Config.QUESTION_POOL_MAX_AGE_SECONDS + Config.QUESTION_POOL_REFRESH_BEFORE_SECONDS
+        return sum(1 for created_at, _ in QuestionPool._sets[key] if created_at > refresh_at)
+
+    @staticmethod
+    def _discard_expired(key):
+        """Drop sets older than the configured max age. Caller holds the lock"""
+        cutoff = time.time() - Config.QUESTION_POOL_MAX_AGE_SECONDS
+        pool = QuestionPool._sets[key]
+        while pool and pool[0][0] < cutoff:
+            pool.popleft()
+
+    @staticmethod
+    def _schedule_refill(key, depth=None):
+        """Queue refills until the pool holds `depth` (default QUESTION_POOL_DEPTH) fresh or pending sets"""
+        depth = Config.QUESTION_POOL_DEPTH if depth is None else depth
+        with QuestionPool._lock:
+            QuestionPool._discard_expired(key)
+            missing = depth - QuestionPool._fresh(key) - QuestionPool._refilling[key]
+            for _ in range(max(0, missing)):
+                QuestionPool._refilling[key] += 1
+                QuestionPool._queue.append(key)
+
+    @staticmethod
+    def _refill_one(key):
+        questions = None
+        try:
+            questions = AIService.request_interview_questions(*key)
+        except Exception as e:
+            print(f"Question pool refill error: {e}")
+        finally:
+            with QuestionPool._lock:
+                QuestionPool._refilling[key] -= 1
+                if questions:
+                    QuestionPool._sets[key].append((time.time(), questions))
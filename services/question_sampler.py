@@ -0,0 +1,174 @@
+import random
+import hashlib
+import threading
+from collections import OrderedDict, Counter
+import psycopg2
+from config import Config
+from models.database import DatabaseManager
+from services.question_bank import QuestionBank
+
+class QuestionSampler:
+    """
+    Picks question sets from the question bank that a user has not seen
+    yet. Each question is identified by its own "id" if it has one, else
+    by a digest of its text, so editing or reordering a set does not remap
+    what a user has seen. What each user has seen is kept per source, role
+    and difficulty (the question_seen table, with recently used sets cached
+    here), so sampling never reads result history. Once a set has nothing
+    unseen left for a question type, the user starts a new cycle through
+    that type. A set no larger than the request is served whole, shuffled,
+    without touching the database
+    """
+
+    # Bytes of each stored question id
+    ID_BYTES = 8
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+    _counters = {'sampled': 0, 'whole_sets': 0, 'cache_hits': 0, 'cache_misses': 0, 'cycles_restarted': 0}
+
+    @staticmethod
+    def sample(user_id, role, difficulty, count=10, source='static', rng=random):
+        """
+        Up to `count` questions as plain dicts, in random order, with the
+        same mix of types as the first `count` of the set, preferring ones
+        the user has not seen. Records them as seen
+        """
+        view = QuestionBank.questions(role, difficulty, source)
+        if not view:
+            return []
+
+        if count >= len(view):
+            # Every question goes out, so there is nothing to choose between
+            chosen = list(view)
+            rng.shuffle(chosen)
+            with QuestionSampler._lock:
+                QuestionSampler._counters['sampled'] += 1
+                QuestionSampler._counters['whole_sets'] += 1
+            return QuestionBank.as_dicts(chosen)
+
+        key = (user_id, source, role, difficulty)
+        seen = QuestionSampler._load(key)
+
+        chosen = []
+        reset = set()
+        for question_type, wanted in QuestionSampler._composition(view, count).items():
+            slot = [(QuestionSampler.question_id(question), question)
+                    for question in view if question.get('type') == question_type]
+            unseen = [item for item in slot if item[0] not in seen]
+            picked = rng.sample(unseen, min(wanted, len(unseen)))
+            if len(picked) < wanted:
+                # Type exhausted: start a new cycle through it, filling from questions seen before
+                reset.update(question_id for question_id, _ in slot)
+                picked_ids = {question_id for question_id, _ in picked}
+                already = [item for item in slot if item[0] not in picked_ids]
+                picked += rng.sample(already, min(wanted - len(picked), len(already)))
+            chosen.extend(picked)
+
+        rng.shuffle(chosen)
+        QuestionSampler._store(key, {question_id for question_id, _ in chosen}, reset)
+
+        with QuestionSampler._lock:
+            QuestionSampler._counters['sampled'] += 1
+            if reset:
+                QuestionSampler._counters['cycles_restarted'] += 1
+
+        return QuestionBank.as_dicts(question for _, question in chosen)
+
+    @staticmethod
+    def question_id(question):
+        """Stable id of a question: its own "id", else a digest of its text"""
+        identity = str(question.get('id') or question.get('question', ''))
+        return hashlib.sha256(identity.encode('utf-8')).digest()[:QuestionSampler.ID_BYTES]
+
+    @staticmethod
+    def stats():
+        with QuestionSampler._lock:
+            return {**QuestionSampler._counters, 'cached_users': len(QuestionSampler._cache)}
+
+    @staticmethod
+    def _composition(view, count):
+        """Questions wanted per type, in order of first appearance"""
+        return Counter(question.get('type') for question in view[:count])
+
+    @staticmethod
+    def _load(key):
+        with QuestionSampler._lock:
+            if key in QuestionSampler._cache:
+                QuestionSampler._cache.move_to_end(key)
+                QuestionSampler._counters['cache_hits'] += 1
+                return QuestionSampler._cache[key]
+            QuestionSampler._counters['cache_misses'] += 1
+
+        seen = frozenset()
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT seen FROM question_seen
+                    WHERE user_id = %s AND source = %s AND role = %s AND difficulty = %s
+                ''', key)
+                row = cursor.fetchone()
+            if row:
+                seen = QuestionSampler._decode(row[0])
+        except Exception as e:
+            print(f"Load seen questions error: {e}")
+
+        QuestionSampler._cache_put(key, seen)
+        return seen
+
+    @staticmethod
+    def _store(key, served, reset):
+        """
+        Merge the served question ids into the stored set, first dropping
+        the ids in `reset` (the types that started a new cycle). The row is
+        locked for the merge so concurrent interviews for one user do not
+        lose each other's ids
+        """
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT seen FROM question_seen
+                    WHERE user_id = %s AND source = %s AND role = %s AND difficulty = %s
+                    FOR UPDATE
+                ''', key)
+                row = cursor.fetchone()
+                stored = QuestionSampler._decode(row[0]) if row else frozenset()
+                seen = (stored - reset) | served
+
+                cursor.execute('''
+                    INSERT INTO question_seen (user_id, source, role, difficulty, seen, updated_at)
+                    VALUES (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (user_id, source, role, difficulty)
+                    DO UPDATE SET seen = EXCLUDED.seen, updated_at = CURRENT_TIMESTAMP
+                ''', key + (psycopg2.Binary(QuestionSampler._encode(seen)),))
+                conn.commit()
+        except Exception as e:
+            print(f"Store seen questions error: {e}")
+            # Still avoid repeats within this process
+            with QuestionSampler._lock:
+                stored = QuestionSampler._cache.get(key, frozenset())
+            seen = (stored - reset) | served
+
+        QuestionSampler._cache_put(key, frozenset(seen))
+
+    @staticmethod
+    def _cache_put(key, seen):
+        with QuestionSampler._lock:
+            QuestionSampler._cache[key] = seen
+            QuestionSampler._cache.move_to_end(key)
+            while len(QuestionSampler._cache) > Config.QUESTION_SEEN_CACHE_MAX_ENTRIES:
+                QuestionSampler._cache.popitem(last=False)
+
+    @staticmethod
+    def _encode(seen):
+        """Seen ids as one BYTEA: the fixed-width ids concatenated in sorted order"""
+        return b''.join(sorted(seen))
+
+    @staticmethod
+    def _decode(value):
+        value = bytes(value)
+        size = QuestionSampler.ID_BYTES
+        if len(value) % size:
+            # Not a list of ids (e.g. a bitmap from an earlier format): nothing counts as seen
+            return frozenset()
+        return frozenset(value[i:i + size] for i in range(0, len(value), size))
@@ -0,0 +1,90 @@
+import time
+import threading
+
+class RateLimitExceeded(Exception):
+    """Raised when a call would have to queue longer than the limiter allows"""
+
+
+class RateLimiter:
+    """
+    Client-side budget for an API with both request and token limits.
+    Two token buckets (requests/minute and tokens/minute) refill
+    continuously; a call reserves its share up front and sleeps until the
+    budget covers it, so concurrent callers queue in arrival order. A 429
+    pauses every caller until its Retry-After has passed
+    """
+
+    def __init__(self, requests_per_minute, tokens_per_minute, max_wait_seconds):
+        self.requests_per_second = requests_per_minute / 60.0
+        self.tokens_per_second = tokens_per_minute / 60.0
+        self.max_wait_seconds = max_wait_seconds
+
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._request_capacity = float(requests_per_minute)
+        self._token_capacity = float(tokens_per_minute)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._counters = {'calls': 0, 'queued': 0, 'rejected': 0, 'throttled': 0,
+                          'total_wait_seconds': 0.0, 'max_wait_seconds': 0.0}
+
+    def acquire(self, tokens):
+        """
+        Reserve one request and `tokens` tokens, sleeping until they are
+        available. Returns the seconds spent queued, or raises
+        RateLimitExceeded if that would exceed max_wait_seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            wait = max(0.0, self._paused_until - now)
+            if self.requests_per_second > 0:
+                wait = max(wait, (1 - self._requests) / self.requests_per_second)
+            if self.tokens_per_second > 0:
+                # A single call larger than the whole budget only has to wait for a full bucket
+                needed = min(tokens, self._token_capacity)
+                wait = max(wait, (needed - self._tokens) / self.tokens_per_second)
+
+            if wait > self.max_wait_seconds:
+                self._counters['rejected'] += 1
+                raise RateLimitExceeded(f'Rate limit queue wait {wait:.1f}s exceeds {self.max_wait_seconds}s')
+
+            self._requests -= 1
+            self._tokens -= min(tokens, self._token_capacity)
+            self._counters['calls'] += 1
+            if wait > 0:
+                self._counters['queued'] += 1
+                self._counters['total_wait_seconds'] += wait
+                self._counters['max_wait_seconds'] = max(self._counters['max_wait_seconds'], wait)
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        """Hold back every caller for `seconds`, e.g. after a 429"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._counters['throttled'] += 1
+
+    def stats(self):
+        with self._lock:
+            queued = self._counters['queued']
+            return {
+                **self._counters,
+                'total_wait_seconds': round(self._counters['total_wait_seconds'], 3),
+                'max_wait_seconds': round(self._counters['max_wait_seconds'], 3),
+                'avg_wait_seconds': round(self._counters['total_wait_seconds'] / queued, 3) if queued else 0.0,
+                'available_requests': round(self._requests, 1),
+                'available_tokens': round(self._tokens)
+            }
+
+    def _refill(self, now):
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if self.requests_per_second > 0:
+            self._requests = min(self._request_capacity, self._requests + elapsed * self.requests_per_second)
+        if self.tokens_per_second > 0:
+            self._tokens = min(self._token_capacity, self._tokens + elapsed * self.tokens_per_second)
@@ -0,0 +1,89 @@
+import time
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from config import Config
+from services.interview_service import InterviewService
+
+class ResultCache:
+    """
+    Read-through cache in front of InterviewService.get_result_by_id. A
+    saved result never changes, so each one is serialized once and kept as
+    its JSON body with a strong ETag derived from it. LRU bounded by entry
+    count and by total body bytes. The retention job drops the results it
+    deletes from its own process; the TTL bounds how long other workers
+    can still serve one
+    """
+
+    _entries = OrderedDict()
+    _bytes = 0
+    _lock = threading.Lock()
+    _counters = {'hits': 0, 'misses': 0, 'not_found': 0, 'evictions': 0, 'expired': 0, 'invalidated': 0}
+
+    @staticmethod
+    def get(result_id):
+        """(etag, JSON body bytes) for a result, or None if it does not exist"""
+        now = time.time()
+        with ResultCache._lock:
+            entry = ResultCache._entries.get(result_id)
+            if entry is not None:
+                if entry[0] > now:
+                    ResultCache._entries.move_to_end(result_id)
+                    ResultCache._counters['hits'] += 1
+                    return entry[1], entry[2]
+                ResultCache._remove(result_id)
+                ResultCache._counters['expired'] += 1
+            ResultCache._counters['misses'] += 1
+
+        result = InterviewService.get_result_by_id(result_id)
+        if result is None:
+            with ResultCache._lock:
+                ResultCache._counters['not_found'] += 1
+            return None
+
+        body = json.dumps(result, separators=(',', ':')).encode('utf-8')
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        ResultCache._store(result_id, etag, body)
+        return etag, body
+
+    @staticmethod
+    def invalidate(result_ids):
+        with ResultCache._lock:
+            for result_id in result_ids:
+                if result_id in ResultCache._entries:
+                    ResultCache._remove(result_id)
+                    ResultCache._counters['invalidated'] += 1
+
+    @staticmethod
+    def stats():
+        with ResultCache._lock:
+            lookups = ResultCache._counters['hits'] + ResultCache._counters['misses']
+            return {
+                **ResultCache._counters,
+                'entries': len(ResultCache._entries),
+                'bytes': ResultCache._bytes,
+                'hit_rate': round(ResultCache._counters['hits'] / lookups, 4) if lookups else 0.0
+            }
+
+    @staticmethod
+    def _store(result_id, etag, body):
+        if not Config.RESULT_CACHE_ENABLED or len(body) > Config.RESULT_CACHE_MAX_BYTES:
+            return
+
+        with ResultCache._lock:
+            if result_id in ResultCache._entries:
+                ResultCache._remove(result_id)
+            ResultCache._entries[result_id] = (time.time() + Config.RESULT_CACHE_TTL_SECONDS, etag, body)
+            ResultCache._bytes += len(body)
+            while (len(ResultCache._entries) > Config.RESULT_CACHE_MAX_ENTRIES
+                   or ResultCache._bytes > Config.RESULT_CACHE_MAX_BYTES):
+                oldest = next(iter(ResultCache._entries))
+                ResultCache._remove(oldest)
+                ResultCache._counters['evictions'] += 1
+
+    @staticmethod
+    def _remove(result_id):
+        """Caller holds the lock"""
+        entry = ResultCache._entries.pop(result_id)
+        ResultCache._bytes -= len(entry[2])
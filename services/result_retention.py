@@ -0,0 +1,151 @@
+import time
+import threading
+from config import Config
+from models.database import DatabaseManager
+from services.result_cache import ResultCache
+from services.llm_cache import LLMCache
+
+class ResultRetention:
+    """
+    Keeps each user's newest RESULT_RETENTION_PER_USER results and deletes
+    the rest, from a background thread every RESULT_COMPACTION_INTERVAL_SECONDS
+    rather than on every submit. Deletes run in batches of
+    RESULT_COMPACTION_BATCH_SIZE rows, one short transaction each, over the
+    users found over the limit once at the start of the run, and only one
+    process compacts at a time. The same loop prunes expired rows from the
+    persistent LLM cache
+    """
+
+    # Key for pg_try_advisory_xact_lock, so workers do not compact the same rows at once
+    LOCK_KEY = 72430023
+
+    _thread = None
+    _lock = threading.Lock()
+    _counters = {'runs': 0, 'batches': 0, 'deleted': 0, 'skipped': 0, 'errors': 0}
+    _last_run = {'at': None, 'seconds': 0.0, 'deleted': 0}
+
+    @staticmethod
+    def start():
+        """Start the maintenance thread for this process, unless it has nothing to trim"""
+        if ResultRetention._thread or (Config.RESULT_RETENTION_PER_USER <= 0 and not Config.LLM_CACHE_PERSISTENT):
+            return
+
+        ResultRetention._thread = threading.Thread(target=ResultRetention._work, name='result-retention', daemon=True)
+        ResultRetention._thread.start()
+
+    @staticmethod
+    def compact(keep=None, batch_size=None):
+        """Delete results beyond the newest `keep` per user. Returns the number deleted"""
+        keep = Config.RESULT_RETENTION_PER_USER if keep is None else keep
+        batch_size = batch_size or Config.RESULT_COMPACTION_BATCH_SIZE
+        if keep <= 0:
+            return 0
+
+        start = time.time()
+        deleted = 0
+        # Aggregated once per run; the batches then walk these users a chunk at a time
+        users = ResultRetention._over_limit(keep) or []
+        position = 0
+        while position < len(users):
+            removed = ResultRetention._delete_batch(users[position:position + batch_size], keep, batch_size)
+            if removed is None:
+                break
+            deleted += removed
+            with ResultRetention._lock:
+                ResultRetention._counters['batches'] += 1
+            if removed < batch_size:
+                # Nothing left past the limit for this chunk of users
+                position += batch_size
+
+        with ResultRetention._lock:
+            ResultRetention._counters['runs'] += 1
+            ResultRetention._counters['deleted'] += deleted
+            ResultRetention._last_run.update({
+                'at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'seconds': round(time.time() - start, 3),
+                'deleted': deleted
+            })
+        return deleted
+
+    @staticmethod
+    def stats():
+        with ResultRetention._lock:
+            return {
+                **ResultRetention._counters,
+                'keep_per_user': Config.RESULT_RETENTION_PER_USER,
+                'last_run': dict(ResultRetention._last_run)
+            }
+
+    @staticmethod
+    def _work():
+        while True:
+            time.sleep(Config.RESULT_COMPACTION_INTERVAL_SECONDS)
+            try:
+                ResultRetention.compact()
+            except Exception as e:
+                print(f"Result compaction error: {e}")
+            if Config.LLM_CACHE_PERSISTENT:
+                LLMCache.prune()
+
+    @staticmethod
+    def _over_limit(keep):
+        """Users with more than `keep` results, or None if the query failed"""
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT user_id FROM results
+                    GROUP BY user_id
+                    HAVING COUNT(*) > %s
+                    ORDER BY user_id
+                ''', (keep,))
+                return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            print(f"Result compaction scan error: {e}")
+            with ResultRetention._lock:
+                ResultRetention._counters['errors'] += 1
+            return None
+
+    @staticmethod
+    def _delete_batch(users, keep, batch_size):
+        """
+        Delete up to batch_size results of these users that fall outside
+        their newest `keep`. Returns the rows deleted, or None if another
+        process holds the compaction lock or the batch failed
+        """
+        try:
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('SELECT pg_try_advisory_xact_lock(%s)', (ResultRetention.LOCK_KEY,))
+                if not cursor.fetchone()[0]:
+                    with ResultRetention._lock:
+                        ResultRetention._counters['skipped'] += 1
+                    return None
+
+                # Each user's rows past the newest `keep`, read from idx_results_user_keyset
+                cursor.execute('''
+                    DELETE FROM results
+                    WHERE id IN (
+                        SELECT expired.id
+                        FROM unnest(%(users)s::varchar[]) AS over_limit(user_id)
+                        CROSS JOIN LATERAL (
+                            SELECT id FROM results
+                            WHERE user_id = over_limit.user_id
+                            ORDER BY created_at DESC, id DESC
+                            OFFSET %(keep)s
+                        ) expired
+                        LIMIT %(batch_size)s
+                    )
+                    RETURNING id
+                ''', {'users': users, 'keep': keep, 'batch_size': batch_size})
+
+                deleted = [row[0] for row in cursor.fetchall()]
+                conn.commit()
+
+            ResultCache.invalidate(deleted)
+            return len(deleted)
+
+        except Exception as e:
+            print(f"Result compaction batch error: {e}")
+            with ResultRetention._lock:
+                ResultRetention._counters['errors'] += 1
+            return None
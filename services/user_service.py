@@ -11,64 +11,56 @@ class UserService:
     @staticmethod
     def create_user(email, password, is_guest=False, auth_provider='local', oauth_id=None, name=None, avatar_url=None):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT id, email, auth_provider, is_verified, password_hash FROM users WHERE email = %s', (email,))
-            existing_user = cursor.fetchone()
-            
-            if existing_user:
-                user_id = existing_user[0]
-                existing_provider = existing_user[2]
-                is_verified = existing_user[3]
-                has_password = existing_user[4] is not None
-                
-                if auth_provider == 'local':
-                    cursor.close()
-                    conn.close()
-                    return {'success': False, 'message': 'Email already registered'}
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('SELECT id, email, auth_provider, is_verified, password_hash FROM users WHERE email = %s', (email,))
+                existing_user = cursor.fetchone()
                 
-                if auth_provider != 'local':
-                    if not has_password:
-                        random_password = secrets.token_urlsafe(32)
-                        password_hash = generate_password_hash(random_password)
-                        cursor.execute('UPDATE users SET password_hash = %s WHERE id = %s', (password_hash, user_id))
+                if existing_user:
+                    user_id = existing_user[0]
+                    existing_provider = existing_user[2]
+                    is_verified = existing_user[3]
+                    has_password = existing_user[4] is not None
                     
-                    cursor.execute('UPDATE users SET auth_provider = %s, oauth_id = %s, name = COALESCE(%s, name), avatar_url = COALESCE(%s, avatar_url), is_verified = TRUE WHERE id = %s',
-                                 (auth_provider, oauth_id, name, avatar_url, user_id))
-                    conn.commit()
-                
-                cursor.close()
-                conn.close()
-                return {
-                    'success': True,
-                    'message': 'Login successful!',
-                    'user': {
-                        'id': user_id,
-                        'email': email,
-                        'access_token': f'token_{user_id}_{secrets.token_urlsafe(16)}'
+                    if auth_provider == 'local':
+                        return {'success': False, 'message': 'Email already registered'}
+                    
+                    if auth_provider != 'local':
+                        if not has_password:
+                            random_password = secrets.token_urlsafe(32)
+                            password_hash = generate_password_hash(random_password)
+                            cursor.execute('UPDATE users SET password_hash = %s WHERE id = %s', (password_hash, user_id))
+                        
+                        cursor.execute('UPDATE users SET auth_provider = %s, oauth_id = %s, name = COALESCE(%s, name), avatar_url = COALESCE(%s, avatar_url), is_verified = TRUE WHERE id = %s',
+                                     (auth_provider, oauth_id, name, avatar_url, user_id))
+                        conn.commit()
+                    
+                    return {
+                        'success': True,
+                        'message': 'Login successful!',
+                        'user': {
+                            'id': user_id,
+                            'email': email,
+                            'access_token': f'token_{user_id}_{secrets.token_urlsafe(16)}'
+                        }
                     }
-                }
-            
-            user_id = str(uuid.uuid4())
-            
-            if auth_provider != 'local' and not password:
-                random_password = secrets.token_urlsafe(32)
-                password_hash = generate_password_hash(random_password)
-            else:
-                password_hash = generate_password_hash(password) if password else None
-            
-            verification_token = secrets.token_urlsafe(32) if auth_provider == 'local' else None
-            is_verified = True if auth_provider != 'local' else False
-            
-            cursor.execute('''
-                INSERT INTO users (id, email, password_hash, is_guest, auth_provider, oauth_id, name, avatar_url, verification_token, is_verified)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (user_id, email, password_hash, is_guest, auth_provider, oauth_id, name, avatar_url, verification_token, is_verified))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+                
+                user_id = str(uuid.uuid4())
+                
+                if auth_provider != 'local' and not password:
+                    random_password = secrets.token_urlsafe(32)
+                    password_hash = generate_password_hash(random_password)
+                else:
+                    password_hash = generate_password_hash(password) if password else None
+                
+                verification_token = secrets.token_urlsafe(32) if auth_provider == 'local' else None
+                is_verified = True if auth_provider != 'local' else False
+                
+                cursor.execute('''
+                    INSERT INTO users (id, email, password_hash, is_guest, auth_provider, oauth_id, name, avatar_url, verification_token, is_verified)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ''', (user_id, email, password_hash, is_guest, auth_provider, oauth_id, name, avatar_url, verification_token, is_verified))
+                
+                conn.commit()
             
             if not is_guest and auth_provider == 'local':
                 EmailService.send_verification_email(email, verification_token)
@@ -94,13 +86,9 @@ class UserService:
     @staticmethod
     def authenticate_user(email, password):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT id, email, password_hash, auth_provider, is_verified FROM users WHERE email = %s AND is_guest = FALSE', (email,))
-            user = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('SELECT id, email, password_hash, auth_provider, is_verified FROM users WHERE email = %s AND is_guest = FALSE', (email,))
+                user = cursor.fetchone()
             
             if user:
                 if user[3] != 'local':
@@ -128,18 +116,14 @@ class UserService:
     @staticmethod
     def create_guest_user(user_id):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO users (id, email, is_guest, auth_provider)
-                VALUES (%s, %s, TRUE, 'guest')
-                ON CONFLICT (id) DO NOTHING
-            ''', (user_id, f'guest_{user_id}@temp.com'))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    INSERT INTO users (id, email, is_guest, auth_provider)
+                    VALUES (%s, %s, TRUE, 'guest')
+                    ON CONFLICT (id) DO NOTHING
+                ''', (user_id, f'guest_{user_id}@temp.com'))
+                
+                conn.commit()
             
             return {'success': True, 'user_id': user_id}
             
@@ -150,20 +134,14 @@ class UserService:
     @staticmethod
     def verify_email(token):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('UPDATE users SET is_verified = TRUE, verification_token = NULL WHERE verification_token = %s', (token,))
-            
-            if cursor.rowcount > 0:
-                conn.commit()
-                cursor.close()
-                conn.close()
-                return {'success': True, 'message': 'Email verified successfully!'}
-            else:
-                cursor.close()
-                conn.close()
-                return {'success': False, 'message': 'Invalid or expired token'}
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('UPDATE users SET is_verified = TRUE, verification_token = NULL WHERE verification_token = %s', (token,))
+                
+                if cursor.rowcount > 0:
+                    conn.commit()
+                    return {'success': True, 'message': 'Email verified successfully!'}
+                else:
+                    return {'success': False, 'message': 'Invalid or expired token'}
         except Exception as e:
             print(f"Verify email error: {e}")
             return {'success': False, 'message': 'Verification failed'}
@@ -171,28 +149,24 @@ class UserService:
     @staticmethod
     def request_password_reset(email):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT id, is_verified FROM users WHERE email = %s AND is_guest = FALSE', (email,))
-            user = cursor.fetchone()
-            
-            if user:
-                if not user[1]:
-                    cursor.close()
-                    conn.close()
-                    return {'success': False, 'message': 'Account not verified. Please check your email and verify first.'}
-                
-                import random
-                otp = ''.join([str(random.randint(0, 9)) for _ in range(6)])
-                otp_expiry = datetime.now() + timedelta(minutes=10)
+            otp = None
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('SELECT id, is_verified FROM users WHERE email = %s AND is_guest = FALSE', (email,))
+                user = cursor.fetchone()
                 
-                cursor.execute('UPDATE users SET reset_otp = %s, otp_expiry = %s WHERE email = %s', (otp, otp_expiry, email))
-                conn.commit()
+                if user:
+                    if not user[1]:
+                        return {'success': False, 'message': 'Account not verified. Please check your email and verify first.'}
+                    
+                    import random
+                    otp = ''.join([str(random.randint(0, 9)) for _ in range(6)])
+                    otp_expiry = datetime.now() + timedelta(minutes=10)
+                    
+                    cursor.execute('UPDATE users SET reset_otp = %s, otp_expiry = %s WHERE email = %s', (otp, otp_expiry, email))
+                    conn.commit()
+
+            if otp:
                 EmailService.send_password_reset_otp(email, otp)
-            
-            cursor.close()
-            conn.close()
             return {'success': True, 'message': 'If email exists, OTP sent to your email'}
         except Exception as e:
             print(f"Password reset request error: {e}")
@@ -201,32 +175,22 @@ class UserService:
     @staticmethod
     def verify_otp(email, otp):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT reset_otp, otp_expiry FROM users WHERE email = %s', (email,))
-            user = cursor.fetchone()
-            
-            if not user or not user[0]:
-                cursor.close()
-                conn.close()
-                return {'success': False, 'message': 'Invalid OTP'}
-            
-            if datetime.now() > user[1]:
-                cursor.close()
-                conn.close()
-                return {'success': False, 'message': 'OTP expired. Please request a new one'}
-            
-            if user[0] == otp:
-                cursor.execute('UPDATE users SET reset_otp = NULL WHERE email = %s', (email,))
-                conn.commit()
-                cursor.close()
-                conn.close()
-                return {'success': True, 'message': 'OTP verified!', 'email': email}
-            else:
-                cursor.close()
-                conn.close()
-                return {'success': False, 'message': 'Invalid OTP'}
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('SELECT reset_otp, otp_expiry FROM users WHERE email = %s', (email,))
+                user = cursor.fetchone()
+                
+                if not user or not user[0]:
+                    return {'success': False, 'message': 'Invalid OTP'}
+                
+                if datetime.now() > user[1]:
+                    return {'success': False, 'message': 'OTP expired. Please request a new one'}
+                
+                if user[0] == otp:
+                    cursor.execute('UPDATE users SET reset_otp = NULL WHERE email = %s', (email,))
+                    conn.commit()
+                    return {'success': True, 'message': 'OTP verified!', 'email': email}
+                else:
+                    return {'success': False, 'message': 'Invalid OTP'}
         except Exception as e:
             print(f"OTP verification error: {e}")
             return {'success': False, 'message': 'Verification failed'}
@@ -234,21 +198,16 @@ class UserService:
     @staticmethod
     def reset_password(email, new_password):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
             password_hash = generate_password_hash(new_password)
-            cursor.execute('UPDATE users SET password_hash = %s, otp_expiry = NULL, auth_provider = %s WHERE email = %s', (password_hash, 'local', email))
             
-            if cursor.rowcount > 0:
-                conn.commit()
-                cursor.close()
-                conn.close()
-                return {'success': True, 'message': 'Password reset successfully! You can now login with your password.'}
-            else:
-                cursor.close()
-                conn.close()
-                return {'success': False, 'message': 'Failed to reset password'}
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('UPDATE users SET password_hash = %s, otp_expiry = NULL, auth_provider = %s WHERE email = %s', (password_hash, 'local', email))
+                
+                if cursor.rowcount > 0:
+                    conn.commit()
+                    return {'success': True, 'message': 'Password reset successfully! You can now login with your password.'}
+                else:
+                    return {'success': False, 'message': 'Failed to reset password'}
         except Exception as e:
             print(f"Password reset error: {e}")
             return {'success': False, 'message': 'Reset failed'}
@@ -256,32 +215,22 @@ class UserService:
     @staticmethod
     def resend_verification(email):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT id, is_verified, auth_provider FROM users WHERE email = %s', (email,))
-            user = cursor.fetchone()
-            
-            if not user:
-                cursor.close()
-                conn.close()
-                return {'success': True, 'message': 'If email exists, verification sent'}
-            
-            if user[2] != 'local':
-                cursor.close()
-                conn.close()
-                return {'success': False, 'message': 'OAuth accounts do not need verification'}
-            
-            if user[1]:
-                cursor.close()
-                conn.close()
-                return {'success': False, 'message': 'Email already verified'}
-            
-            verification_token = secrets.token_urlsafe(32)
-            cursor.execute('UPDATE users SET verification_token = %s WHERE email = %s', (verification_token, email))
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('SELECT id, is_verified, auth_provider FROM users WHERE email = %s', (email,))
+                user = cursor.fetchone()
+                
+                if not user:
+                    return {'success': True, 'message': 'If email exists, verification sent'}
+                
+                if user[2] != 'local':
+                    return {'success': False, 'message': 'OAuth accounts do not need verification'}
+                
+                if user[1]:
+                    return {'success': False, 'message': 'Email already verified'}
+                
+                verification_token = secrets.token_urlsafe(32)
+                cursor.execute('UPDATE users SET verification_token = %s WHERE email = %s', (verification_token, email))
+                conn.commit()
             
             EmailService.send_verification_email(email, verification_token)
             return {'success': True, 'message': 'Verification email sent!'}
@@ -292,26 +241,22 @@ class UserService:
     @staticmethod
     def update_profile(user_id, profile_data):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE users 
-                SET name = %s, phone = %s, user_role = %s, experience = %s, location = %s, bio = %s
-                WHERE id = %s
-            ''', (
-                profile_data.get('name'),
-                profile_data.get('phone'),
-                profile_data.get('user_role'),
-                profile_data.get('experience'),
-                profile_data.get('location'),
-                profile_data.get('bio'),
-                user_id
-            ))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE users
+                    SET name = %s, phone = %s, user_role = %s, experience = %s, location = %s, bio = %s
+                    WHERE id = %s
+                ''', (
+                    profile_data.get('name'),
+                    profile_data.get('phone'),
+                    profile_data.get('user_role'),
+                    profile_data.get('experience'),
+                    profile_data.get('location'),
+                    profile_data.get('bio'),
+                    user_id
+                ))
+                
+                conn.commit()
             
             return {'success': True, 'message': 'Profile updated successfully!'}
         except Exception as e:
@@ -322,14 +267,9 @@ class UserService:
     @staticmethod
     def get_profile(user_id):
         try:
-            conn = DatabaseManager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT name, phone, user_role, experience, location, bio FROM users WHERE id = %s', (user_id,))
-            profile = cursor.fetchone()
-            
-            cursor.close()
-            conn.close()
+            with DatabaseManager.connection() as conn, conn.cursor() as cursor:
+                cursor.execute('SELECT name, phone, user_role, experience, location, bio FROM users WHERE id = %s', (user_id,))
+                profile = cursor.fetchone()
             
             if profile:
                 return {
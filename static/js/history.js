@@ -1,3 +1,7 @@
+let nextCursor = null;
+let shownCount = 0;
+let totalInterviews = 0;
+
 document.addEventListener('DOMContentLoaded', async function() {
     const user = Auth.getCurrentUser();
     if (!user) {
@@ -6,12 +10,16 @@ document.addEventListener('DOMContentLoaded', async function() {
     }
 
     try {
-        const response = await fetch(`/api/profile/history?user_id=${user.id}`);
-        const data = await response.json();
+        const data = await fetchHistoryPage(user.id);
 
         if (data.success && data.history.length > 0) {
+            totalInterviews = data.summary ? data.summary.interviews : data.history.length;
+            if (data.summary) {
+                updateStats(data.summary);
+            }
+            document.getElementById('timeline').innerHTML = '';
             displayTimeline(data.history);
-            updateStats(data.history);
+            updateLoadMore(user.id, data.next_cursor);
         } else {
             showEmptyState();
         }
@@ -21,24 +29,69 @@ document.addEventListener('DOMContentLoaded', async function() {
     }
 });
 
-function updateStats(history) {
-    document.getElementById('totalCount').textContent = history.length;
-    
-    const scores = history.map(h => h.score);
-    const avgScore = Math.round(scores.reduce((a, b) => a + b, 0) / scores.length);
-    const bestScore = Math.max(...scores);
-    
-    document.getElementById('avgScore').textContent = avgScore;
-    document.getElementById('bestScore').textContent = bestScore;
+async function fetchHistoryPage(userId, cursor) {
+    const cursorQuery = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+    const response = await fetch(`/api/profile/history?user_id=${encodeURIComponent(userId)}${cursorQuery}`);
+    return response.json();
+}
+
+async function loadMoreHistory(userId) {
+    const button = document.getElementById('loadMoreHistory');
+    button.disabled = true;
+    button.textContent = 'Loading...';
+
+    try {
+        const data = await fetchHistoryPage(userId, nextCursor);
+        if (data.success) {
+            displayTimeline(data.history);
+            updateLoadMore(userId, data.next_cursor);
+            return;
+        }
+        throw new Error(data.message || 'Failed to load history');
+    } catch (error) {
+        console.error('Error loading more history:', error);
+        Toast.error('Failed to load more interviews');
+        button.disabled = false;
+        button.textContent = 'Load More';
+    }
+}
+
+function updateLoadMore(userId, cursor) {
+    nextCursor = cursor;
+    let button = document.getElementById('loadMoreHistory');
+
+    if (!cursor) {
+        if (button) button.remove();
+        return;
+    }
+
+    if (!button) {
+        button = document.createElement('button');
+        button.id = 'loadMoreHistory';
+        button.className = 'btn btn-primary';
+        button.style.cssText = 'display: block; margin: 2rem auto 0; padding: 0.9rem 2rem;';
+        button.addEventListener('click', () => loadMoreHistory(userId));
+        document.getElementById('timeline').after(button);
+    }
+    button.disabled = false;
+    button.textContent = 'Load More';
+}
+
+function updateStats(summary) {
+    document.getElementById('totalCount').textContent = summary.interviews;
+    document.getElementById('avgScore').textContent = Math.round(summary.average_score);
+    document.getElementById('bestScore').textContent = summary.best_score;
     
-    const improvement = history.length > 1 ? 
-        Math.round(((history[0].score - history[history.length - 1].score) / history[history.length - 1].score) * 100) : 0;
+    const improvement = summary.interviews > 1 && summary.first_score ?
+        Math.round(((summary.latest_score - summary.first_score) / summary.first_score) * 100) : 0;
     document.getElementById('improvement').textContent = (improvement > 0 ? '+' : '') + improvement + '%';
 }
 
 function displayTimeline(history) {
     const container = document.getElementById('timeline');
-    container.innerHTML = history.map((item, index) => {
+    const offset = shownCount;
+    shownCount += history.length;
+    container.insertAdjacentHTML('beforeend', history.map((item, index) => {
         const date = new Date(item.created_at);
         const dateStr = date.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
         const timeStr = date.toLocaleTimeString('en-US', { hour: '2-digit', minute: '2-digit' });
@@ -60,11 +113,12 @@ function displayTimeline(history) {
                     <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem; flex-wrap: wrap; gap: 1rem;">
                         <div>
                             <h3 style="font-size: 1.3rem; font-weight: 600; color: #1a1a1a; margin-bottom: 0.5rem;">
-                                Interview Session #${history.length - index}
+                                Interview Session #${totalInterviews - offset - index}
                             </h3>
                             <div style="display: flex; gap: 1rem; color: #6b7280; font-size: 0.9rem;">
                                 <span>📅 ${dateStr}</span>
                                 <span>🕐 ${timeStr}</span>
+                                ${item.role ? `<span>💼 ${escapeHtml(item.role)}${item.difficulty ? ' · ' + escapeHtml(item.difficulty) : ''}</span>` : ''}
                             </div>
                         </div>
                         <div style="text-align: right;">
@@ -90,7 +144,14 @@ function displayTimeline(history) {
                 </div>
             </div>
         `;
-    }).join('');
+    }).join(''));
+}
+
+// Role and difficulty are free text from the submitting client
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = String(text);
+    return div.innerHTML;
 }
 
 function formatFeedback(feedback) {
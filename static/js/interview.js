@@ -4,6 +4,12 @@ let answers = [];
 let role = '';
 let difficulty = '';
 let startTime = Date.now();
+let questionsLoading = false;
+// Written answers are evaluated as they are committed and collected under this id at submit
+const sessionId = 'session_' + Date.now() + '_' + Math.random().toString(36).substr(2, 9);
+let evaluatedTexts = {};
+// In-flight /api/evaluate-answer requests, awaited before the final submit
+let evaluationRequests = {};
 
 // Load interview data
 document.addEventListener('DOMContentLoaded', async () => {
@@ -20,9 +26,60 @@ document.addEventListener('DOMContentLoaded', async () => {
     await loadQuestions();
 });
 
-async function loadQuestions() {
+// Stream questions in as they are generated so the first one shows right away
+function loadQuestions() {
+    if (!window.EventSource) {
+        return loadQuestionSet();
+    }
+    
+    questionsLoading = true;
+    const source = new EventSource(`/api/questions/stream?role=${encodeURIComponent(role)}&difficulty=${encodeURIComponent(difficulty)}${userQuery()}`);
+    
+    source.addEventListener('question', (event) => {
+        const { question } = JSON.parse(event.data);
+        questions.push(question);
+        answers.push({
+            type: question.type,
+            text: '',
+            selected: null,
+            correct: false
+        });
+        
+        if (questions.length === 1) {
+            renderQuestion();
+        } else {
+            updateProgress();
+            updateIndicators();
+        }
+    });
+    
+    source.addEventListener('done', () => {
+        source.close();
+        questionsLoading = false;
+        Toast.success('AI questions generated successfully!');
+        updateProgress();
+    });
+    
+    source.addEventListener('error', () => {
+        source.close();
+        questionsLoading = false;
+        if (questions.length === 0) {
+            loadQuestionSet();
+        } else {
+            updateProgress();
+        }
+    });
+}
+
+// Lets the server avoid repeating fallback questions this user has already seen
+function userQuery() {
+    const user = JSON.parse(localStorage.getItem('user') || 'null');
+    return user?.id ? `&user_id=${encodeURIComponent(user.id)}` : '';
+}
+
+async function loadQuestionSet() {
     try {
-        const response = await fetch(`/api/questions?role=${encodeURIComponent(role)}&difficulty=${encodeURIComponent(difficulty)}&use_ai=true`);
+        const response = await fetch(`/api/questions?role=${encodeURIComponent(role)}&difficulty=${encodeURIComponent(difficulty)}&use_ai=true${userQuery()}`);
         const data = await response.json();
         
         if (data.success) {
@@ -58,14 +115,8 @@ function renderQuestion() {
     const question = questions[currentQuestion];
     const answerSection = document.getElementById('answerSection');
     
-    // Update question number and text
-    document.getElementById('questionNumber').textContent = `Question ${currentQuestion + 1} of ${questions.length}`;
     document.getElementById('questionText').textContent = question.question;
-    
-    // Update progress bar
-    const progress = ((currentQuestion + 1) / questions.length) * 100;
-    document.getElementById('progressFill').style.width = progress + '%';
-    document.getElementById('progressText').textContent = Math.round(progress) + '%';
+    updateProgress();
     
     // Render answer input based on type
     if (question.type === 'multiple-choice') {
@@ -148,11 +199,22 @@ function renderQuestion() {
         updateWordCount();
     }
     
+    updateIndicators();
+}
+
+function updateProgress() {
+    // Update question number
+    document.getElementById('questionNumber').textContent = `Question ${currentQuestion + 1} of ${questions.length}`;
+    
+    // Update progress bar
+    const progress = ((currentQuestion + 1) / questions.length) * 100;
+    document.getElementById('progressFill').style.width = progress + '%';
+    document.getElementById('progressText').textContent = Math.round(progress) + '%';
+    
     // Update navigation buttons
+    const isLast = currentQuestion === questions.length - 1 && !questionsLoading;
     document.getElementById('prevBtn').style.display = currentQuestion > 0 ? 'block' : 'none';
-    document.getElementById('nextBtn').textContent = currentQuestion === questions.length - 1 ? 'Submit Interview' : 'Next →';
-    
-    updateIndicators();
+    document.getElementById('nextBtn').textContent = isLast ? 'Submit Interview' : 'Next →';
 }
 
 function selectOption(index) {
@@ -233,14 +295,52 @@ document.getElementById('nextBtn').addEventListener('click', async () => {
         return;
     }
     
+    if (answer.type === 'short-answer') {
+        evaluateAnswer(currentQuestion);
+    }
+    
     if (currentQuestion < questions.length - 1) {
         currentQuestion++;
         renderQuestion();
+    } else if (questionsLoading) {
+        Toast.info('The next question is still being generated...');
     } else {
         await submitInterview();
     }
 });
 
+// Start scoring a committed written answer in the background; unchanged answers are not re-sent
+function evaluateAnswer(index) {
+    const user = JSON.parse(localStorage.getItem('user') || 'null');
+    const text = answers[index].text.trim();
+    if (!user?.id || evaluatedTexts[index] === text) {
+        return;
+    }
+    evaluatedTexts[index] = text;
+    
+    const request = fetch('/api/evaluate-answer', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            session_id: sessionId,
+            user_id: user.id,
+            index: index,
+            question: questions[index],
+            answer: answers[index],
+            use_ai: true
+        })
+    }).catch(error => {
+        // The final submit scores the answer itself
+        delete evaluatedTexts[index];
+        console.error('Evaluate answer error:', error);
+    }).finally(() => {
+        if (evaluationRequests[index] === request) {
+            delete evaluationRequests[index];
+        }
+    });
+    evaluationRequests[index] = request;
+}
+
 async function submitInterview() {
     // Check if all questions are answered
     const unanswered = answers.findIndex((a, i) => {
@@ -271,21 +371,28 @@ async function submitInterview() {
         
         const timeTaken = Math.floor((Date.now() - startTime) / 1000);
         
-        const response = await fetch('/api/submit-answers', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                answers: answers,
-                questions: questions,
-                role: role,
-                difficulty: difficulty,
-                user_id: userId,
-                time_taken: timeTaken,
-                use_ai: true
-            })
-        });
+        // Let the server register answers it is already scoring, so none is picked up twice
+        await Promise.all(Object.values(evaluationRequests));
         
-        const data = await response.json();
+        let evaluated = 0;
+        const data = await streamSubmission('/api/submit-answers/stream', {
+            answers: answers,
+            questions: questions,
+            role: role,
+            difficulty: difficulty,
+            user_id: userId,
+            time_taken: timeTaken,
+            use_ai: true,
+            session_id: sessionId
+        }, {
+            answer: () => {
+                evaluated++;
+                document.getElementById('nextBtn').textContent = `Evaluating... (${evaluated}/${answers.length})`;
+            },
+            report: () => {
+                document.getElementById('nextBtn').textContent = 'Saving results...';
+            }
+        });
         
         if (data.success) {
             Toast.success('Interview completed! Redirecting to results...');
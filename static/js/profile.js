@@ -21,10 +21,10 @@ document.addEventListener('DOMContentLoaded', function() {
 
 async function loadProfileData(userId) {
     try {
-        const historyResponse = await fetch(`/api/profile/history?user_id=${userId}`);
-        const historyData = await historyResponse.json();
-        if (historyData.success) {
-            document.getElementById('totalInterviews').textContent = historyData.total_interviews;
+        const summaryResponse = await fetch(`/api/profile/summary?user_id=${encodeURIComponent(userId)}`);
+        const summaryData = await summaryResponse.json();
+        if (summaryData.success) {
+            document.getElementById('totalInterviews').textContent = summaryData.summary.interviews;
         }
         
         const profileResponse = await fetch('/api/auth/profile');
@@ -0,0 +1,46 @@
+// Submit an interview to a streaming endpoint and dispatch its Server-Sent Events.
+// Calls handlers.answer / handlers.report as they arrive and resolves with the result event.
+async function streamSubmission(url, payload, handlers = {}) {
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload)
+    });
+    
+    if (!response.ok || !response.body) {
+        throw new Error('Submission failed');
+    }
+    
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            let event = 'message';
+            let data = '';
+            block.split('\n').forEach(line => {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            });
+            
+            // Comment-only blocks are keep-alives
+            if (!data) continue;
+            
+            const parsed = JSON.parse(data);
+            if (event === 'result') return parsed;
+            if (event === 'error') throw new Error(parsed.message || 'Submission failed');
+            if (handlers[event]) handlers[event](parsed);
+        }
+    }
+    
+    throw new Error('Submission stream ended early');
+}
@@ -46,7 +46,9 @@ document.addEventListener('DOMContentLoaded', async () => {
 
 async function loadQuestions() {
     try {
-        const response = await fetch(`/api/questions?role=${encodeURIComponent(role)}&difficulty=${encodeURIComponent(difficulty)}&use_ai=true`);
+        const user = JSON.parse(localStorage.getItem('user') || 'null');
+        const userQuery = user?.id ? `&user_id=${encodeURIComponent(user.id)}` : '';
+        const response = await fetch(`/api/questions?role=${encodeURIComponent(role)}&difficulty=${encodeURIComponent(difficulty)}&use_ai=true${userQuery}`);
         const data = await response.json();
         
         if (data.success) {
@@ -215,22 +217,25 @@ async function submitInterview() {
         
         const timeTaken = Math.floor((Date.now() - startTime) / 1000);
         
-        const response = await fetch('/api/submit-voice-interview', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                answers: answers,
-                questions: questions,
-                role: role,
-                difficulty: difficulty,
-                user_id: userId,
-                time_taken: timeTaken,
-                interview_type: 'voice'
-            })
+        let evaluated = 0;
+        const data = await streamSubmission('/api/submit-voice-interview/stream', {
+            answers: answers,
+            questions: questions,
+            role: role,
+            difficulty: difficulty,
+            user_id: userId,
+            time_taken: timeTaken,
+            interview_type: 'voice'
+        }, {
+            answer: () => {
+                evaluated++;
+                document.getElementById('nextBtn').textContent = `Evaluating... (${evaluated}/${answers.length})`;
+            },
+            report: () => {
+                document.getElementById('nextBtn').textContent = 'Saving results...';
+            }
         });
         
-        const data = await response.json();
-        
         if (data.success) {
             Toast.success('Voice interview completed! Redirecting to results...');
             sessionStorage.setItem('lastResultId', data.id);
@@ -0,0 +1,81 @@
+import os
+import uuid
+import threading
+import unittest
+import psycopg2
+from models.database import DatabaseManager
+from models.migrations import Migrations
+
+class ConcurrentMigrationTest(unittest.TestCase):
+    """
+    Two workers migrating a fresh database at the same time, as a
+    multi-worker deploy does at startup. Needs a PostgreSQL server reachable
+    with the DB_* settings and allowed to create databases; skipped otherwise
+    """
+
+    def setUp(self):
+        try:
+            admin = DatabaseManager.get_connection()
+        except psycopg2.OperationalError as e:
+            self.skipTest(f'PostgreSQL not available: {e}')
+        admin.autocommit = True
+        self.admin = admin
+        self.database = f'interviewace_migrate_{uuid.uuid4().hex[:12]}'
+        with admin.cursor() as cursor:
+            cursor.execute(f'CREATE DATABASE {self.database}')
+
+    def tearDown(self):
+        with self.admin.cursor() as cursor:
+            cursor.execute(f'DROP DATABASE IF EXISTS {self.database}')
+        self.admin.close()
+
+    def connect(self):
+        return psycopg2.connect(
+            host=os.getenv('DB_HOST', 'localhost'),
+            port=os.getenv('DB_PORT', '5432'),
+            database=self.database,
+            user=os.getenv('DB_USER', 'postgres'),
+            password=os.getenv('DB_PASSWORD', '3322')
+        )
+
+    def test_concurrent_migrate(self):
+        start = threading.Barrier(2)
+        applied, errors = [], []
+
+        def worker():
+            conn = self.connect()
+            try:
+                start.wait()
+                applied.append(Migrations.migrate(conn))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                conn.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=120)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads), 'migrate() did not finish')
+        self.assertEqual(errors, [])
+        # Every migration ran exactly once, in one worker or split between them
+        versions = sorted(version for run in applied for version in run)
+        self.assertEqual(versions, [migration['version'] for migration in Migrations.MIGRATIONS])
+
+        conn = self.connect()
+        try:
+            with conn.cursor() as cursor:
+                self.assertEqual(Migrations.current_version(cursor), Migrations.latest_version())
+                cursor.execute('''
+                    SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE NOT i.indisvalid
+                ''')
+                self.assertEqual(cursor.fetchall(), [])
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
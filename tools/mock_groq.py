@@ -0,0 +1,312 @@
+"""
+Local stand-in for the Groq / OpenAI chat-completions API.
+
+Serves synthetic completions shaped like the ones AIService asks for
+(question sets, single and batched evaluations, reports), with injectable
+latency, 429s, 5xx errors and malformed JSON. It can also record real
+upstream responses to cassette files and replay them deterministically.
+
+    python -m tools.mock_groq --port 8090 --latency lognormal:-1.2,0.5 --rate-429 0.05
+    python -m tools.mock_groq --mode record --upstream https://api.groq.com/openai/v1/chat/completions
+    python -m tools.mock_groq --mode replay --cassettes cassettes/
+
+Point the app at it with GROQ_API_URL=http://localhost:8090/openai/v1/chat/completions
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+import requests
+from flask import Flask, request, jsonify, Response
+
+
+class LatencyModel:
+    """
+    Response delay in seconds, parsed from a spec such as 'fixed:0.3',
+    'uniform:0.1,0.8', 'normal:0.5,0.1' or 'lognormal:-1.2,0.5'
+    """
+
+    def __init__(self, spec, rng):
+        kind, _, args = spec.partition(':')
+        self.kind = kind
+        self.args = [float(arg) for arg in args.split(',') if arg]
+        self.rng = rng
+        if kind not in ('none', 'fixed', 'uniform', 'normal', 'lognormal'):
+            raise ValueError(f'Unknown latency distribution: {spec}')
+
+    def sample(self):
+        if self.kind == 'none':
+            return 0.0
+        if self.kind == 'fixed':
+            return self.args[0]
+        if self.kind == 'uniform':
+            return self.rng.uniform(self.args[0], self.args[1])
+        if self.kind == 'normal':
+            return max(0.0, self.rng.gauss(self.args[0], self.args[1]))
+        return self.rng.lognormvariate(self.args[0], self.args[1])
+
+
+class CassetteStore:
+    """One JSON file per recorded request, named by the request's hash"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(payload):
+        relevant = {k: payload.get(k) for k in ('model', 'messages', 'temperature', 'max_tokens', 'stream')}
+        return hashlib.sha256(json.dumps(relevant, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def load(self, key):
+        path = os.path.join(self.directory, f'{key}.json')
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def save(self, key, payload, status, content_type, body):
+        path = os.path.join(self.directory, f'{key}.json')
+        with open(path, 'w') as f:
+            json.dump({
+                'request': payload,
+                'status': status,
+                'content_type': content_type,
+                'body': body
+            }, f, indent=2)
+
+
+class SyntheticResponder:
+    """Builds deterministic completions for the prompts AIService sends"""
+
+    ROLE_TOPICS = ['caching', 'indexing', 'concurrency', 'testing', 'monitoring',
+                   'scaling', 'security', 'data modeling', 'APIs', 'debugging']
+
+    def content_for(self, payload):
+        messages = payload.get('messages', [])
+        system = messages[0]['content'] if messages else ''
+        prompt = messages[-1]['content'] if messages else ''
+
+        if 'technical interviewer' in system:
+            return self._questions(prompt)
+        if 'career advisor' in system:
+            return self._report()
+        if prompt.startswith('Evaluate each of these'):
+            return self._batch_evaluation(prompt)
+        return self._evaluation(prompt)
+
+    def _questions(self, prompt):
+        seed = int(hashlib.sha256(prompt.encode('utf-8')).hexdigest(), 16)
+        questions = []
+        for i in range(3):
+            questions.append({
+                'question': f'Which statement about {self.ROLE_TOPICS[(seed + i) % 10]} is correct?',
+                'type': 'multiple-choice',
+                'options': ['Option A', 'Option B', 'Option C', 'Option D'],
+                'correctAnswer': (seed >> i) % 4
+            })
+        for i in range(7):
+            questions.append({
+                'question': f'Explain how you would approach {self.ROLE_TOPICS[(seed + 3 + i) % 10]} in a production system.',
+                'type': 'short-answer'
+            })
+        return '```json\n' + json.dumps(questions, indent=2) + '\n```'
+
+    @staticmethod
+    def _score(answer):
+        words = len(answer.split())
+        return min(20, 4 + words // 5)
+
+    def _evaluation(self, prompt):
+        answer = prompt.split('Answer:', 1)[-1].split('Evaluation criteria:', 1)[0].strip()
+        return json.dumps({'score': self._score(answer), 'feedback': 'Synthetic evaluation'})
+
+    def _batch_evaluation(self, prompt):
+        answers = re.findall(
+            r'^Answer (\d+)\nQuestion: .*?\nAnswer: (.*?)(?=\n\nAnswer \d+\n|\n\nEvaluation criteria)',
+            prompt, re.MULTILINE | re.DOTALL
+        )
+        return json.dumps([
+            {'answer': int(n), 'score': self._score(answer), 'feedback': 'Synthetic evaluation'}
+            for n, answer in answers
+        ])
+
+    @staticmethod
+    def _report():
+        return json.dumps({
+            'summary': 'Synthetic report summary.',
+            'strengths': ['Strength 1', 'Strength 2', 'Strength 3'],
+            'improvements': ['Area 1', 'Area 2', 'Area 3'],
+            'recommendations': ['Rec 1', 'Rec 2', 'Rec 3']
+        })
+
+
+def corrupt(content, rng):
+    """Malformed-JSON injection: truncate the completion or break one item"""
+    if rng.random() < 0.5 or '{' not in content:
+        return content[:max(1, len(content) * 2 // 3)]
+    position = rng.choice([i for i, char in enumerate(content) if char == '{'])
+    return content[:position + 1] + '"broken": ,' + content[position + 1:]
+
+
+def completion_body(model, content):
+    return {
+        'id': f'chatcmpl-mock-{random.getrandbits(32):08x}',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': model,
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': 0, 'completion_tokens': len(content) // 4, 'total_tokens': len(content) // 4}
+    }
+
+
+def stream_body(model, content, chunk_chars):
+    events = []
+    for i in range(0, len(content), chunk_chars):
+        chunk = {
+            'object': 'chat.completion.chunk',
+            'model': model,
+            'choices': [{'index': 0, 'delta': {'content': content[i:i + chunk_chars]}, 'finish_reason': None}]
+        }
+        events.append(f'data: {json.dumps(chunk)}\n\n')
+    events.append('data: [DONE]\n\n')
+    return events
+
+
+def create_app(options):
+    """Build the mock server. options is the parsed argparse namespace (see parse_args)"""
+    app = Flask(__name__)
+    rng = random.Random(options.seed)
+    rng_lock = threading.Lock()
+    latency = LatencyModel(options.latency, rng)
+    responder = SyntheticResponder()
+    cassettes = CassetteStore(options.cassettes) if options.mode in ('record', 'replay') else None
+    counters = {'requests': 0, 'injected_429': 0, 'injected_5xx': 0, 'malformed': 0,
+                'replayed': 0, 'recorded': 0, 'replay_misses': 0}
+    counters_lock = threading.Lock()
+
+    def count(name):
+        with counters_lock:
+            counters[name] += 1
+
+    def roll():
+        with rng_lock:
+            return rng.random(), latency.sample()
+
+    @app.route('/openai/v1/models')
+    @app.route('/v1/models')
+    def models():
+        return jsonify({'object': 'list', 'data': [{'id': options.model, 'object': 'model'}]})
+
+    @app.route('/__mock/stats')
+    def stats():
+        with counters_lock:
+            return jsonify(dict(counters))
+
+    @app.route('/openai/v1/chat/completions', methods=['POST'])
+    @app.route('/v1/chat/completions', methods=['POST'])
+    def chat_completions():
+        payload = request.get_json()
+        count('requests')
+        chance, delay = roll()
+        stream = bool(payload.get('stream'))
+
+        if options.mode == 'record':
+            return record(payload)
+
+        time.sleep(delay)
+
+        if chance < options.rate_429:
+            count('injected_429')
+            response = jsonify({'error': {'message': 'Rate limit reached', 'type': 'requests'}})
+            response.status_code = 429
+            response.headers['Retry-After'] = str(options.retry_after)
+            return response
+        if chance < options.rate_429 + options.rate_5xx:
+            count('injected_5xx')
+            return jsonify({'error': {'message': 'Injected upstream failure'}}), [500, 502, 503][int(chance * 1000) % 3]
+
+        if options.mode == 'replay':
+            cassette = cassettes.load(CassetteStore.key(payload))
+            if cassette is not None:
+                count('replayed')
+                return replay(cassette, stream)
+            count('replay_misses')
+            if options.replay_miss == 'error':
+                return jsonify({'error': {'message': 'No cassette recorded for this request'}}), 404
+
+        content = responder.content_for(payload)
+        if chance > 1 - options.malformed_rate:
+            count('malformed')
+            with rng_lock:
+                content = corrupt(content, rng)
+
+        model = payload.get('model', options.model)
+        if stream:
+            return Response(paced(stream_body(model, content, options.chunk_chars)), mimetype='text/event-stream')
+        return jsonify(completion_body(model, content))
+
+    def paced(events):
+        for event in events:
+            if options.chunk_delay:
+                time.sleep(options.chunk_delay)
+            yield event
+
+    def record(payload):
+        upstream = requests.post(
+            options.upstream,
+            headers={'Authorization': f'Bearer {os.getenv("GROQ_API_KEY", "")}', 'Content-Type': 'application/json'},
+            json=payload,
+            timeout=60
+        )
+        content_type = upstream.headers.get('Content-Type', 'application/json')
+        cassettes.save(CassetteStore.key(payload), payload, upstream.status_code, content_type, upstream.text)
+        count('recorded')
+        return Response(upstream.text, status=upstream.status_code, content_type=content_type)
+
+    def replay(cassette, stream):
+        if stream and cassette['content_type'].startswith('text/event-stream'):
+            events = [block + '\n\n' for block in cassette['body'].split('\n\n') if block.strip()]
+            return Response(paced(events), status=cassette['status'], mimetype='text/event-stream')
+        return Response(cassette['body'], status=cassette['status'], content_type=cassette['content_type'])
+
+    return app
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Local Groq-compatible chat-completions mock')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--mode', choices=['synthetic', 'record', 'replay'], default='synthetic')
+    parser.add_argument('--upstream', default='https://api.groq.com/openai/v1/chat/completions',
+                        help='Real API to proxy to in record mode (uses GROQ_API_KEY)')
+    parser.add_argument('--cassettes', default='cassettes', help='Cassette directory for record/replay')
+    parser.add_argument('--replay-miss', choices=['synthetic', 'error'], default='synthetic',
+                        help='What to serve when replay has no cassette for a request')
+    parser.add_argument('--model', default='llama-3.1-70b-versatile')
+    parser.add_argument('--latency', default='none',
+                        help="none, fixed:S, uniform:LO,HI, normal:MEAN,SD or lognormal:MU,SIGMA (seconds)")
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with injected 429s')
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help='Fraction of requests answered with a 5xx')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='Fraction of completions with broken JSON')
+    parser.add_argument('--chunk-chars', type=int, default=24, help='Characters per streamed delta')
+    parser.add_argument('--chunk-delay', type=float, default=0.0, help='Seconds between streamed deltas')
+    parser.add_argument('--seed', type=int, default=1234, help='Seed for latency and injection sampling')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    app = create_app(options)
+    print(f"Mock Groq API ({options.mode}) at http://{options.host}:{options.port}/openai/v1/chat/completions")
+    app.run(host=options.host, port=options.port, threaded=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())